@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+#
+# Measure the common access patterns of FormioData, compared to resolving the keys
+# with glom.
+#
+# Development tool, run from the root of the repository:
+#
+#     ./bin/benchmark_formio_data.py --keys 50 --number 200 --rounds 5
+#
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+import django
+
+import click
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR.resolve()))
+
+
+def benchmark(keys: int, number: int, rounds: int) -> None:
+    from glom import assign, glom
+
+    from openforms.formio.datastructures import FormioData
+
+    flat_keys = [f"textfield{i}" for i in range(keys)]
+    dotted_keys = [f"fieldset.textfield{i}" for i in range(keys)]
+    values = {key: f"value {key}" for key in flat_keys + dotted_keys}
+    formio_data = FormioData(values)
+    data = formio_data.data
+
+    def glom_construct():
+        result = {}
+        for key, value in values.items():
+            assign(result, key, value, missing=dict)
+
+    def glom_contains(keys):
+        for key in keys:
+            glom(data, key, default=None)
+
+    patterns = (
+        ("construction", lambda: FormioData(values), glom_construct),
+        (
+            "top-level lookups",
+            lambda: [formio_data[key] for key in flat_keys],
+            lambda: [glom(data, key) for key in flat_keys],
+        ),
+        (
+            "nested lookups",
+            lambda: [formio_data[key] for key in dotted_keys],
+            lambda: [glom(data, key) for key in dotted_keys],
+        ),
+        (
+            "containment (absent keys)",
+            lambda: [f"{key}.absent" in formio_data for key in flat_keys],
+            lambda: glom_contains(f"{key}.absent" for key in flat_keys),
+        ),
+        (
+            "bulk update",
+            lambda: FormioData().update_many(values),
+            glom_construct,
+        ),
+    )
+    for label, run, run_glom in patterns:
+        duration = min(timeit.repeat(run, number=number, repeat=rounds))
+        glom_duration = min(timeit.repeat(run_glom, number=number, repeat=rounds))
+        click.echo(
+            f"{label}: {duration / number * 1000:.3f}ms, "
+            f"with glom {glom_duration / number * 1000:.3f}ms "
+            f"({glom_duration / duration:.1f}x)"
+        )
+
+
+def main(skip_setup=False, **kwargs) -> None:
+    from openforms.setup import setup_env
+
+    if not skip_setup:
+        setup_env()
+        django.setup()
+
+    benchmark(**kwargs)
+
+
+@click.command()
+@click.option(
+    "--keys",
+    type=int,
+    default=50,
+    help="Number of top-level and of nested keys in the data.",
+)
+@click.option(
+    "--number",
+    type=int,
+    default=200,
+    help="Number of times each pattern is run per round.",
+)
+@click.option(
+    "--rounds",
+    type=int,
+    default=5,
+    help="Number of rounds, the fastest round is reported.",
+)
+def cli(keys: int, number: int, rounds: int):
+    return main(keys=keys, number=number, rounds=rounds)
+
+
+if __name__ == "__main__":
+    cli()
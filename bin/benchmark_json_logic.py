@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+#
+# Measure the evaluation time of representative JSON logic expressions, interpreted
+# and compiled.
+#
+# Development tool, run from the root of the repository:
+#
+#     ./bin/benchmark_json_logic.py --number 1000 --rounds 5
+#
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+import django
+
+import click
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR.resolve()))
+
+# representative expressions of logic rule triggers and variable actions
+EXPRESSIONS = (
+    ({"var": "a.b"}, {"a": {"b": 1}}),
+    ({"var": ["missing", "default"]}, {}),
+    ({"==": [{"var": "number"}, "1"]}, {"number": 1}),
+    ({"+": [{"var": "a"}, {"var": "b"}]}, {"a": 1, "b": 2}),
+    ({"and": [{"var": "a"}, {"!": [{"var": "b"}]}]}, {"a": True, "b": False}),
+    ({"if": [{"var": "a"}, "yes", {"var": "b"}, "maybe", "no"]}, {"b": 1}),
+    ({"in": [{"var": "a"}, ["foo", "bar"]]}, {"a": "bar"}),
+    (
+        {
+            "reduce": [
+                {"var": "items"},
+                {"+": [{"var": "accumulator"}, {"var": "current.price"}]},
+                0,
+            ]
+        },
+        {"items": [{"price": 1}, {"price": 2}]},
+    ),
+    ({"date": {"var": "date"}}, {"date": "2023-01-03"}),
+)
+
+
+def benchmark(number: int, rounds: int) -> None:
+    from json_logic import jsonLogic
+
+    from openforms.utils.json_logic.compiler import compile_expression
+
+    compiled_expressions = [
+        (compile_expression(expression), data) for expression, data in EXPRESSIONS
+    ]
+
+    def interpreted():
+        for expression, data in EXPRESSIONS:
+            jsonLogic(expression, data)
+
+    def compiled():
+        for expression, data in compiled_expressions:
+            expression(data)
+
+    num_evaluations = number * len(EXPRESSIONS)
+    for label, evaluate in (("interpreted", interpreted), ("compiled", compiled)):
+        duration = min(timeit.repeat(evaluate, number=number, repeat=rounds))
+        click.echo(
+            f"{label}: {num_evaluations} evaluations in {duration:.3f}s, "
+            f"{duration / num_evaluations * 1_000_000:.1f}µs per evaluation"
+        )
+
+
+def main(skip_setup=False, **kwargs) -> None:
+    from openforms.setup import setup_env
+
+    if not skip_setup:
+        setup_env()
+        django.setup()
+
+    benchmark(**kwargs)
+
+
+@click.command()
+@click.option(
+    "--number",
+    type=int,
+    default=1000,
+    help="Number of times all expressions are evaluated per round.",
+)
+@click.option(
+    "--rounds",
+    type=int,
+    default=5,
+    help="Number of rounds, the fastest round is reported.",
+)
+def cli(number: int, rounds: int):
+    return main(number=number, rounds=rounds)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#
+# Measure the throughput of rendering the submission report PDF for the given
+# submissions, with a fresh and with a re-used (warm) PDF renderer.
+#
+# Development tool, run from the root of the repository with the IDs of
+# (representative) submissions:
+#
+#     ./bin/benchmark_report_rendering.py 1 2 3 --rounds 5
+#
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import django
+
+import click
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR.resolve()))
+
+
+def benchmark(submission_ids: Sequence[int], rounds: int) -> bool:
+    from django.conf import settings
+
+    from openforms.submissions.models import Submission, SubmissionReport
+    from openforms.utils.pdf import PDFRenderer
+
+    submissions = Submission.objects.filter(pk__in=submission_ids)
+    # the reports are rendered, but not stored
+    reports = [SubmissionReport(submission=submission) for submission in submissions]
+    if not reports:
+        click.echo(click.style("None of the submissions exist.", fg="red"))
+        return False
+
+    def cold():
+        for report in reports:
+            report.render_pdf(renderer=PDFRenderer(max_documents=1))
+
+    warm_renderer = PDFRenderer(max_documents=0)
+    # don't count the setup of the renderer itself, like a warmed up worker
+    reports[0].render_pdf(renderer=warm_renderer)
+
+    def warm():
+        for report in reports:
+            report.render_pdf(renderer=warm_renderer)
+
+    for label, render in (("fresh renderer", cold), ("warm renderer", warm)):
+        durations = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            render()
+            durations.append(time.perf_counter() - start)
+
+        num_documents = len(reports) * rounds
+        total = sum(durations)
+        click.echo(
+            f"{label}: {num_documents} documents in {total:.2f}s, "
+            f"{num_documents / total:.2f} documents/s, "
+            f"{total / num_documents * 1000:.0f}ms per document"
+        )
+
+    if settings.PDF_RENDERER_MAX_DOCUMENTS:
+        click.echo(
+            "Note that workers recycle their renderer every "
+            f"{settings.PDF_RENDERER_MAX_DOCUMENTS} documents "
+            "(PDF_RENDERER_MAX_DOCUMENTS)."
+        )
+    return True
+
+
+def main(skip_setup=False, **kwargs) -> bool:
+    from openforms.setup import setup_env
+
+    if not skip_setup:
+        setup_env()
+        django.setup()
+
+    return benchmark(**kwargs)
+
+
+@click.command()
+@click.argument("submission_ids", nargs=-1, type=int, required=True)
+@click.option(
+    "--rounds",
+    type=int,
+    default=5,
+    help="Number of times the reports of all submissions are rendered.",
+)
+def cli(submission_ids: Sequence[int], rounds: int):
+    return main(submission_ids=submission_ids, rounds=rounds)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,173 @@
+"""
+Shared cache of the information retrieved from the appointment services.
+
+Every citizen browsing the available products, locations, dates and times results in
+calls to the appointment service. The plugins can opt in to caching these results in
+the (shared) default cache by decorating their methods with :func:`cached`:
+
+* the *catalogue* (products, locations) rarely changes and can be cached for a long
+  time, see the ``APPOINTMENTS_CATALOGUE_CACHE_TIMEOUT`` setting;
+* the *availability* (dates, times) changes when appointments are made and is cached
+  briefly, see the ``APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT`` setting.
+
+Expired entries are kept for another timeout period. During that period, the stale
+value is returned while a single caller (across all processes) refreshes it, so that
+a popular entry expiring does not result in a burst of calls to the service. If the
+refresh fails, the stale value keeps being used.
+
+Creating or deleting an appointment changes the availability, so the cached
+availability of a plugin is invalidated by the methods decorated with
+:func:`invalidates_availability`.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from functools import wraps
+from typing import Any, Callable, Literal, ParamSpec, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .base import BasePlugin, Location, Product
+
+logger = logging.getLogger(__name__)
+
+# bump when the structure of the cached values changes
+CACHE_KEY_VERSION = 1
+
+# how long a refresh of a stale value may take before another caller is allowed to try
+REFRESH_LOCK_TIMEOUT = 30  # seconds
+
+Kind = Literal["catalogue", "availability"]
+
+Param = ParamSpec("Param")
+T = TypeVar("T")
+
+
+class _KeyEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # the names of products and locations are not always known to the caller and
+        # do not affect the result
+        if isinstance(o, Product):
+            return [o.identifier, o.amount]
+        if isinstance(o, Location):
+            return o.identifier
+        return super().default(o)
+
+
+def get_timeout(kind: Kind) -> int:
+    if kind == "catalogue":
+        return settings.APPOINTMENTS_CATALOGUE_CACHE_TIMEOUT
+    return settings.APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT
+
+
+def _get_generation_key(plugin_id: str, kind: Kind) -> str:
+    return f"appointments:{plugin_id}:{kind}:v{CACHE_KEY_VERSION}:generation"
+
+
+def get_cache_key(plugin_id: str, kind: Kind, *parts: Any) -> str:
+    """
+    Build the cache key for the result of a plugin call with the given inputs.
+
+    The key includes the generation of the plugin ``kind`` cache, which is bumped by
+    :func:`invalidate` to discard all the entries at once.
+    """
+    generation = cache.get(_get_generation_key(plugin_id, kind), 0)
+    content = json.dumps(parts, cls=_KeyEncoder, sort_keys=True)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return f"appointments:{plugin_id}:{kind}:v{CACHE_KEY_VERSION}:{generation}:{digest}"
+
+
+def invalidate(plugin_id: str, kind: Kind = "availability") -> None:
+    """
+    Discard the cached results of the ``kind`` calls of a plugin.
+    """
+    key = _get_generation_key(plugin_id, kind)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # the generation does not exist yet - another process may create it in between
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_or_refresh(key: str, default: Callable[[], T], timeout: int) -> T:
+    """
+    Look up the value for ``key`` in the cache, or compute and store it.
+
+    Stale values are returned as-is if another caller is already refreshing them.
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        value, fresh_until = entry
+        if time.time() < fresh_until:
+            return value
+
+        lock_key = f"{key}:refresh"
+        if not cache.add(lock_key, True, timeout=REFRESH_LOCK_TIMEOUT):
+            return value
+        try:
+            value = default()
+        except Exception:
+            logger.warning(
+                "Refreshing the cached appointment information failed, using the "
+                "stale value.",
+                exc_info=True,
+            )
+            return value
+        finally:
+            cache.delete(lock_key)
+    else:
+        value = default()
+
+    cache.set(key, (value, time.time() + timeout), timeout=2 * timeout)
+    return value
+
+
+def cached(kind: Kind):
+    """
+    Cache the results of the decorated plugin method in the shared cache.
+
+    The method arguments must be JSON-serializable, or products and locations.
+    Exceptions are not cached, so apply this decorator *before* decorators returning
+    a default value on errors.
+    """
+
+    def decorator(func: Callable[Param, T]) -> Callable[Param, T]:
+        @wraps(func)
+        def wrapper(plugin: BasePlugin, *args, **kwargs) -> T:
+            timeout = get_timeout(kind)
+            if not timeout:
+                return func(plugin, *args, **kwargs)
+
+            key = get_cache_key(plugin.identifier, kind, func.__name__, args, kwargs)
+            return get_or_refresh(
+                key, lambda: func(plugin, *args, **kwargs), timeout=timeout
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_availability(func: Callable[Param, T]) -> Callable[Param, T]:
+    """
+    Invalidate the cached availability of the plugin after calling the decorated
+    method.
+
+    The availability is invalidated even if the call fails, since the appointment may
+    have been created or deleted anyway.
+    """
+
+    @wraps(func)
+    def wrapper(plugin: BasePlugin, *args, **kwargs) -> T:
+        try:
+            return func(plugin, *args, **kwargs)
+        finally:
+            if get_timeout("availability"):
+                invalidate(plugin.identifier, "availability")
+
+    return wrapper
@@ -28,6 +28,7 @@ from ...base import (
     Location,
     Product,
 )
+from ...cache import cached, invalidates_availability
 from ...exceptions import (
     AppointmentCreateFailed,
     AppointmentDeleteFailed,
@@ -100,6 +101,7 @@ class JccAppointment(BasePlugin[CustomerFields]):
     }
 
     @with_graceful_default(default=[])
+    @cached("catalogue")
     def get_available_products(
         self,
         current_products: list[Product] | None = None,
@@ -153,6 +155,7 @@ class JccAppointment(BasePlugin[CustomerFields]):
         return locations
 
     @with_graceful_default(default=[])
+    @cached("catalogue")
     def get_locations(
         self,
         products: list[Product] | None = None,
@@ -172,6 +175,7 @@ class JccAppointment(BasePlugin[CustomerFields]):
         ]
 
     @with_graceful_default(default=[])
+    @cached("availability")
     def get_dates(
         self,
         products: list[Product],
@@ -203,6 +207,7 @@ class JccAppointment(BasePlugin[CustomerFields]):
             return days
 
     @with_graceful_default(default=[])
+    @cached("availability")
     def get_times(
         self,
         products: list[Product],
@@ -246,6 +251,7 @@ class JccAppointment(BasePlugin[CustomerFields]):
         last_name = FIELD_TO_FORMIO_COMPONENT[CustomerFields.last_name]
         return [last_name] + [FIELD_TO_FORMIO_COMPONENT[field] for field in field_names]
 
+    @invalidates_availability
     def create_appointment(
         self,
         products: list[Product],
@@ -329,6 +335,7 @@ class JccAppointment(BasePlugin[CustomerFields]):
                 "Unexpected appointment create failure"
             ) from e
 
+    @invalidates_availability
     def delete_appointment(self, identifier: str) -> None:
         client = get_client()
         try:
@@ -27,6 +27,7 @@ from ...base import (
     Location,
     Product,
 )
+from ...cache import cached, invalidates_availability
 from ...exceptions import (
     AppointmentCreateFailed,
     AppointmentDeleteFailed,
@@ -118,6 +119,7 @@ class QmaticAppointment(BasePlugin[CustomerFields]):
         return (unique_product_ids, num_customers)
 
     @with_graceful_default(default=[])
+    @cached("catalogue")
     def get_available_products(
         self,
         current_products: list[Product] | None = None,
@@ -185,6 +187,7 @@ class QmaticAppointment(BasePlugin[CustomerFields]):
         ]
 
     @with_graceful_default(default=[])
+    @cached("catalogue")
     def get_locations(
         self,
         products: list[Product] | None = None,
@@ -232,6 +235,7 @@ class QmaticAppointment(BasePlugin[CustomerFields]):
         ]
 
     @with_graceful_default(default=[])
+    @cached("availability")
     def get_dates(
         self,
         products: list[Product],
@@ -275,6 +279,7 @@ class QmaticAppointment(BasePlugin[CustomerFields]):
                 )
 
     @with_graceful_default(default=[])
+    @cached("availability")
     def get_times(
         self,
         products: list[Product],
@@ -310,6 +315,7 @@ class QmaticAppointment(BasePlugin[CustomerFields]):
         ]
         return components
 
+    @invalidates_availability
     def create_appointment(
         self,
         products: list[Product],
@@ -379,6 +385,7 @@ class QmaticAppointment(BasePlugin[CustomerFields]):
                     "Unexpected appointment create failure"
                 ) from exc
 
+    @invalidates_availability
     def delete_appointment(self, identifier: str) -> None:
         client = QmaticClient()
         try:
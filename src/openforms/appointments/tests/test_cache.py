@@ -0,0 +1,133 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from freezegun import freeze_time
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..base import Location, Product
+from ..cache import cached, get_cache_key, invalidates_availability
+
+
+class FakePlugin:
+    identifier = "fake"
+
+    def __init__(self):
+        self.calls = []
+        self.error = None
+
+    @cached("catalogue")
+    def get_locations(self, products: list[Product] | None = None) -> list[Location]:
+        self.calls.append(("get_locations", products))
+        if self.error:
+            raise self.error
+        return [Location(identifier=f"{len(self.calls)}", name="Location")]
+
+    @cached("availability")
+    def get_dates(self, products: list[Product], location: Location) -> list[date]:
+        self.calls.append(("get_dates", products, location))
+        return [date(2023, 8, len(self.calls))]
+
+    @invalidates_availability
+    def create_appointment(self) -> str:
+        return "123"
+
+
+@override_settings(
+    APPOINTMENTS_CATALOGUE_CACHE_TIMEOUT=300,
+    APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT=60,
+)
+class CacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+        self.plugin = FakePlugin()
+        self.products = [Product(identifier="1", name="Passport", amount=2)]
+
+    def test_results_cached_by_arguments(self):
+        result1 = self.plugin.get_locations(self.products)
+        # the names of the products do not matter
+        result2 = self.plugin.get_locations(
+            [Product(identifier="1", name="", amount=2)]
+        )
+        result3 = self.plugin.get_locations()
+
+        self.assertEqual(result1, result2)
+        self.assertNotEqual(result1, result3)
+        self.assertEqual(len(self.plugin.calls), 2)
+
+    @override_settings(APPOINTMENTS_CATALOGUE_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        self.plugin.get_locations(self.products)
+        self.plugin.get_locations(self.products)
+
+        self.assertEqual(len(self.plugin.calls), 2)
+
+    def test_stale_value_returned_while_refreshing(self):
+        key = get_cache_key("fake", "catalogue", "get_locations", (self.products,), {})
+        with freeze_time("2023-08-01T12:00:00Z") as frozen_time:
+            self.plugin.get_locations(self.products)
+            frozen_time.tick(301)
+
+            with self.subTest("refresh in progress"):
+                # simulate another process refreshing the value
+                cache.add(f"{key}:refresh", True)
+                stale = self.plugin.get_locations(self.products)
+                cache.delete(f"{key}:refresh")
+
+                self.assertEqual(stale[0].identifier, "1")
+                self.assertEqual(len(self.plugin.calls), 1)
+
+            with self.subTest("refresh"):
+                refreshed = self.plugin.get_locations(self.products)
+
+                self.assertEqual(refreshed[0].identifier, "2")
+                self.assertEqual(self.plugin.get_locations(self.products), refreshed)
+                self.assertEqual(len(self.plugin.calls), 2)
+
+    def test_stale_value_returned_if_refresh_fails(self):
+        with freeze_time("2023-08-01T12:00:00Z") as frozen_time:
+            self.plugin.get_locations(self.products)
+            frozen_time.tick(301)
+            self.plugin.error = Exception("Service unavailable")
+
+            result = self.plugin.get_locations(self.products)
+
+        self.assertEqual(result[0].identifier, "1")
+
+    def test_errors_not_cached(self):
+        self.plugin.error = Exception("Service unavailable")
+        with self.assertRaises(Exception):
+            self.plugin.get_locations(self.products)
+
+        self.plugin.error = None
+        result = self.plugin.get_locations(self.products)
+
+        self.assertEqual(result[0].identifier, "2")
+
+    def test_expired_value_discarded(self):
+        with freeze_time("2023-08-01T12:00:00Z") as frozen_time:
+            self.plugin.get_locations(self.products)
+            frozen_time.tick(601)
+
+            result = self.plugin.get_locations(self.products)
+
+        self.assertEqual(result[0].identifier, "2")
+
+    def test_availability_invalidated_after_creating_appointment(self):
+        location = Location(identifier="1", name="Location")
+        self.plugin.get_locations(self.products)
+        self.plugin.get_dates(self.products, location)
+
+        self.plugin.create_appointment()
+
+        self.plugin.get_locations(self.products)
+        self.plugin.get_dates(self.products, location)
+        self.assertEqual(
+            [call[0] for call in self.plugin.calls],
+            ["get_locations", "get_dates", "get_dates"],
+        )
@@ -3,7 +3,7 @@ from pathlib import Path
 from django.conf import settings
 
 from celery import Celery, bootsteps
-from celery.signals import worker_ready, worker_shutdown
+from celery.signals import worker_process_init, worker_ready, worker_shutdown
 
 from .setup import setup_env
 
@@ -60,4 +60,14 @@ def worker_shutdown(**_):
     READINESS_FILE.unlink(missing_ok=True)
 
 
+@worker_process_init.connect
+def warm_up_pdf_rendering(**_):
+    if not settings.PDF_RENDERING_WARM_UP:
+        return
+
+    from openforms.utils.pdf import get_renderer
+
+    get_renderer()
+
+
 app.steps["worker"].add(LivenessProbe)
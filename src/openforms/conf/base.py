@@ -254,6 +254,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "openforms.logging.middleware.BufferedLogsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -593,6 +594,20 @@ FORMS_EXPORT_REMOVED_AFTER_DAYS = config("FORMS_EXPORT_REMOVED_AFTER_DAYS", defa
 # :mod:`openforms.setup`. Value is in seconds.
 DEFAULT_TIMEOUT_REQUESTS = config("DEFAULT_TIMEOUT_REQUESTS", default=10.0)
 
+# connection pooling of the API clients for external services, see
+# :mod:`openforms.utils.api_clients`
+HTTP_CLIENT_POOL_MAXSIZE = config("HTTP_CLIENT_POOL_MAXSIZE", default=10)
+HTTP_CLIENT_POOL_IDLE_TIMEOUT = config(
+    "HTTP_CLIENT_POOL_IDLE_TIMEOUT", default=60
+)  # in seconds
+
+# maximum number of concurrent calls to external services (service fetch, DMN) during
+# a logic evaluation pass. Set to 1 to perform the calls one after another.
+LOGIC_EXTERNAL_CALLS_MAX_WORKERS = config("LOGIC_EXTERNAL_CALLS_MAX_WORKERS", default=5)
+# count the hits and misses of the cached external calls made during logic evaluation,
+# see :func:`openforms.submissions.logic.caching.get_cache_stats`
+LOGIC_CACHE_STATS = config("LOGIC_CACHE_STATS", default=False)
+
 MAX_FILE_UPLOAD_SIZE = config("MAX_FILE_UPLOAD_SIZE", default="50M", cast=Filesize())
 
 # Deal with being hosted on a subpath
@@ -776,6 +791,61 @@ RETRY_SUBMISSIONS_TIME_LIMIT = config(
     "RETRY_SUBMISSIONS_TIME_LIMIT", default=48  # hours
 )
 
+# cache the terminal (ready) states of the submission processing tasks, to relieve the
+# result backend when many users poll the submission status. 0 disables the cache.
+SUBMISSION_TASK_STATE_CACHE_TIMEOUT = config(
+    "SUBMISSION_TASK_STATE_CACHE_TIMEOUT", default=0  # seconds
+)
+
+# retrieve the prefill values in a background task when a submission is started, rather
+# than during the request. Requests needing the prefilled values wait at most
+# PREFILL_BACKGROUND_WAIT_TIMEOUT seconds for them.
+PREFILL_IN_BACKGROUND = config("PREFILL_IN_BACKGROUND", default=False)
+PREFILL_BACKGROUND_WAIT_TIMEOUT = config(
+    "PREFILL_BACKGROUND_WAIT_TIMEOUT", default=10  # seconds
+)
+
+# cache the products and locations (catalogue) and the available dates and times
+# (availability) retrieved from the appointment services, shared by all processes. 0
+# disables the cache.
+APPOINTMENTS_CATALOGUE_CACHE_TIMEOUT = config(
+    "APPOINTMENTS_CATALOGUE_CACHE_TIMEOUT", default=0  # seconds
+)
+APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT = config(
+    "APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT", default=0  # seconds
+)
+
+# path of the (SQLite) file in which the WSDL and XSD files downloaded by the SOAP
+# clients are cached. Empty disables this cache.
+SOAP_WSDL_CACHE_PATH = config("SOAP_WSDL_CACHE_PATH", default="")
+
+# documents larger than this size (in bytes) are uploaded to the Documenten API in parts
+# ("bestandsdelen", requires Documenten API 1.1+). 0 disables the upload in parts.
+ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD = config(
+    "ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD", default=0
+)
+
+# collect the timeline log entries created in a request or task and write them in bulk
+# at the end, rather than one by one
+AUDITLOG_BUFFERED = config("AUDITLOG_BUFFERED", default=False)
+
+# generating the submission report PDF can be routed to a dedicated queue, so that it
+# can be handled by workers with their own concurrency. Empty uses the default queue.
+PDF_RENDERING_QUEUE = config("PDF_RENDERING_QUEUE", default="")
+if PDF_RENDERING_QUEUE:
+    CELERY_TASK_ROUTES = {
+        "openforms.submissions.tasks.pdf.generate_submission_report": {
+            "queue": PDF_RENDERING_QUEUE
+        },
+    }
+
+# set up the PDF rendering state (fonts...) when a worker process starts, rather than
+# when rendering the first document
+PDF_RENDERING_WARM_UP = config("PDF_RENDERING_WARM_UP", default=False)
+# number of documents rendered before the PDF rendering state of a process is
+# discarded, to bound the memory usage. 0 keeps the state for the process lifetime.
+PDF_RENDERER_MAX_DOCUMENTS = config("PDF_RENDERER_MAX_DOCUMENTS", default=100)
+
 # Only ACK when the task has been executed. This prevents tasks from getting lost, with
 # the drawback that tasks should be idempotent (if they execute partially, the mutations
 # executed will be executed again!)
@@ -810,6 +880,7 @@ CORS_EXPOSE_HEADERS = [
     "X-CSRFToken",
     "X-Is-Form-Designer",
     "Content-Language",
+    "ETag",
 ]
 CORS_ALLOW_CREDENTIALS = True  # required to send cross domain cookies
 
@@ -3,10 +3,10 @@ from typing import TypedDict
 
 import requests
 from typing_extensions import NotRequired
-from zgw_consumers.client import build_client
 
 from openforms.pre_requests.clients import PreRequestClientContext, PreRequestMixin
 from openforms.submissions.models import Submission
+from openforms.utils.api_clients import build_pooled_client
 
 from ..hal_client import HALClient
 from .models import BRKConfig
@@ -28,7 +28,7 @@ def get_client(submission: Submission | None = None) -> "BRKClient":
         if submission is not None
         else None
     )
-    return build_client(service, client_factory=BRKClient, context=context)
+    return build_pooled_client(service, client_factory=BRKClient, context=context)
 
 
 class SearchParams(TypedDict):
@@ -1,10 +1,9 @@
 from typing import Any
 
-from zgw_consumers.client import build_client
-
 from openforms.authentication.service import AuthAttribute
 from openforms.config.models import GlobalConfiguration
 from openforms.submissions.models import Submission
+from openforms.utils.api_clients import build_pooled_client
 
 from ..constants import DEFAULT_HC_BRP_PERSONEN_GEBRUIKER_HEADER
 from ..models import BRPPersonenRequestOptions, HaalCentraalConfig
@@ -62,7 +61,7 @@ def get_brp_client(submission: Submission | None = None, **kwargs: Any) -> BRPCl
             f"No suitable client class configured for API version {version}"
         )
 
-    return build_client(
+    return build_pooled_client(
         service,
         client_factory=ClientCls,
         origin_oin=origin_oin,
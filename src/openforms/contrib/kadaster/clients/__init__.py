@@ -1,4 +1,4 @@
-from zgw_consumers.client import build_client
+from openforms.utils.api_clients import build_pooled_client
 
 from ..models import KadasterApiConfig
 from .bag import BAGClient
@@ -14,7 +14,7 @@ def get_locatieserver_client() -> LocatieServerClient:
     assert isinstance(config, KadasterApiConfig)
     # model field is not nullable because a default is configured
     assert (service := config.search_service)
-    return build_client(service, client_factory=LocatieServerClient)
+    return build_pooled_client(service, client_factory=LocatieServerClient)
 
 
 def get_bag_client() -> BAGClient:
@@ -22,4 +22,4 @@ def get_bag_client() -> BAGClient:
     assert isinstance(config, KadasterApiConfig)
     if not (service := config.bag_service):
         raise NoServiceConfigured("No BAG service configured!")
-    return build_client(service, client_factory=BAGClient)
+    return build_pooled_client(service, client_factory=BAGClient)
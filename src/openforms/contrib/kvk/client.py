@@ -3,9 +3,9 @@ from typing import Literal, TypedDict
 
 import elasticapm
 import requests
-from zgw_consumers.client import build_client
 
 from openforms.contrib.hal_client import HALClient
+from openforms.utils.api_clients import build_pooled_client
 
 from .api_models.basisprofiel import BasisProfiel
 from .models import KVKConfig
@@ -18,7 +18,7 @@ def get_kvk_profile_client() -> "KVKProfileClient":
     assert isinstance(config, KVKConfig)
     if not (service := config.profile_service):
         raise NoServiceConfigured("No KVK basisprofielen service configured!")
-    return build_client(service, client_factory=KVKProfileClient)
+    return build_pooled_client(service, client_factory=KVKProfileClient)
 
 
 def get_kvk_search_client() -> "KVKSearchClient":
@@ -26,7 +26,7 @@ def get_kvk_search_client() -> "KVKSearchClient":
     assert isinstance(config, KVKConfig)
     if not (service := config.search_service):
         raise NoServiceConfigured("No KVK zoeken service configured!")
-    return build_client(service, client_factory=KVKSearchClient)
+    return build_pooled_client(service, client_factory=KVKSearchClient)
 
 
 class NoServiceConfigured(RuntimeError):
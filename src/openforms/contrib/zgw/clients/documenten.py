@@ -1,12 +1,24 @@
+import json
+import uuid
 from base64 import b64encode
+from itertools import chain
 from typing import BinaryIO, Literal, TypeAlias
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 
 from zgw_consumers.nlx import NLXClient
 
 from openforms.translations.utils import to_iso639_2b
 from openforms.utils.date import get_today
+from openforms.utils.streaming import (
+    STREAMING_THRESHOLD,
+    StreamingBody,
+    get_base64_length,
+    get_size,
+    iter_base64,
+    iter_chunks,
+)
 
 DocumentStatus: TypeAlias = Literal[
     "in_bewerking",
@@ -31,10 +43,15 @@ class DocumentenClient(NLXClient):
         description: str = "",
         vertrouwelijkheidaanduiding: str = "",
     ):
+        """
+        Create a document with the given content.
+
+        Large documents are not loaded in memory. The content is either base64-encoded
+        while the request is being sent, or uploaded in parts ("bestandsdelen") if it
+        exceeds the ``ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD`` setting.
+        """
         assert author, "author must be a non-empty string"
         today = get_today()
-        file_content = content.read()
-        base64_body = b64encode(file_content).decode()
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
@@ -43,20 +60,91 @@ class DocumentenClient(NLXClient):
             "auteur": author,
             "taal": to_iso639_2b(language),
             "formaat": format,
-            "inhoud": base64_body,
             "status": status,
             "bestandsnaam": filename,
             "beschrijving": description,
             "indicatieGebruiksrecht": False,
-            "bestandsomvang": (
-                content.size if hasattr(content, "size") else len(file_content)
-            ),
         }
 
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
 
-        response = self.post("enkelvoudiginformatieobjecten", json=data)
-        response.raise_for_status()
+        size = get_size(content)
+        if size is None or size <= STREAMING_THRESHOLD:
+            file_content = content.read()
+            data["inhoud"] = b64encode(file_content).decode()
+            data["bestandsomvang"] = size if size is not None else len(file_content)
+            response = self.post("enkelvoudiginformatieobjecten", json=data)
+            response.raise_for_status()
+            return response.json()
+
+        data["bestandsomvang"] = size
+        threshold = settings.ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD
+        if threshold and size > threshold:
+            return self._create_document_in_parts(data, content, filename=filename)
 
+        # the base64-encoded content is inserted as the last key of the JSON object
+        prefix = json.dumps(data)[:-1] + ', "inhoud": "'
+        suffix = '"}'
+        body = StreamingBody(
+            chain(
+                [prefix.encode()],
+                iter_base64(iter_chunks(content, size)),
+                [suffix.encode()],
+            ),
+            length=len(prefix) + get_base64_length(size) + len(suffix),
+        )
+        response = self.post(
+            "enkelvoudiginformatieobjecten",
+            data=body,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
         return response.json()
+
+    def _create_document_in_parts(
+        self, data: dict, content: ContentFile | BinaryIO, filename: str
+    ) -> dict:
+        """
+        Create the document without content and upload the content in the parts
+        determined by the Documenten API.
+        """
+        response = self.post(
+            "enkelvoudiginformatieobjecten", json={**data, "inhoud": None}
+        )
+        response.raise_for_status()
+        document = response.json()
+        lock = document["lock"]
+
+        for part in sorted(document["bestandsdelen"], key=lambda p: p["volgnummer"]):
+            self._upload_part(part, content, lock=lock, filename=filename)
+
+        response = self.post(f"{document['url']}/unlock", json={"lock": lock})
+        response.raise_for_status()
+        return document
+
+    def _upload_part(
+        self, part: dict, content: ContentFile | BinaryIO, lock: str, filename: str
+    ) -> None:
+        boundary = uuid.uuid4().hex
+        quoted_filename = filename.replace('"', "%22")
+        prefix = (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="lock"\r\n\r\n'
+            f"{lock}\r\n"
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="inhoud"; '
+            f'filename="{quoted_filename}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        suffix = f"\r\n--{boundary}--\r\n".encode()
+        body = StreamingBody(
+            chain([prefix], iter_chunks(content, part["omvang"]), [suffix]),
+            length=len(prefix) + part["omvang"] + len(suffix),
+        )
+        response = self.put(
+            part["url"],
+            data=body,
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+        response.raise_for_status()
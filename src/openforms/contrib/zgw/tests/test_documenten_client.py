@@ -0,0 +1,105 @@
+import json
+from base64 import b64encode
+from io import BytesIO
+
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+
+from openforms.utils.streaming import STREAMING_THRESHOLD, StreamingBody
+
+from ..clients import DocumentenClient
+
+DOCUMENTEN_ROOT = "https://documenten.nl/api/v1/"
+
+
+def _create_document(client: DocumentenClient, content: bytes) -> dict:
+    return client.create_document(
+        informatieobjecttype="https://catalogi.nl/api/v1/informatieobjecttypen/1",
+        bronorganisatie="000000000",
+        title="Large upload",
+        author="Aanvrager",
+        language="nl",
+        format="application/octet-stream",
+        content=BytesIO(content),
+        status="definitief",
+        filename="large.bin",
+    )
+
+
+@requests_mock.Mocker()
+class DocumentenClientTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.documenten_client = DocumentenClient(base_url=DOCUMENTEN_ROOT)
+
+    def test_small_document_sent_as_json(self, m):
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten", status_code=201, json={}
+        )
+
+        _create_document(self.documenten_client, b"content")
+
+        body = m.last_request.json()
+        self.assertEqual(body["inhoud"], b64encode(b"content").decode())
+        self.assertEqual(body["bestandsomvang"], 7)
+
+    def test_large_document_streamed(self, m):
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten", status_code=201, json={}
+        )
+        content = bytes(range(256)) * (STREAMING_THRESHOLD // 256) + b"odd"
+
+        _create_document(self.documenten_client, content)
+
+        request = m.last_request
+        self.assertIsInstance(request.body, StreamingBody)
+        self.assertEqual(int(request.headers["Content-Length"]), len(request.body))
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        body = json.loads(request.body.read())
+        self.assertEqual(body["inhoud"], b64encode(content).decode())
+        self.assertEqual(body["bestandsomvang"], len(content))
+        self.assertEqual(body["titel"], "Large upload")
+
+    @override_settings(ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD=STREAMING_THRESHOLD)
+    def test_large_document_uploaded_in_parts(self, m):
+        content = b"a" * STREAMING_THRESHOLD + b"b" * 10
+        document_url = f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten/1"
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={
+                "url": document_url,
+                "lock": "a-lock",
+                "bestandsdelen": [
+                    {
+                        "url": f"{DOCUMENTEN_ROOT}bestandsdelen/2",
+                        "volgnummer": 2,
+                        "omvang": 10,
+                    },
+                    {
+                        "url": f"{DOCUMENTEN_ROOT}bestandsdelen/1",
+                        "volgnummer": 1,
+                        "omvang": STREAMING_THRESHOLD,
+                    },
+                ],
+            },
+        )
+        m.put(f"{DOCUMENTEN_ROOT}bestandsdelen/1", json={})
+        m.put(f"{DOCUMENTEN_ROOT}bestandsdelen/2", json={})
+        m.post(f"{document_url}/unlock", status_code=204)
+
+        document = _create_document(self.documenten_client, content)
+
+        self.assertEqual(document["url"], document_url)
+        create, upload_part1, upload_part2, unlock = m.request_history
+        create_body = create.json()
+        self.assertIsNone(create_body["inhoud"])
+        self.assertEqual(create_body["bestandsomvang"], len(content))
+        self.assertEqual(upload_part1.url, f"{DOCUMENTEN_ROOT}bestandsdelen/1")
+        part1 = upload_part1.body.read()
+        self.assertIn(b'name="lock"\r\n\r\na-lock\r\n', part1)
+        self.assertIn(b"\r\n\r\n" + b"a" * STREAMING_THRESHOLD + b"\r\n--", part1)
+        self.assertIn(b"\r\n" + b"b" * 10 + b"\r\n", upload_part2.body.read())
+        self.assertEqual(unlock.json(), {"lock": "a-lock"})
@@ -5,6 +5,7 @@ from rest_framework.reverse import reverse
 
 from openforms.submissions.constants import SUBMISSIONS_SESSION_KEY
 from openforms.submissions.models import Submission
+from openforms.submissions.utils import get_session_list
 
 from .validators import MimeTypeValidator, NoVirusValidator
 
@@ -61,6 +62,7 @@ class TemporaryFileUploadSerializer(serializers.Serializer):
 
         session = self.context["request"].session
         fields["submission"].queryset = Submission.objects.filter(
-            completed_on=None, uuid__in=session.get(SUBMISSIONS_SESSION_KEY, [])
+            completed_on=None,
+            uuid__in=get_session_list(session, SUBMISSIONS_SESSION_KEY),
         )
         return fields
@@ -1,19 +1,18 @@
-import re
 from collections import UserDict
-from collections.abc import Hashable
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterator, cast
 
 from glom import PathAccessError, assign, glom
 
-from openforms.typing import DataMapping, JSONValue
+from openforms.typing import DataMapping, JSONObject, JSONValue
 
 from .typing import Component, EditGridComponent, FormioConfiguration
 from .utils import flatten_by_path, is_visible_in_frontend, iter_components
 
 # TODO: mechanism to wrap/mark root components?
 
-RE_PATH = re.compile(r"(components|columns|rows)\.([0-9]+)")
-
 
 def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Component]:
     """
@@ -35,25 +34,115 @@ def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Compo
     return component_map
 
 
+Location = tuple[str | int, ...]
+
+
+def _get_location(path: str) -> Location:
+    return tuple(int(bit) if bit.isdigit() else bit for bit in path.split("."))
+
+
+@dataclass(frozen=True)
+class ConfigurationIndex:
+    """
+    The locations of the components in a Formio configuration.
+
+    Building the component lookups requires walking the entire configuration tree. The
+    index captures the result of that walk, so that the lookups can be built for
+    another configuration with the same content by only visiting the indexed
+    locations. Instances are shared and must not be mutated.
+    """
+
+    # component key (including the namespaced editgrid keys) -> location
+    component_locations: dict[str, Location]
+    # configuration path -> location, depth-first ordered
+    path_locations: dict[str, Location]
+    reverse_flattened: dict[str, str]
+
+
+def _iter_with_ancestors(
+    configuration: JSONObject, ancestors: tuple[JSONObject, ...] = ()
+) -> Iterator[tuple[JSONObject, ...]]:
+    """
+    Yield every component with its ancestors, in the same order as
+    :func:`openforms.formio.utils.flatten_by_path`.
+    """
+    for component in iter_components(configuration, recursive=False):
+        nodes = (*ancestors, component)
+        yield nodes
+        if "columns" in component:
+            for column in component["columns"]:
+                yield from _iter_with_ancestors(column, (*nodes, column))
+        elif "components" in component:
+            yield from _iter_with_ancestors(component, nodes)
+
+
 class FormioConfigurationWrapper:
     """
     Wrap around the Formio configuration dictionary for further processing.
 
     This datastructure caches the internal datastructure to optimize mutations of the
     formio configuration.
+
+    If a :class:`ConfigurationIndex` of the (unmodified) configuration is provided, the
+    lookups are built from it instead of walking the configuration.
     """
 
     _configuration: FormioConfiguration
+    _index: ConfigurationIndex | None
     # depth-first ordered of all components in the formio configuration tree
     _cached_component_map: dict[str, Component] | None = None
     _flattened_by_path: None | dict[str, Component] = None
     _reverse_flattened: None | dict[str, str] = None
+    _cached_ancestors: dict[str, tuple[JSONObject, ...]] | None = None
 
-    def __init__(self, configuration: FormioConfiguration):
+    def __init__(
+        self,
+        configuration: FormioConfiguration,
+        index: ConfigurationIndex | None = None,
+    ):
         self._configuration = configuration
+        self._index = index
+
+    def _resolve(self, location: Location) -> Component:
+        node = self._configuration
+        for bit in location:
+            node = node[bit]
+        return cast(Component, node)
+
+    def build_index(self) -> ConfigurationIndex | None:
+        """
+        Capture the locations of the components in the configuration.
+
+        Must be called before the configuration is mutated. Returns ``None`` if not
+        every component could be located.
+        """
+        locations = {
+            id(component): _get_location(path)
+            for path, component in self.flattened_by_path.items()
+        }
+        component_locations = {}
+        for key, component in self.component_map.items():
+            if (location := locations.get(id(component))) is None:
+                return None
+            component_locations[key] = location
+
+        return ConfigurationIndex(
+            component_locations=component_locations,
+            path_locations={
+                path: locations[id(component)]
+                for path, component in self.flattened_by_path.items()
+            },
+            reverse_flattened=dict(self.reverse_flattened),
+        )
 
     @property
     def component_map(self) -> dict[str, Component]:
+        if self._cached_component_map is None and self._index is not None:
+            self._cached_component_map = {
+                key: self._resolve(location)
+                for key, location in self._index.component_locations.items()
+            }
+
         if self._cached_component_map is None:
             self._cached_component_map = {}
 
@@ -108,6 +197,10 @@ class FormioConfigurationWrapper:
     def __add__(
         self, other_wrapper: "FormioConfigurationWrapper"
     ) -> "FormioConfigurationWrapper":
+        # make sure the lookups are built before the locations become invalid
+        self.component_map
+        self._index = None
+        self._cached_ancestors = None
         self._configuration["components"] += other_wrapper._configuration["components"]
         self.component_map.update(other_wrapper.component_map)
         return self
@@ -118,12 +211,19 @@ class FormioConfigurationWrapper:
 
     @property
     def flattened_by_path(self) -> dict[str, Component]:
+        if self._flattened_by_path is None and self._index is not None:
+            self._flattened_by_path = {
+                path: self._resolve(location)
+                for path, location in self._index.path_locations.items()
+            }
         if self._flattened_by_path is None:
             self._flattened_by_path = flatten_by_path(self.configuration)
         return self._flattened_by_path
 
     @property
     def reverse_flattened(self) -> dict[str, str]:
+        if self._reverse_flattened is None and self._index is not None:
+            self._reverse_flattened = dict(self._index.reverse_flattened)
         if self._reverse_flattened is None:
             self._reverse_flattened = {
                 component["key"]: path
@@ -131,16 +231,70 @@ class FormioConfigurationWrapper:
             }
         return self._reverse_flattened
 
+    @property
+    def _ancestors(self) -> dict[str, tuple[JSONObject, ...]]:
+        # component key -> the component and its ancestors (including the columns of
+        # columns components), leftmost is root, rightmost is leaf
+        if self._cached_ancestors is None:
+            self._cached_ancestors = {
+                nodes[-1]["key"]: nodes
+                for nodes in _iter_with_ancestors(self.configuration)
+            }
+        return self._cached_ancestors
+
     def is_visible_in_frontend(self, key: str, values: DataMapping) -> bool:
-        config_path = self.reverse_flattened[key]
-        path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
-        nodes = []  # leftmost is root, rightmost is leaf
-        for depth in range(len(path_bits)):
-            path = ".".join(path_bits[: depth + 1])
-            component = cast(Component, glom(self.configuration, path))
-            nodes.append(component)
+        nodes = self._ancestors[key]
         return all(is_visible_in_frontend(node, values) for node in nodes)
 
+    def visible_components(self, values: DataMapping) -> set[str]:
+        """
+        Determine the keys of the components that are visible in the frontend.
+
+        This is equivalent to calling :meth:`is_visible_in_frontend` for every
+        component, but the visibility of every component is determined only once, in a
+        single top-down pass.
+        """
+        visibility: dict[str, bool] = {}
+
+        def visit(node: JSONObject, parent_visible: bool) -> None:
+            for component in iter_components(node, recursive=False):
+                visible = parent_visible and is_visible_in_frontend(component, values)
+                visibility[component["key"]] = visible
+                if "columns" in component:
+                    for column in component["columns"]:
+                        visit(
+                            column, visible and is_visible_in_frontend(column, values)
+                        )
+                elif "components" in component:
+                    visit(component, visible)
+
+        visit(self.configuration, True)
+        return {key for key, visible in visibility.items() if visible}
+
+    def get_conditional_trigger_keys(self) -> set[str]:
+        """
+        Collect the keys of the components that the (simple) conditionals of the
+        components and columns depend on.
+        """
+        keys = set()
+        for nodes in _iter_with_ancestors(self.configuration):
+            # the component and its parent, which may be a column
+            for node in nodes[-2:]:
+                if (conditional := node.get("conditional")) and (
+                    when := conditional.get("when")
+                ):
+                    keys.add(when)
+        return keys
+
+
+# marker for absent values, distinct from ``None`` (which is a valid value)
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _split_key(key: str) -> tuple[str, ...]:
+    return tuple(key.split("."))
+
 
 class FormioData(UserDict):
     """
@@ -159,19 +313,82 @@ class FormioData(UserDict):
 
     without having to worry about potential deep assignments or leak implementation
     details (such as using ``glom`` for this).
+
+    Keys are resolved with plain dictionary operations when every (intermediate)
+    container is a dictionary, which is by far the most common case. Other containers
+    (like lists) are resolved with ``glom``.
     """
 
     data: dict[str, JSONValue]
 
+    def _lookup(self, key: Hashable) -> object:
+        """
+        Look up the value of ``key``, or return ``_MISSING`` if it's absent.
+        """
+        if not isinstance(key, str):
+            return glom(self.data, key, default=_MISSING, skip_exc=PathAccessError)
+        if "." not in key:
+            return self.data.get(key, _MISSING)
+
+        node = self.data
+        for bit in _split_key(key):
+            if not isinstance(node, dict):
+                return glom(self.data, key, default=_MISSING, skip_exc=PathAccessError)
+            if (node := node.get(bit, _MISSING)) is _MISSING:
+                return _MISSING
+        return node
+
     def __getitem__(self, key: Hashable):
-        return cast(JSONValue, glom(self.data, key))
+        if (value := self._lookup(key)) is _MISSING:
+            # raises the appropriate error
+            return cast(JSONValue, glom(self.data, key))
+        return cast(JSONValue, value)
 
     def __setitem__(self, key: Hashable, value: JSONValue):
-        assign(self.data, key, value, missing=dict)
+        if not isinstance(key, str):
+            assign(self.data, key, value, missing=dict)
+            return
+        if "." not in key:
+            self.data[key] = value
+            return
+
+        *parents, leaf = _split_key(key)
+        node = self.data
+        for bit in parents:
+            if (child := node.get(bit, _MISSING)) is _MISSING:
+                child = node[bit] = {}
+            elif not isinstance(child, dict):
+                # nothing has been modified yet
+                assign(self.data, key, value, missing=dict)
+                return
+            node = child
+        node[leaf] = value
 
     def __contains__(self, key: Hashable) -> bool:
-        try:
-            self[key]
-        except PathAccessError:
-            return False
-        return True
+        return self._lookup(key) is not _MISSING
+
+    def get(self, key: Hashable, default=None):
+        if (value := self._lookup(key)) is _MISSING:
+            return default
+        return value
+
+    def update_many(self, values: Mapping[Hashable, JSONValue]) -> None:
+        """
+        Set the values of multiple (possibly nested) keys, in order.
+        """
+        data = self.data
+        for key, value in values.items():
+            if isinstance(key, str) and "." not in key:
+                data[key] = value
+            else:
+                self[key] = value
+
+    def update(self, other=(), /, **kwargs) -> None:
+        if isinstance(other, Mapping):
+            self.update_many(other)
+        elif hasattr(other, "keys"):
+            self.update_many({key: other[key] for key in other.keys()})
+        else:
+            for key, value in other:
+                self[key] = value
+        self.update_many(kwargs)
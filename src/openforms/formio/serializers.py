@@ -51,15 +51,15 @@ class StepDataSerializer(serializers.Serializer):
         # can't use FormioData yet because of is_visible_in_frontend
         values: DataMapping = self.initial_data
 
+        # XXX: is_visible_in_frontend does not understand editgrid at all yet, which
+        # is a broader issue, but also manifests here.
+        visible_keys = config_wrapper.visible_components(values)
+
         # loop over all components and delegate application to the registry
         for component in iter_components(configuration, recurse_into_editgrid=False):
-            # XXX: is_visible_in_frontend does not understand editgrid at all yet, which
-            # is a broader issue, but also manifests here.
-            is_visible = config_wrapper.is_visible_in_frontend(component["key"], values)
-
             # we don't have to do anything when the component is visible, regular
             # validation rules apply
-            if is_visible:
+            if component["key"] in visible_keys:
                 continue
 
             # Layout components do not have serializer fields associated with them
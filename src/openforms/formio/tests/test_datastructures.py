@@ -1,5 +1,8 @@
+from copy import deepcopy
 from unittest import TestCase
 
+from glom import PathAccessError
+
 from openforms.formio.typing import Component, EditGridComponent
 
 from ..datastructures import FormioConfiguration, FormioConfigurationWrapper, FormioData
@@ -89,6 +92,43 @@ class FormioDataTests(TestCase):
 
         self.assertEqual(formio_data, expected)
 
+    def test_update_many(self):
+        formio_data = FormioData({"container": {"nested1": "foo"}, "topLevel": 1})
+
+        formio_data.update_many(
+            {
+                "topLevel": 2,
+                "container.nested2": "bar",
+                "other.deeply.nested": "baz",
+            }
+        )
+
+        expected = {
+            "container": {"nested1": "foo", "nested2": "bar"},
+            "other": {"deeply": {"nested": "baz"}},
+            "topLevel": 2,
+        }
+        self.assertEqual(formio_data, expected)
+
+    def test_paths_through_lists(self):
+        formio_data = FormioData({"repeatingGroup": [{"name": "foo"}], "text": "bar"})
+
+        with self.subTest("lookup"):
+            self.assertEqual(formio_data["repeatingGroup.0.name"], "foo")
+            self.assertTrue("repeatingGroup.0.name" in formio_data)
+            self.assertFalse("repeatingGroup.1.name" in formio_data)
+            self.assertIsNone(formio_data.get("repeatingGroup.0.absent"))
+
+        with self.subTest("lookup through leaf value"):
+            self.assertFalse("text.absent" in formio_data)
+            with self.assertRaises(PathAccessError):
+                formio_data["text.absent"]
+
+        with self.subTest("assignment"):
+            formio_data["repeatingGroup.0.name"] = "baz"
+
+            self.assertEqual(formio_data["repeatingGroup"], [{"name": "baz"}])
+
 
 class FormioConfigurationWrapperTests(TestCase):
 
@@ -147,3 +187,136 @@ class FormioConfigurationWrapperTests(TestCase):
             config_wrapper["outerEditgrid.innerEditgrid.innerTextfield"],
             inner_textfield,
         )
+
+    def test_lookups_from_index(self):
+        config: FormioConfiguration = {
+            "components": [
+                {"type": "textfield", "key": "textfield"},
+                {
+                    "type": "columns",
+                    "key": "columns",
+                    "columns": [
+                        {"components": [{"type": "number", "key": "number"}]},
+                    ],
+                },
+                {
+                    "type": "editgrid",
+                    "key": "editgrid",
+                    "components": [
+                        {
+                            "type": "fieldset",
+                            "key": "fieldset",
+                            "components": [{"type": "email", "key": "email"}],
+                        }
+                    ],
+                },
+            ]
+        }
+        index = FormioConfigurationWrapper(config).build_index()
+        assert index is not None
+        copied_config = deepcopy(config)
+
+        config_wrapper = FormioConfigurationWrapper(copied_config, index=index)
+
+        reference = FormioConfigurationWrapper(copied_config)
+        self.assertEqual(
+            {
+                key: id(component)
+                for key, component in config_wrapper.component_map.items()
+            },
+            {key: id(component) for key, component in reference.component_map.items()},
+        )
+        self.assertEqual(
+            list(config_wrapper.component_map), list(reference.component_map)
+        )
+        self.assertEqual(config_wrapper.flattened_by_path, reference.flattened_by_path)
+        self.assertEqual(config_wrapper.reverse_flattened, reference.reverse_flattened)
+        self.assertIs(
+            config_wrapper["editgrid.fieldset"],
+            copied_config["components"][2]["components"][0],
+        )
+
+    def test_visible_components(self):
+        config: FormioConfiguration = {
+            "components": [
+                {"type": "textfield", "key": "name"},
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "conditional": {"show": True, "when": "name", "eq": "Jo"},
+                    "components": [
+                        {"type": "textfield", "key": "nickName"},
+                        {
+                            "type": "columns",
+                            "key": "columns",
+                            "columns": [
+                                {"components": [{"type": "number", "key": "age"}]},
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "type": "email",
+                    "key": "email",
+                    "conditional": {"show": False, "when": "nickName", "eq": "J"},
+                },
+            ]
+        }
+        config_wrapper = FormioConfigurationWrapper(config)
+
+        for values in ({"name": "Jo", "nickName": "J"}, {"name": "Jan"}):
+            with self.subTest(values=values):
+                visible_components = config_wrapper.visible_components(values)
+
+                self.assertEqual(
+                    visible_components,
+                    {
+                        key
+                        for key in config_wrapper.reverse_flattened
+                        if config_wrapper.is_visible_in_frontend(key, values)
+                    },
+                )
+
+        self.assertEqual(
+            config_wrapper.visible_components({"name": "Jan"}), {"name", "email"}
+        )
+        # hidden parent, hidden children
+        config["components"][1]["conditional"]["eq"] = "Jan"
+        self.assertEqual(
+            config_wrapper.visible_components({"name": "Jo"}), {"name", "email"}
+        )
+
+    def test_get_conditional_trigger_keys(self):
+        config: FormioConfiguration = {
+            "components": [
+                {"type": "textfield", "key": "name"},
+                {
+                    "type": "columns",
+                    "key": "columns",
+                    "columns": [
+                        {
+                            "conditional": {"show": True, "when": "age", "eq": 18},
+                            "components": [
+                                {
+                                    "type": "number",
+                                    "key": "age",
+                                    "conditional": {
+                                        "show": True,
+                                        "when": "name",
+                                        "eq": "Jo",
+                                    },
+                                }
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "type": "email",
+                    "key": "email",
+                    "conditional": {"show": None, "when": "", "eq": ""},
+                },
+            ]
+        }
+        config_wrapper = FormioConfigurationWrapper(config)
+
+        self.assertEqual(config_wrapper.get_conditional_trigger_keys(), {"name", "age"})
@@ -36,10 +36,23 @@ class ApplyConverter:
             if updated_form_definition:
                 form_definitions_to_update.append(form_definition)
 
-        if form_definitions_to_update:
-            FormDefinition.objects.bulk_update(
-                form_definitions_to_update, fields=["configuration"]
-            )
+        if not form_definitions_to_update:
+            return
+
+        fields = ["configuration"]
+        # the stored hash identifies the cached index of the components
+        if any(
+            field.name == "_configuration_hash"
+            for field in FormDefinition._meta.get_fields()
+        ):
+            from openforms.forms.models.form_definition import get_configuration_hash
+
+            for form_definition in form_definitions_to_update:
+                form_definition._configuration_hash = get_configuration_hash(
+                    form_definition.configuration
+                )
+            fields.append("_configuration_hash")
+        FormDefinition.objects.bulk_update(form_definitions_to_update, fields=fields)
 
 
 class ConvertComponentsOperation(migrations.RunPython):
@@ -0,0 +1,40 @@
+import hashlib
+import json
+
+from django.db import migrations, models
+from django.db.migrations.state import StateApps
+
+
+def store_configuration_hash(apps: StateApps, _):
+    FormDefinition = apps.get_model("forms", "FormDefinition")
+
+    form_definitions = list(FormDefinition.objects.all())
+    for form_definition in form_definitions:
+        form_definition._configuration_hash = hashlib.md5(
+            json.dumps(form_definition.configuration, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+    FormDefinition.objects.bulk_update(
+        form_definitions, fields=["_configuration_hash"], batch_size=100
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0103_rename_identifier_role_prefill"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formdefinition",
+            name="_configuration_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="The hash of the configuration, see 'get_hash'.",
+                max_length=32,
+                verbose_name="configuration hash",
+            ),
+        ),
+        migrations.RunPython(store_configuration_hash, migrations.RunPython.noop),
+    ]
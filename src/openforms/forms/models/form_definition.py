@@ -1,6 +1,8 @@
 import hashlib
 import json
+import threading
 import uuid
+from collections import OrderedDict
 from copy import deepcopy
 from functools import partial
 from typing import TYPE_CHECKING
@@ -21,8 +23,60 @@ from ..tasks import detect_formiojs_configuration_snake_case
 from ..validators import validate_template_expressions
 
 if TYPE_CHECKING:
+    from openforms.formio.datastructures import ConfigurationIndex
     from openforms.formio.service import FormioConfigurationWrapper
 
+CONFIGURATION_INDEX_CACHE_SIZE = 128
+
+_configuration_indexes: OrderedDict[tuple[int, str], "ConfigurationIndex | None"] = (
+    OrderedDict()
+)
+_configuration_indexes_lock = threading.Lock()
+
+
+def _get_configuration_wrapper(
+    form_definition: "FormDefinition",
+) -> "FormioConfigurationWrapper":
+    """
+    Wrap the configuration of the form definition, re-using the index of the
+    components built by earlier requests in this process.
+
+    The index is immutable and identified by the form definition and the hash of the
+    configuration stored when it was saved, so that changes to the form definition are
+    picked up without hashing the configuration on every call. The wrapper operates on
+    the configuration of the model instance, which is a private copy that can be
+    mutated.
+    """
+    from openforms.formio.service import FormioConfigurationWrapper
+
+    if form_definition.pk is None:
+        return FormioConfigurationWrapper(form_definition.configuration)
+
+    key = (
+        form_definition.pk,
+        form_definition._configuration_hash or form_definition.get_hash(),
+    )
+    with _configuration_indexes_lock:
+        if key in _configuration_indexes:
+            _configuration_indexes.move_to_end(key)
+            return FormioConfigurationWrapper(
+                form_definition.configuration, index=_configuration_indexes[key]
+            )
+
+    wrapper = FormioConfigurationWrapper(form_definition.configuration)
+    index = wrapper.build_index()
+    with _configuration_indexes_lock:
+        _configuration_indexes[key] = index
+        if len(_configuration_indexes) > CONFIGURATION_INDEX_CACHE_SIZE:
+            _configuration_indexes.popitem(last=False)
+    return wrapper
+
+
+def get_configuration_hash(configuration: dict) -> str:
+    return hashlib.md5(
+        json.dumps(configuration, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
 
 def _get_number_of_components(form_definition: "FormDefinition") -> int:
     """
@@ -69,6 +123,13 @@ class FormDefinition(models.Model):
         default=0,
         help_text=_("The total number of Formio components used in the configuration"),
     )
+    _configuration_hash = models.CharField(
+        _("configuration hash"),
+        max_length=32,
+        blank=True,
+        editable=False,
+        help_text=_("The hash of the configuration, see 'get_hash'."),
+    )
 
     class Meta:
         verbose_name = _("Form definition")
@@ -80,6 +141,11 @@ class FormDefinition(models.Model):
     def save(self, *args, **kwargs):
         # on every save, keep track of the number of components
         self._num_components = _get_number_of_components(self)
+        self._configuration_hash = self.get_hash()
+        if (update_fields := kwargs.get("update_fields")) and (
+            "configuration" in update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, "_configuration_hash"}
 
         super().save(*args, **kwargs)
 
@@ -164,15 +230,11 @@ class FormDefinition(models.Model):
         )
 
     def get_hash(self):
-        return hashlib.md5(
-            json.dumps(self.configuration, sort_keys=True).encode("utf-8")
-        ).hexdigest()
+        return get_configuration_hash(self.configuration)
 
     @cached_property
     def configuration_wrapper(self) -> "FormioConfigurationWrapper":
-        from openforms.formio.service import FormioConfigurationWrapper
-
-        return FormioConfigurationWrapper(self.configuration)
+        return _get_configuration_wrapper(self)
 
     def iter_components(self, configuration=None, recursive=True, **kwargs):
         if configuration is None:
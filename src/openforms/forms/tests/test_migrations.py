@@ -5,6 +5,8 @@ from zgw_consumers.constants import APITypes, AuthTypes
 from openforms.utils.tests.test_migrations import TestMigrations
 from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
 
+from ..models.form_definition import get_configuration_hash
+
 
 class EnableNewBuilderMigrationTests(TestMigrations):
     app = "forms"
@@ -514,3 +516,25 @@ class PrefillIdentifierRoleRename(TestMigrations):
         self.assertEqual(component["prefill"]["identifierRole"], "authorizee")
         component3 = fd.configuration["components"][2]
         self.assertEqual(component3["prefill"]["identifierRole"], "main")
+
+
+class StoreConfigurationHashTests(TestMigrations):
+    app = "forms"
+    migrate_from = "0103_rename_identifier_role_prefill"
+    migrate_to = "0104_formdefinition__configuration_hash"
+
+    def setUpBeforeMigration(self, apps: StateApps):
+        FormDefinition = apps.get_model("forms", "FormDefinition")
+        FormDefinition.objects.create(
+            name="legacy",
+            configuration={"components": [{"type": "textfield", "key": "text"}]},
+        )
+
+    def test_configuration_hash_stored(self):
+        FormDefinition = self.apps.get_model("forms", "FormDefinition")
+        form_definition = FormDefinition.objects.get()
+
+        self.assertEqual(
+            form_definition._configuration_hash,
+            get_configuration_hash(form_definition.configuration),
+        )
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings, tag
 from django.utils.translation import gettext as _
@@ -435,6 +437,46 @@ class FormDefinitionTestCase(TestCase):
 
         self.assertEqual(fd._num_components, 2)
 
+    def test_configuration_wrapper_reuses_index(self):
+        form_definition = FormDefinitionFactory.create(
+            configuration={
+                "components": [
+                    {
+                        "type": "editgrid",
+                        "key": "editgrid",
+                        "components": [{"type": "textfield", "key": "textfield"}],
+                    }
+                ]
+            }
+        )
+        # populate the index
+        form_definition.configuration_wrapper
+
+        reloaded = FormDefinition.objects.get(pk=form_definition.pk)
+        # the stored hash is used, rather than hashing the configuration again
+        with patch.object(FormDefinition, "get_hash") as m_get_hash:
+            wrapper = reloaded.configuration_wrapper
+
+        m_get_hash.assert_not_called()
+
+        self.assertIsNotNone(wrapper._index)
+        # the lookups refer to the configuration of the instance
+        textfield = reloaded.configuration["components"][0]["components"][0]
+        self.assertIs(wrapper["editgrid.textfield"], textfield)
+        self.assertIs(wrapper.flattened_by_path["components.0.components.0"], textfield)
+
+        with self.subTest("configuration modified"):
+            reloaded.configuration["components"].insert(
+                0, {"type": "textfield", "key": "other"}
+            )
+            reloaded.save()
+            del reloaded.configuration_wrapper
+
+            wrapper = reloaded.configuration_wrapper
+
+            self.assertIsNone(wrapper._index)
+            self.assertEqual(wrapper["editgrid.textfield"]["key"], "textfield")
+
 
 class FormStepTestCase(TestCase):
     def test_str(self):
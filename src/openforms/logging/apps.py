@@ -1,7 +1,26 @@
 from django.apps import AppConfig
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
+from celery.signals import task_postrun, task_prerun
+
+from .buffer import flush_buffer, start_buffering
+
 
 class LoggingAppConfig(AppConfig):
     name = "openforms.logging"
     verbose_name = _("Logging")
+
+    def ready(self):
+        task_prerun.connect(start_task_log_buffer)
+        task_postrun.connect(flush_task_log_buffer)
+
+
+def start_task_log_buffer(**kwargs):
+    if settings.AUDITLOG_BUFFERED:
+        start_buffering()
+
+
+def flush_task_log_buffer(**kwargs):
+    if settings.AUDITLOG_BUFFERED:
+        flush_buffer()
@@ -0,0 +1,138 @@
+"""
+Buffered writing of timeline log entries.
+
+A single request or task typically creates many log entries. When buffering is
+enabled (see the ``AUDITLOG_BUFFERED`` setting), the entries created by
+:mod:`openforms.logging.logevent` are collected and written with a single
+``bulk_create`` at the end of the request or task, rather than with a query per entry.
+
+Like entries that are saved right away, entries created in a transaction that is rolled
+back are discarded - they are only added to the buffer once the transaction is
+committed. The entries keep the time of the event rather than the time they are
+written.
+
+If writing the entries in bulk fails, they are written one by one so that a single
+problematic entry does not cause the other entries to be lost.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Iterator
+
+from django.db import DatabaseError, transaction
+
+if TYPE_CHECKING:
+    from .models import TimelineLogProxy
+
+logger = logging.getLogger(__name__)
+
+_storage = threading.local()
+
+
+def get_buffer() -> list[TimelineLogProxy] | None:
+    """
+    Get the log entries buffered in the current thread, or ``None`` if the log entries
+    are not buffered.
+    """
+    return getattr(_storage, "entries", None)
+
+
+def add_to_buffer(entry: TimelineLogProxy) -> None:
+    """
+    Add the log entry to the buffer of the current thread once the current transaction
+    (if any) is committed.
+    """
+    transaction.on_commit(partial(_add_committed_entry, entry))
+
+
+def _add_committed_entry(entry: TimelineLogProxy) -> None:
+    if (buffer := get_buffer()) is not None:
+        buffer.append(entry)
+    else:
+        # the buffer was flushed before the transaction was committed
+        write_entries([entry])
+
+
+def start_buffering() -> None:
+    """
+    Start collecting the log entries created in the current thread.
+
+    Calls can be nested - the entries are written when the outermost call of
+    :func:`flush_buffer` is made.
+    """
+    _storage.depth = getattr(_storage, "depth", 0) + 1
+    if _storage.depth == 1:
+        _storage.entries = []
+
+
+def flush_buffer() -> None:
+    """
+    Write the buffered log entries and stop buffering.
+    """
+    depth = getattr(_storage, "depth", 0)
+    if depth == 0:
+        return
+    _storage.depth = depth - 1
+    if _storage.depth:
+        return
+
+    entries, _storage.entries = _storage.entries, None
+    write_entries(entries)
+
+
+@contextmanager
+def buffered_logs() -> Iterator[None]:
+    """
+    Buffer the log entries created within the block and write them on exit.
+    """
+    start_buffering()
+    try:
+        yield
+    finally:
+        flush_buffer()
+
+
+def _restore_timestamps(
+    entries: list[TimelineLogProxy], timestamps: list[datetime]
+) -> None:
+    # import locally or we'll get "AppRegistryNotReady: Apps aren't loaded yet."
+    from .models import TimelineLogProxy
+
+    # the timestamp field is set to the current time on insert (``auto_now_add``)
+    for entry, timestamp in zip(entries, timestamps, strict=True):
+        entry.timestamp = timestamp
+    TimelineLogProxy.objects.bulk_update(entries, ["timestamp"])
+
+
+def write_entries(entries: list[TimelineLogProxy]) -> None:
+    # import locally or we'll get "AppRegistryNotReady: Apps aren't loaded yet."
+    from .models import TimelineLogProxy
+
+    if not entries:
+        return
+
+    timestamps = [entry.timestamp for entry in entries]
+    try:
+        with transaction.atomic():
+            TimelineLogProxy.objects.bulk_create(entries)
+            _restore_timestamps(entries, timestamps)
+        return
+    except DatabaseError:
+        logger.warning(
+            "Writing %d log entries in bulk failed, writing them one by one.",
+            len(entries),
+            exc_info=True,
+        )
+
+    for entry, timestamp in zip(entries, timestamps, strict=True):
+        try:
+            with transaction.atomic():
+                entry.save()
+                _restore_timestamps([entry], [timestamp])
+        except DatabaseError:
+            logger.exception("Could not write log entry for event '%s'", entry.event)
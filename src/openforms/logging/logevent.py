@@ -6,11 +6,13 @@ from typing import TYPE_CHECKING
 
 from django.conf import settings
 from django.db.models import Model
+from django.utils import timezone
 
 from openforms.accounts.models import User
 from openforms.analytics_tools.models import AnalyticsToolsConfiguration
 from openforms.appointments.models import AppointmentInfo
 from openforms.forms.models import Form
+from openforms.logging.buffer import add_to_buffer, get_buffer
 from openforms.logging.constants import TimelineLogTags
 from openforms.payments.constants import PaymentStatus
 from openforms.plugins.plugin import AbstractBasePlugin
@@ -63,12 +65,18 @@ def _create_log(
         #   save it on the TimelineLogProxy model
         user = None
 
-    log_entry = TimelineLogProxy.objects.create(
+    log_entry = TimelineLogProxy(
         content_object=object,
         template=f"logging/events/{event}.txt",
         extra_data=extra_data,
         user=user,
+        # the time of the event, which may be written later
+        timestamp=timezone.now(),
     )
+    if get_buffer() is not None:
+        add_to_buffer(log_entry)
+    else:
+        log_entry.save()
     # logger.debug('Logged event in %s %s %s', event, object._meta.object_name, object.pk)
     return log_entry
 
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest
+
+from openforms.typing import RequestHandler
+
+from .buffer import buffered_logs
+
+
+class BufferedLogsMiddleware:
+    """
+    Write the log entries created while handling a request in bulk.
+
+    Only active if the ``AUDITLOG_BUFFERED`` setting is enabled.
+    """
+
+    def __init__(self, get_response: RequestHandler):
+        if not settings.AUDITLOG_BUFFERED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        with buffered_logs():
+            return self.get_response(request)
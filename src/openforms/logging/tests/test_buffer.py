@@ -0,0 +1,107 @@
+from unittest.mock import patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import DatabaseError, transaction
+from django.test import TestCase
+
+from freezegun import freeze_time
+
+from openforms.submissions.models import Submission
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from .. import logevent
+from ..buffer import buffered_logs, get_buffer
+from ..models import TimelineLogProxy
+
+
+class BufferedLogsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.submission = SubmissionFactory.create()
+        # populate the content type cache
+        ContentType.objects.get_for_model(Submission)
+
+    def test_entries_written_on_exit(self):
+        with buffered_logs():
+            with (
+                self.assertNumQueries(0),
+                self.captureOnCommitCallbacks(execute=True),
+            ):
+                logevent.submission_start(self.submission)
+                logevent.pdf_generation_start(self.submission)
+
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        events = TimelineLogProxy.objects.order_by("pk").values_list(
+            "extra_data__log_event", flat=True
+        )
+        self.assertEqual(list(events), ["submission_start", "pdf_generation_start"])
+        self.assertIsNone(get_buffer())
+
+    def test_nested_blocks_written_by_outermost_block(self):
+        with buffered_logs():
+            with (
+                buffered_logs(),
+                self.captureOnCommitCallbacks(execute=True),
+            ):
+                logevent.submission_start(self.submission)
+
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_entries_written_on_error(self):
+        with self.assertRaises(ZeroDivisionError):
+            with buffered_logs(), self.captureOnCommitCallbacks(execute=True):
+                logevent.submission_start(self.submission)
+                1 / 0
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_entries_written_one_by_one_if_bulk_create_fails(self):
+        with (
+            patch.object(
+                TimelineLogProxy.objects,
+                "bulk_create",
+                side_effect=DatabaseError("bulk insert failed"),
+            ),
+            self.assertLogs("openforms.logging.buffer", level="WARNING"),
+        ):
+            with buffered_logs():
+                with self.captureOnCommitCallbacks(execute=True):
+                    logevent.submission_start(self.submission)
+                    logevent.pdf_generation_start(self.submission)
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 2)
+
+    def test_entries_keep_the_time_of_the_event(self):
+        with freeze_time("2024-01-01T12:00:00Z") as frozen_time:
+            with buffered_logs():
+                with self.captureOnCommitCallbacks(execute=True):
+                    logevent.submission_start(self.submission)
+                    frozen_time.tick(5)
+                    logevent.pdf_generation_start(self.submission)
+                frozen_time.tick(5)
+
+        timestamps = TimelineLogProxy.objects.order_by("pk").values_list(
+            "timestamp", flat=True
+        )
+        self.assertEqual(
+            [timestamp.isoformat() for timestamp in timestamps],
+            ["2024-01-01T12:00:00+00:00", "2024-01-01T12:00:05+00:00"],
+        )
+
+    def test_entries_discarded_on_rollback(self):
+        with buffered_logs():
+            with self.captureOnCommitCallbacks(execute=True):
+                logevent.pdf_generation_start(self.submission)
+                with self.assertRaises(ZeroDivisionError):
+                    with transaction.atomic():
+                        logevent.submission_start(self.submission)
+                        1 / 0
+
+        events = TimelineLogProxy.objects.values_list(
+            "extra_data__log_event", flat=True
+        )
+        self.assertEqual(list(events), ["pdf_generation_start"])
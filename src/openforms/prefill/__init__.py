@@ -33,8 +33,15 @@ So, to recap:
 from __future__ import annotations
 
 import logging
+import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import as_completed
+from typing import TYPE_CHECKING, Any, Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
 
 import elasticapm
 from glom import Path, PathAccessError, assign, glom
@@ -45,19 +52,24 @@ from openforms.variables.constants import FormVariableSources
 
 if TYPE_CHECKING:
     from openforms.formio.service import FormioConfigurationWrapper
-    from openforms.submissions.models import Submission
+    from openforms.submissions.models import Submission, SubmissionValueVariable
 
     from .registry import Registry
 
 logger = logging.getLogger(__name__)
 
+# interval at which requests waiting for the prefill results check for progress
+WAIT_POLL_INTERVAL = 0.1  # seconds
 
-@elasticapm.capture_span(span_type="app.prefill")
-def _fetch_prefill_values(
+
+def _iter_prefill_values(
     grouped_fields: dict[str, dict[str, list[str]]],
     submission: Submission,
     register: Registry,
-) -> dict[str, dict[str, Any]]:
+) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """
+    Invoke the plugins concurrently and yield their results as they arrive.
+    """
     # local import to prevent AppRegistryNotReady:
     from openforms.logging import logevent
 
@@ -71,6 +83,7 @@ def _fetch_prefill_values(
         if not plugin.is_enabled:
             raise PluginNotEnabled()
 
+        start = time.perf_counter()
         try:
             values = plugin.get_prefill_values(submission, fields, identifier_role)
         except Exception as e:
@@ -82,19 +95,41 @@ def _fetch_prefill_values(
                 logevent.prefill_retrieve_success(submission, plugin, fields)
             else:
                 logevent.prefill_retrieve_empty(submission, plugin, fields)
+        finally:
+            duration = time.perf_counter() - start
+            logger.info(
+                "Prefill plugin '%s' took %.3fs",
+                plugin_id,
+                duration,
+                extra={
+                    "plugin_id": plugin_id,
+                    "identifier_role": identifier_role,
+                    "duration": duration,
+                },
+            )
 
         return plugin_id, identifier_role, values
 
-    invoke_plugin_args = []
-    for plugin_id, field_groups in grouped_fields.items():
-        for identifier_role, fields in field_groups.items():
-            invoke_plugin_args.append((plugin_id, identifier_role, fields))
-
     with parallel() as executor:
-        results = executor.map(invoke_plugin, invoke_plugin_args)
+        futures = [
+            executor.submit(invoke_plugin, (plugin_id, identifier_role, fields))
+            for plugin_id, field_groups in grouped_fields.items()
+            for identifier_role, fields in field_groups.items()
+        ]
+        for future in as_completed(futures):
+            yield future.result()
 
+
+@elasticapm.capture_span(span_type="app.prefill")
+def _fetch_prefill_values(
+    grouped_fields: dict[str, dict[str, list[str]]],
+    submission: Submission,
+    register: Registry,
+) -> dict[str, dict[str, Any]]:
     collected_results = {}
-    for plugin_id, identifier_role, values_dict in list(results):
+    for plugin_id, identifier_role, values_dict in _iter_prefill_values(
+        grouped_fields, submission, register
+    ):
         assign(
             collected_results,
             Path(plugin_id, identifier_role),
@@ -105,6 +140,53 @@ def _fetch_prefill_values(
     return collected_results
 
 
+def _group_fields(
+    variables: list[SubmissionValueVariable],
+) -> dict[str, dict[str, list[str]]]:
+    # grouped_fields is a dict of the following shape:
+    # {"plugin_id": {"identifier_role": ["attr_1", "attr_2"]}}
+    # "identifier_role" is either "main" or "authorizee"
+    grouped_fields: defaultdict[str, defaultdict[str, list[str]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for variable in variables:
+        plugin_id = variable.form_variable.prefill_plugin
+        identifier_role = variable.form_variable.prefill_identifier_role
+        attribute_name = variable.form_variable.prefill_attribute
+
+        grouped_fields[plugin_id][identifier_role].append(attribute_name)
+    return grouped_fields
+
+
+def _get_prefill_data(
+    variables: list[SubmissionValueVariable],
+    results: dict[str, dict[str, Any]],
+    submission: Submission,
+) -> dict[str, Any]:
+    from openforms.formio.service import normalize_value_for_component
+
+    total_config_wrapper = submission.total_configuration_wrapper
+    prefill_data = {}
+    for variable in variables:
+        try:
+            prefill_value = glom(
+                results,
+                Path(
+                    variable.form_variable.prefill_plugin,
+                    variable.form_variable.prefill_identifier_role,
+                    variable.form_variable.prefill_attribute,
+                ),
+            )
+        except PathAccessError:
+            continue
+        else:
+            if variable.form_variable.source == FormVariableSources.component:
+                component = total_config_wrapper[variable.key]
+                prefill_value = normalize_value_for_component(component, prefill_value)
+            prefill_data[variable.key] = prefill_value
+    return prefill_data
+
+
 def inject_prefill(
     configuration_wrapper: FormioConfigurationWrapper, submission: Submission
 ) -> None:
@@ -159,48 +241,201 @@ def prefill_variables(submission: Submission, register: Registry | None = None)
     be used to fetch the value. If ``register`` is not specified, the default registry instance
     will be used.
     """
-    from openforms.formio.service import normalize_value_for_component
-
     from .registry import register as default_register
 
     register = register or default_register
 
     state = submission.load_submission_value_variables_state()
     variables_to_prefill = state.get_prefill_variables()
+    grouped_fields = _group_fields(variables_to_prefill)
 
-    # grouped_fields is a dict of the following shape:
-    # {"plugin_id": {"identifier_role": ["attr_1", "attr_2"]}}
-    # "identifier_role" is either "main" or "authorizee"
-    grouped_fields: defaultdict[str, defaultdict[str, list[str]]] = defaultdict(
-        lambda: defaultdict(list)
+    results = _fetch_prefill_values(grouped_fields, submission, register)
+
+    prefill_data = _get_prefill_data(variables_to_prefill, results, submission)
+    state.save_prefill_data(prefill_data)
+
+
+def _get_pending_cache_key(submission: Submission) -> str:
+    return f"prefill:pending:{submission.uuid}"
+
+
+def schedule_prefill_variables(submission: Submission) -> None:
+    """
+    Prefill the submission variables in a background task.
+
+    The plugins whose results are pending are recorded, so that requests needing the
+    prefilled values can wait for them with :func:`wait_for_prefill_variables`.
+    """
+    from .tasks import prefill_submission_variables
+
+    state = submission.load_submission_value_variables_state()
+    pending: defaultdict[str, list[str]] = defaultdict(list)
+    for variable in state.get_prefill_variables():
+        pending[variable.form_variable.prefill_plugin].append(variable.key)
+    if not pending:
+        return
+
+    # nobody waits longer than the timeout, even if the task never runs
+    timeout = settings.PREFILL_BACKGROUND_WAIT_TIMEOUT
+    cache.set(
+        _get_pending_cache_key(submission),
+        (time.time() + timeout, dict(pending)),
+        timeout=timeout,
     )
-    for variable in variables_to_prefill:
-        plugin_id = variable.form_variable.prefill_plugin
-        identifier_role = variable.form_variable.prefill_identifier_role
-        attribute_name = variable.form_variable.prefill_attribute
+    transaction.on_commit(lambda: prefill_submission_variables.delay(submission.pk))
 
-        grouped_fields[plugin_id][identifier_role].append(attribute_name)
 
-    results = _fetch_prefill_values(grouped_fields, submission, register)
+def prefill_variables_in_background(
+    submission: Submission, register: Registry | None = None
+) -> None:
+    """
+    Fetch and store the prefill values scheduled by :func:`schedule_prefill_variables`.
 
-    total_config_wrapper = submission.total_configuration_wrapper
-    prefill_data = {}
-    for variable in variables_to_prefill:
-        try:
-            prefill_value = glom(
-                results,
-                Path(
-                    variable.form_variable.prefill_plugin,
-                    variable.form_variable.prefill_identifier_role,
-                    variable.form_variable.prefill_attribute,
-                ),
+    The values are stored per plugin as soon as its results arrive. Values that were
+    already stored or modified (because waiting for the results timed out) are not
+    overwritten, and nothing is stored anymore once the submission is completed.
+    """
+    from openforms.submissions.constants import SubmissionValueVariableSources
+    from openforms.submissions.models import Submission, SubmissionValueVariable
+
+    from .registry import register as default_register
+
+    register = register or default_register
+    cache_key = _get_pending_cache_key(submission)
+
+    state = submission.load_submission_value_variables_state()
+    variables_to_prefill = state.get_prefill_variables()
+    # the values of the variables that were already stored when the submission started
+    initial_values = {
+        variable.key: variable.value for variable in variables_to_prefill if variable.pk
+    }
+    grouped_fields = _group_fields(variables_to_prefill)
+    remaining_roles = {
+        plugin_id: set(field_groups)
+        for plugin_id, field_groups in grouped_fields.items()
+    }
+
+    try:
+        for plugin_id, identifier_role, values in _iter_prefill_values(
+            grouped_fields, submission, register
+        ):
+            variables = [
+                variable
+                for variable in variables_to_prefill
+                if variable.form_variable.prefill_plugin == plugin_id
+                and variable.form_variable.prefill_identifier_role == identifier_role
+            ]
+            prefill_data = _get_prefill_data(
+                variables, {plugin_id: {identifier_role: values}}, submission
             )
-        except PathAccessError:
-            continue
-        else:
-            if variable.form_variable.source == FormVariableSources.component:
-                component = total_config_wrapper[variable.key]
-                prefill_value = normalize_value_for_component(component, prefill_value)
-            prefill_data[variable.key] = prefill_value
 
-    state.save_prefill_data(prefill_data)
+            with transaction.atomic():
+                # completing the submission updates (and locks) the same row
+                is_completed = (
+                    Submission.objects.select_for_update()
+                    .filter(pk=submission.pk, completed_on__isnull=False)
+                    .exists()
+                )
+                if is_completed:
+                    logger.info(
+                        "Discarding the prefill results of completed submission %s",
+                        submission.uuid,
+                    )
+                    break
+
+                for variable in variables:
+                    if variable.key not in prefill_data:
+                        continue
+                    variable.value = prefill_data[variable.key]
+                    variable.source = SubmissionValueVariableSources.prefill
+                    if (
+                        not variable.pk
+                        or variable.form_variable.source
+                        != FormVariableSources.user_defined
+                    ):
+                        continue
+                    # user defined variables are created with their initial value when
+                    # the submission starts - they may have been modified since
+                    if (initial_value := initial_values[variable.key]) is None:
+                        # SQL NULL or JSON null
+                        unchanged = Q(value__isnull=True) | Q(value=None)
+                    else:
+                        unchanged = Q(value=initial_value)
+                    SubmissionValueVariable.objects.filter(
+                        unchanged, pk=variable.pk
+                    ).update(value=variable.value, source=variable.source)
+
+                SubmissionValueVariable.objects.bulk_create(
+                    [variable for variable in variables if not variable.pk],
+                    ignore_conflicts=True,
+                )
+
+            remaining_roles[plugin_id].discard(identifier_role)
+            if remaining_roles[plugin_id]:
+                continue
+            if (entry := cache.get(cache_key)) is None:
+                continue
+            expires_at, pending = entry
+            pending.pop(plugin_id, None)
+            if (timeout := expires_at - time.time()) > 0:
+                cache.set(cache_key, (expires_at, pending), timeout=timeout)
+    finally:
+        cache.delete(cache_key)
+
+
+def is_prefill_pending(submission: Submission) -> bool:
+    """
+    Check if the background prefill of the submission variables is still running.
+    """
+    return cache.get(_get_pending_cache_key(submission)) is not None
+
+
+def wait_for_prefill_variables(
+    submission: Submission, keys: set[str] | None = None
+) -> None:
+    """
+    Wait until the background prefill results for the given variable keys are stored.
+
+    :param keys: The keys (or paths) of the variables that are needed. If ``None``,
+      wait for all the prefill results.
+    """
+    from openforms.submissions.logic.dependencies import is_affected
+
+    cache_key = _get_pending_cache_key(submission)
+
+    def get_needed_plugins() -> list[str]:
+        if (entry := cache.get(cache_key)) is None:
+            return []
+        _, pending = entry
+        return [
+            plugin_id
+            for plugin_id, variable_keys in pending.items()
+            if keys is None or any(is_affected(key, keys) for key in variable_keys)
+        ]
+
+    if not (plugins := get_needed_plugins()):
+        return
+
+    start = time.perf_counter()
+    deadline = start + settings.PREFILL_BACKGROUND_WAIT_TIMEOUT
+    while plugins:
+        if time.perf_counter() >= deadline:
+            logger.warning(
+                "Timed out waiting for the prefill results of submission %s",
+                submission.uuid,
+                extra={"submission": submission.uuid, "plugins": plugins},
+            )
+            break
+        time.sleep(WAIT_POLL_INTERVAL)
+        plugins = get_needed_plugins()
+
+    duration = time.perf_counter() - start
+    logger.info(
+        "Waited %.3fs for the prefill results of submission %s",
+        duration,
+        submission.uuid,
+        extra={"submission": submission.uuid, "duration": duration},
+    )
+    # discard the state that may have been loaded before the results were stored
+    submission.load_submission_value_variables_state(refresh=True)
+    submission._prefilled_data = None
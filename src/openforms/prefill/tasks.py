@@ -0,0 +1,24 @@
+import logging
+
+from openforms.celery import app
+from openforms.submissions.models import Submission
+
+from . import prefill_variables_in_background
+
+__all__ = ["prefill_submission_variables"]
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=True)
+def prefill_submission_variables(submission_id: int) -> None:
+    """
+    Fetch the prefill values for a submission that was just started.
+
+    See :func:`openforms.prefill.schedule_prefill_variables`.
+    """
+    submission = Submission.objects.select_related("form", "auth_info").get(
+        id=submission_id
+    )
+    logger.debug("Prefilling the variables of submission %s", submission.uuid)
+    prefill_variables_in_background(submission)
@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from openforms.forms.tests.factories import FormStepFactory
+from openforms.submissions.constants import SubmissionValueVariableSources
+from openforms.submissions.models import SubmissionValueVariable
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionValueVariableFactory,
+)
+from openforms.utils.tests.cache import clear_caches
+from openforms.variables.constants import FormVariableSources
+
+from .. import (
+    _get_pending_cache_key,
+    is_prefill_pending,
+    prefill_variables_in_background,
+    schedule_prefill_variables,
+    wait_for_prefill_variables,
+)
+from .test_prefill_variables import CONFIGURATION
+
+
+@override_settings(PREFILL_IN_BACKGROUND=True, PREFILL_BACKGROUND_WAIT_TIMEOUT=10)
+class PrefillInBackgroundTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        form_step = FormStepFactory.create(form_definition__configuration=CONFIGURATION)
+        self.submission = SubmissionFactory.create(form=form_step.form)
+
+    @patch("openforms.prefill.tasks.prefill_submission_variables.delay")
+    def test_schedule_records_pending_plugins(self, m_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule_prefill_variables(self.submission)
+
+        m_delay.assert_called_once_with(self.submission.pk)
+        _, pending = cache.get(_get_pending_cache_key(self.submission))
+        self.assertEqual(pending, {"demo": ["voornamen", "age"]})
+
+    @patch(
+        "openforms.prefill._iter_prefill_values",
+        return_value=iter(
+            [("demo", "main", {"random_string": "Not random", "random_number": 123})]
+        ),
+    )
+    @patch("openforms.prefill.tasks.prefill_submission_variables.delay")
+    def test_values_stored_in_background(self, m_delay, m_iter):
+        schedule_prefill_variables(self.submission)
+        self.assertTrue(is_prefill_pending(self.submission))
+
+        prefill_variables_in_background(self.submission)
+
+        self.assertFalse(is_prefill_pending(self.submission))
+        state = self.submission.load_submission_value_variables_state(refresh=True)
+        voornamen = state.get_variable(key="voornamen")
+        self.assertEqual(voornamen.value, "Not random")
+        self.assertEqual(voornamen.source, SubmissionValueVariableSources.prefill)
+        self.assertIsNotNone(voornamen.pk)
+        self.assertEqual(state.get_variable(key="age").value, 123)
+
+    @patch(
+        "openforms.prefill._iter_prefill_values",
+        return_value=iter(
+            [("demo", "main", {"random_string": "Not random", "random_number": 123})]
+        ),
+    )
+    @patch("openforms.prefill.tasks.prefill_submission_variables.delay")
+    def test_modified_user_defined_variables_not_overwritten(self, m_delay, m_iter):
+        unchanged, modified = [
+            SubmissionValueVariableFactory.create(
+                submission=self.submission,
+                key=key,
+                value=None,
+                source=SubmissionValueVariableSources.user_input,
+                form_variable__source=FormVariableSources.user_defined,
+                form_variable__prefill_plugin="demo",
+                form_variable__prefill_attribute="random_string",
+            )
+            for key in ("unchanged", "modified")
+        ]
+        schedule_prefill_variables(self.submission)
+        # e.g. by logic, after waiting for the prefill results timed out
+        SubmissionValueVariable.objects.filter(pk=modified.pk).update(value="Changed")
+
+        prefill_variables_in_background(self.submission)
+
+        unchanged.refresh_from_db()
+        modified.refresh_from_db()
+        self.assertEqual(unchanged.value, "Not random")
+        self.assertEqual(unchanged.source, SubmissionValueVariableSources.prefill)
+        self.assertEqual(modified.value, "Changed")
+        self.assertEqual(modified.source, SubmissionValueVariableSources.user_input)
+
+    @patch(
+        "openforms.prefill._iter_prefill_values",
+        return_value=iter(
+            [("demo", "main", {"random_string": "Not random", "random_number": 123})]
+        ),
+    )
+    @patch("openforms.prefill.tasks.prefill_submission_variables.delay")
+    def test_values_not_stored_for_completed_submission(self, m_delay, m_iter):
+        schedule_prefill_variables(self.submission)
+        self.submission.completed_on = timezone.now()
+        self.submission.save()
+
+        with self.assertLogs("openforms.prefill", level="INFO"):
+            prefill_variables_in_background(self.submission)
+
+        self.assertFalse(
+            SubmissionValueVariable.objects.filter(submission=self.submission).exists()
+        )
+        self.assertFalse(is_prefill_pending(self.submission))
+
+    @patch("openforms.prefill.time.sleep")
+    @patch("openforms.prefill.tasks.prefill_submission_variables.delay")
+    def test_wait_only_for_needed_variables(self, m_delay, m_sleep):
+        schedule_prefill_variables(self.submission)
+
+        with self.subTest("not needed"):
+            wait_for_prefill_variables(self.submission, keys={"other"})
+
+            m_sleep.assert_not_called()
+
+        with self.subTest("needed, but timed out"):
+            with override_settings(PREFILL_BACKGROUND_WAIT_TIMEOUT=0):
+                with self.assertLogs("openforms.prefill", level="WARNING"):
+                    wait_for_prefill_variables(self.submission, keys={"age"})
@@ -9,9 +9,8 @@ The clients used are:
   in the form builder
 """
 
-from zgw_consumers.client import build_client
-
 from openforms.contrib.zgw.clients import CatalogiClient, DocumentenClient, ZakenClient
+from openforms.utils.api_clients import build_pooled_client
 
 from .models import ZGWApiGroupConfig
 
@@ -23,16 +22,16 @@ class NoServiceConfigured(RuntimeError):
 def get_zaken_client(config: ZGWApiGroupConfig) -> ZakenClient:
     if not (service := config.zrc_service):
         raise NoServiceConfigured("No Zaken API service configured!")
-    return build_client(service, client_factory=ZakenClient)
+    return build_pooled_client(service, client_factory=ZakenClient)
 
 
 def get_documents_client(config: ZGWApiGroupConfig) -> DocumentenClient:
     if not (service := config.drc_service):
         raise NoServiceConfigured("No Documents API service configured!")
-    return build_client(service, client_factory=DocumentenClient)
+    return build_pooled_client(service, client_factory=DocumentenClient)
 
 
 def get_catalogi_client(config: ZGWApiGroupConfig) -> CatalogiClient:
     if not (service := config.ztc_service):
         raise NoServiceConfigured("No Catalogi API service configured!")
-    return build_client(service, client_factory=CatalogiClient)
+    return build_pooled_client(service, client_factory=CatalogiClient)
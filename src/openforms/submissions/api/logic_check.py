@@ -0,0 +1,147 @@
+"""
+Delta responses of the logic check endpoint.
+
+The logic check endpoint is called on (debounced) user input and returns the complete
+configuration of the step, while typically only a few components change. Clients opt
+in to delta responses with the ``delta`` query parameter. Every response then has an
+``ETag`` header identifying the configuration of the step, which the client passes in
+the ``delta`` query parameter of the next call to only receive the components that
+changed since.
+
+The ``data`` of the step is always returned completely. It only contains the values
+overridden by the logic rules, which must be applied by the client even if the same
+value was returned before, since the user may have changed the value in between.
+
+The digests of the components of the responses are kept in the cache for a limited
+time (:const:`STATE_CACHE_TIMEOUT`). If the previous state is not known (anymore), or
+components were added or removed, the complete representation is returned.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from openforms.formio.typing import Component
+from openforms.formio.utils import iter_components
+
+from ..models import SubmissionStep
+
+STATE_CACHE_TIMEOUT = 15 * 60  # seconds
+
+# the nested components are compared (and returned) separately
+NESTED_COMPONENTS_PROPERTIES = ("components", "columns")
+
+
+def _get_digest(value: Any) -> str:
+    content = json.dumps(value, cls=DjangoJSONEncoder, sort_keys=True)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _get_properties(component: Component) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in component.items()
+        if key not in NESTED_COMPONENTS_PROPERTIES
+    }
+
+
+def _get_cache_key(submission_step: SubmissionStep, etag: str) -> str:
+    return (
+        f"submissions:logic-check:{submission_step.submission.uuid}:"
+        f"{submission_step.form_step.uuid}:{etag}"
+    )
+
+
+@dataclass
+class StepState:
+    """
+    The digests of the components of a step representation.
+    """
+
+    components: dict[str, str]
+
+    @classmethod
+    def from_representation(cls, step: dict[str, Any]) -> StepState | None:
+        """
+        Determine the state of the (serialized) step, or ``None`` if the component
+        keys are not unique.
+        """
+        components = {}
+        for component in iter_components(step["form_step"]["configuration"]):
+            if component["key"] in components:
+                return None
+            components[component["key"]] = _get_digest(_get_properties(component))
+        return cls(components=components)
+
+    @property
+    def etag(self) -> str:
+        return _get_digest(self.components)
+
+    def save(self, submission_step: SubmissionStep) -> None:
+        cache.set(
+            _get_cache_key(submission_step, self.etag),
+            self.components,
+            timeout=STATE_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def load(cls, submission_step: SubmissionStep, etag: str) -> StepState | None:
+        if (components := cache.get(_get_cache_key(submission_step, etag))) is None:
+            return None
+        return cls(components=components)
+
+    def get_delta(
+        self, step: dict[str, Any], previous: StepState
+    ) -> dict[str, Any] | None:
+        """
+        Build the representation of the step with only the changed component
+        properties, or ``None`` if components were added or removed.
+
+        The properties of a changed component replace all the properties of the
+        component known by the client, except for the nested components.
+        """
+        if self.components.keys() != previous.components.keys():
+            return None
+
+        changed_components = {
+            key
+            for key, digest in self.components.items()
+            if previous.components[key] != digest
+        }
+        configuration = {
+            component["key"]: _get_properties(component)
+            for component in iter_components(step["form_step"]["configuration"])
+            if component["key"] in changed_components
+        }
+        return {
+            **{field: value for field, value in step.items() if field != "form_step"},
+            "configuration": configuration,
+        }
+
+
+def get_representation(
+    submission_step: SubmissionStep, representation: dict[str, Any], delta: str
+) -> tuple[dict[str, Any], str | None]:
+    """
+    Apply the delta response mode to the representation of the logic check.
+
+    :param delta: The ETag of the previous response, or an empty string to only
+      start tracking the state of the step.
+    :returns: The (delta) representation and the ETag of the current state, if it can
+      be tracked.
+    """
+    if (state := StepState.from_representation(representation["step"])) is None:
+        return representation, None
+
+    state.save(submission_step)
+    previous_etag = delta.strip('"')
+    if previous_etag and (previous := StepState.load(submission_step, previous_etag)):
+        if (step := state.get_delta(representation["step"], previous)) is not None:
+            representation = {**representation, "step": step}
+    return representation, state.etag
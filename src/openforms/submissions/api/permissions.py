@@ -13,6 +13,7 @@ from ..tokens import (
     submission_report_token_generator,
     submission_status_token_generator,
 )
+from ..utils import get_session_list
 from .validation import is_step_unexpectedly_incomplete
 
 
@@ -20,7 +21,7 @@ def owns_submission(request: Request, submission_uuid: str | UUID) -> bool:
     # The assumption is that auth plugin requirements like LoA
     # MUST be checked upon/before adding the submission uuid to the session
     # therefore "owning a submission" means those requirements were met.
-    active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY, [])
+    active_submissions = get_session_list(request.session, SUBMISSIONS_SESSION_KEY)
     # Use str so this works with both UUIDs and UUIDs in string format
     return str(submission_uuid) in active_submissions
 
@@ -34,7 +35,7 @@ class AnyActiveSubmissionPermission(permissions.BasePermission):
         if getattr(view, "action", None) in ("create",):
             return True
 
-        active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY)
+        active_submissions = get_session_list(request.session, SUBMISSIONS_SESSION_KEY)
         if not active_submissions:
             return False
 
@@ -75,7 +76,7 @@ class ActiveSubmissionPermission(AnyActiveSubmissionPermission):
         return owns_submission(request, submission_uuid)
 
     def filter_queryset(self, request: Request, view: APIView, queryset):
-        active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY)
+        active_submissions = get_session_list(request.session, SUBMISSIONS_SESSION_KEY)
         if not active_submissions:
             return queryset.none()
         return queryset.filter(uuid__in=active_submissions)
@@ -87,13 +88,13 @@ class OwnsTemporaryUploadPermission(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
+        active_uploads = get_session_list(request.session, UPLOADS_SESSION_KEY)
         if not active_uploads:
             return False
         return True
 
     def has_object_permission(self, request: Request, view: APIView, obj) -> bool:
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
+        active_uploads = get_session_list(request.session, UPLOADS_SESSION_KEY)
 
         upload_url_kwarg = view.lookup_url_kwarg or view.lookup_field
         upload_uuid = view.kwargs[upload_url_kwarg]
@@ -101,7 +102,7 @@ class OwnsTemporaryUploadPermission(permissions.BasePermission):
         return str(upload_uuid) in active_uploads
 
     def filter_queryset(self, request: Request, view: APIView, queryset):
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
+        active_uploads = get_session_list(request.session, UPLOADS_SESSION_KEY)
         if not active_uploads:
             return queryset.none()
         return queryset.filter(uuid__in=active_uploads)
@@ -2,6 +2,7 @@ import contextlib
 import logging
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
@@ -22,15 +23,21 @@ from openforms.api.serializers import ExceptionSerializer, ValidationErrorSerial
 from openforms.api.throttle_classes import PollingRateThrottle
 from openforms.authentication.service import is_authenticated_with_an_allowed_plugin
 from openforms.formio.service import FormioData
-from openforms.forms.models import FormStep
+from openforms.forms.models import FormLogic, FormStep
 from openforms.logging import logevent
-from openforms.prefill import prefill_variables
+from openforms.prefill import (
+    is_prefill_pending,
+    prefill_variables,
+    schedule_prefill_variables,
+    wait_for_prefill_variables,
+)
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
 
 from ..attachments import attach_uploads_to_submission_step
 from ..constants import PostSubmissionEvents
 from ..exceptions import FormDeactivated, FormMaintenance
 from ..form_logic import check_submission_logic, evaluate_form_logic
+from ..logic.dependencies import get_input_keys
 from ..models import Submission, SubmissionStep
 from ..models.submission_step import DirtyData
 from ..parsers import (
@@ -46,6 +53,7 @@ from ..utils import (
     initialise_user_defined_variables,
     remove_submission_from_session,
 )
+from .logic_check import get_representation
 from .mixins import SubmissionCompletionMixin
 from .permissions import (
     ActiveSubmissionPermission,
@@ -178,7 +186,10 @@ class SubmissionViewSet(
 
         logevent.submission_start(serializer.instance)
 
-        prefill_variables(serializer.instance)
+        if settings.PREFILL_IN_BACKGROUND:
+            schedule_prefill_variables(serializer.instance)
+        else:
+            prefill_variables(serializer.instance)
         initialise_user_defined_variables(serializer.instance)
 
     @extend_schema(
@@ -309,6 +320,8 @@ class SubmissionViewSet(
         ---
         """
         submission = self.get_object()
+        # don't complete the submission with prefill results still being retrieved
+        self._wait_for_prefill_variables(submission)
 
         serializer = get_submission_completion_serializer(submission, request=request)
         serializer.is_valid(raise_exception=True)
@@ -396,6 +409,11 @@ class SubmissionViewSet(
         serializer.save()
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @staticmethod
+    def _wait_for_prefill_variables(submission: Submission) -> None:
+        if settings.PREFILL_IN_BACKGROUND and is_prefill_pending(submission):
+            wait_for_prefill_variables(submission)
+
     def retrieve(self, request, *args, **kwargs):
         logevent.submission_details_view_api(self.get_object(), request.user)
         return super().retrieve(request, *args, **kwargs)
@@ -410,6 +428,7 @@ class SubmissionViewSet(
     @action(detail=True, methods=["get"], url_name="summary", pagination_class=None)
     def summary(self, request, *args, **kwargs):
         submission = self.get_object()
+        self._wait_for_prefill_variables(submission)
         summary_data = submission.render_summary_page()
         return Response(summary_data)
 
@@ -499,6 +518,10 @@ class SubmissionStepViewSet(
         )
         if submission_step is None:
             raise NotFound(_("Invalid form step reference given."))
+        # the step data and the logic (also checked by the permissions) may depend on
+        # prefill results that are still being retrieved
+        if settings.PREFILL_IN_BACKGROUND and is_prefill_pending(submission):
+            self._wait_for_prefill_variables(submission_step)
         self.check_object_permissions(self.request, submission_step)
 
         submission = submission_step.submission
@@ -507,6 +530,18 @@ class SubmissionStepViewSet(
 
         return submission_step
 
+    @staticmethod
+    def _wait_for_prefill_variables(submission_step: SubmissionStep) -> None:
+        submission = submission_step.submission
+        rules = FormLogic.objects.filter(form=submission.form)
+        keys = get_input_keys(submission.form, rules)
+        if keys is not None:
+            configuration_wrapper = (
+                submission_step.form_step.form_definition.configuration_wrapper
+            )
+            keys |= set(configuration_wrapper.component_map)
+        wait_for_prefill_variables(submission, keys=keys)
+
     @extend_schema(
         summary=_("Store submission step data"),
         responses={
@@ -603,6 +638,22 @@ class SubmissionStepViewSet(
         summary=_("Apply/check form logic"),
         description=_("Apply/check the logic rules specified on the form step."),
         request=FormDataSerializer,
+        parameters=[
+            OpenApiParameter(
+                "delta",
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                description=_(
+                    "Opt in to delta responses. Pass the `ETag` header of the "
+                    "previous response to only receive the components (keyed by "
+                    "component key, in `step.configuration`) that changed since, or "
+                    "an empty value for the first call. The `step.data` is always "
+                    "returned completely. The complete step (with `step.formStep`) "
+                    "is returned if the previous state is not known."
+                ),
+                required=False,
+            ),
+        ],
         responses={
             200: SubmissionStateLogicSerializer,
             403: ExceptionSerializer,
@@ -641,4 +692,11 @@ class SubmissionStepViewSet(
             instance=SubmissionStateLogic(submission=submission, step=submission_step),
             context={"request": request, "unsaved_data": data},
         )
-        return Response(submission_state_logic_serializer.data)
+        if (delta := request.query_params.get("delta")) is None:
+            return Response(submission_state_logic_serializer.data)
+
+        representation, etag = get_representation(
+            submission_step, submission_state_logic_serializer.data, delta=delta
+        )
+        headers = {"ETag": f'"{etag}"'} if etag else None
+        return Response(representation, headers=headers)
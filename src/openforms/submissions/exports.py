@@ -1,19 +1,33 @@
+import csv
 import dataclasses
-from typing import Iterator
+import json
+from tempfile import TemporaryFile
+from typing import IO, Any, Iterable, Iterator
 
-from django.http import HttpResponse
+from django.db.models import prefetch_related_objects
+from django.http import FileResponse, HttpResponseBase, StreamingHttpResponse
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
 from tablib.formats._json import serialize_objects_handler
 
+from openforms.forms.models import Form
+
 from .models import Submission
 from .query import SubmissionQuerySet
 from .rendering.base import Node
 from .rendering.constants import RenderModes
 from .rendering.renderer import Renderer
 
+EXPORT_CHUNK_SIZE = 250
+"""
+Number of submissions (and their steps and variables) loaded from the database at once.
+"""
+
 
 @dataclasses.dataclass
 class FileType:
@@ -39,19 +53,59 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
-def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
+def iter_export_submissions(queryset: SubmissionQuerySet) -> Iterator[Submission]:
     """
-    Turn a submissions queryset into a tablib dataset for export.
+    Iterate over the submissions to export without loading all of them in memory.
+
+    The submissions are fetched in chunks, with their steps and variables loaded in
+    bulk for each chunk. The form (and its variables and logic rules) is loaded once
+    and shared by all its submissions.
+    """
+    forms: dict[int, Form] = {}
+    submissions = queryset.prefetch_related(
+        "submissionstep_set", "submissionvaluevariable_set"
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    for submission in submissions:
+        if (form := forms.get(submission.form_id)) is None:
+            form = forms[submission.form_id] = submission.form
+            prefetch_related_objects([form], "formvariable_set")
+        submission.form = form
+        yield submission
+
+
+def _get_row(submission: Submission, translation_enabled: bool) -> list[Any]:
+    inzending_datum = (
+        make_naive(submission.completed_on) if submission.completed_on else None
+    )
+    submission_data = [
+        submission.form.admin_name,
+        inzending_datum,
+    ]
+    if translation_enabled:
+        submission_data.append(submission.language_code)
+    submission_data += [
+        data_node.value for data_node in iter_submission_data_nodes(submission)
+    ]
+    return submission_data
+
+
+def iter_submission_export_rows(queryset: SubmissionQuerySet) -> Iterator[list[Any]]:
+    """
+    Turn a submissions queryset into rows for export.
+
+    The first row contains the headers, followed by a row for every submission. Nothing
+    is yielded for an empty queryset.
 
     .. note:: the queryset of submissions must all be of the same form!
     """
     # queryset *could* be empty
-    if not queryset:
-        return tablib.Dataset()
+    first_submission = queryset.first()
+    if first_submission is None:
+        return
 
-    first_submission = queryset[0]
+    translation_enabled = first_submission.form.translation_enabled
     headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
+    if translation_enabled:
         headers.append("Taalcode")
 
     for data_node in iter_submission_data_nodes(first_submission):
@@ -59,37 +113,128 @@ def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
             headers.append(data_node.component["key"])
         elif hasattr(data_node, "variable"):
             headers.append(data_node.variable.key)
+    yield headers
+
+    for submission in iter_export_submissions(queryset):
+        yield _get_row(submission, translation_enabled)
+
+
+def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
+    """
+    Turn a submissions queryset into a tablib dataset for export.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    rows = iter_submission_export_rows(queryset)
+    if (headers := next(rows, None)) is None:
+        return tablib.Dataset()
 
     data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
+    return data
+
+
+class _Echo:
+    """
+    File-like object returning what is written, to stream the output of a CSV writer.
+    """
+
+    def write(self, value: str) -> str:
+        return value
 
-    for submission in queryset:
-        inzending_datum = (
-            make_naive(submission.completed_on) if submission.completed_on else None
+
+def _stream_csv(rows: Iterable[list[Any]]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _stream_json(rows: Iterable[list[Any]]) -> Iterator[str]:
+    # same output as the tablib JSON format, but one record at a time
+    rows = iter(rows)
+    if (headers := next(rows, None)) is None:
+        yield "[]"
+        return
+
+    yield "["
+    for index, row in enumerate(rows):
+        record = json.dumps(
+            dict(zip(headers, row)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
         )
-        submission_data = [
-            submission.form.admin_name,
-            inzending_datum,
-        ]
-        if first_submission.form.translation_enabled:
-            submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
-    return data
+        yield f", {record}" if index else record
+    yield "]"
+
+
+def _write_xlsx(rows: Iterable[list[Any]], file: IO[bytes]) -> None:
+    # write-only mode flushes the rows to disk, keeping the memory usage constant
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title="Tablib Dataset")
+    worksheet.freeze_panes = "A2"
+    bold = Font(bold=True)
+    wrap_text = Alignment(wrap_text=True)
+
+    for index, row in enumerate(rows):
+        cells = []
+        for value in row:
+            try:
+                cell = WriteOnlyCell(worksheet, value=value)
+            except ValueError:
+                cell = WriteOnlyCell(worksheet, value=str(value))
+            if index == 0:
+                cell.font = bold
+            elif "\n" in str(value):
+                cell.alignment = wrap_text
+            cells.append(cell)
+        worksheet.append(cells)
+
+    workbook.save(file)
+
+
+def _write_xml(rows: Iterable[list[Any]], file: IO[bytes]) -> None:
+    rows = iter(rows)
+    headers = next(rows, [])
+    with etree.xmlfile(file, encoding="utf8") as xf:
+        xf.write_declaration()
+        with xf.element("submissions"):
+            for row in rows:
+                xf.write(_xml_submission(dict(zip(headers, row))), pretty_print=True)
 
 
 def export_submissions(
     queryset: SubmissionQuerySet, file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
+) -> HttpResponseBase:
+    """
+    Export the submissions as a file download.
+
+    CSV and JSON exports are streamed to the client while the submissions are
+    processed. XLSX and XML exports are written to a temporary file first.
+    """
     filename = f"submissions_export.{file_type.extension}"
+    rows = iter_submission_export_rows(queryset)
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
-        content_type=file_type.content_type,
-    )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    match file_type:
+        case ExportFileTypes.CSV | ExportFileTypes.JSON:
+            stream = _stream_csv if file_type == ExportFileTypes.CSV else _stream_json
+            response = StreamingHttpResponse(
+                stream(rows), content_type=file_type.content_type
+            )
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        case ExportFileTypes.XLSX | ExportFileTypes.XML:
+            write = _write_xlsx if file_type == ExportFileTypes.XLSX else _write_xml
+            file = TemporaryFile()
+            write(rows, file)
+            file.seek(0)
+            response = FileResponse(
+                file,
+                as_attachment=True,
+                filename=filename,
+                content_type=file_type.content_type,
+            )
+        case _:  # pragma: no cover
+            raise ValueError(f"Unsupported file type: {file_type}")
 
     return response
 
@@ -116,6 +261,14 @@ def _xml_value(parent, value, wrap_single=False):
         node.text = _xml_basic_value(value)
 
 
+def _xml_submission(row: dict[str, Any]) -> etree._Element:
+    elem = etree.Element("submission")
+    for key, value in row.items():
+        field = etree.SubElement(elem, "field", name=key)
+        _xml_value(field, value, wrap_single=True)
+    return elem
+
+
 class XMLKeyValueExport:
     title = "xml"
 
@@ -141,10 +294,7 @@ class XMLKeyValueExport:
     def export_set(cls, dset):
         root = etree.Element("submissions")
         for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
+            root.append(_xml_submission(row))
 
         return etree.tostring(
             root, xml_declaration=True, encoding="utf8", pretty_print=True
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, MutableMapping
 
 from django.utils.functional import empty
 
@@ -14,6 +14,7 @@ from openforms.typing import DataMapping
 
 from .logic.actions import ActionOperation
 from .logic.datastructures import DataContainer
+from .logic.dependencies import LogicSnapshot, get_snapshot_cache_key, is_affected
 from .logic.rules import get_rules_to_evaluate, iter_evaluate_rules
 from .models.submission_step import DirtyData
 
@@ -27,6 +28,7 @@ def evaluate_form_logic(
     step: "SubmissionStep",
     data: DataMapping,
     dirty=False,
+    logic_snapshots: MutableMapping[str, LogicSnapshot] | None = None,
     **context,
 ) -> DataMapping:
     """
@@ -60,6 +62,11 @@ def evaluate_form_logic(
        2. Interpolate the component configuration with the variables.
        3. Handle custom formio types (which require variables as input!)
 
+    When the logic is evaluated for every step of a submission in a row (e.g. when
+    rendering the submission), pass the same ``logic_snapshots`` mapping to every call.
+    The outcome of the logic rules is then recorded and only the rules affected by
+    differences in the data are evaluated again for the next steps, with the same
+    result as evaluating all of them.
     """
     # grab the configuration that will be mutated
     config_wrapper = step.form_step.form_definition.configuration_wrapper
@@ -95,10 +102,23 @@ def evaluate_form_logic(
     with elasticapm.capture_span(
         name="collect_logic_operations", span_type="app.submissions.logic"
     ):
+        if logic_snapshots is not None:
+            snapshot_cache_key = str(submission.uuid)
+        elif dirty:
+            # dirty checks are performed repeatedly with mostly the same data, so only
+            # the rules affected by the changes since the previous check need evaluation
+            snapshot_cache_key = get_snapshot_cache_key(
+                submission.uuid, step.form_step.uuid
+            )
+        else:
+            snapshot_cache_key = ""
+
         for operation in iter_evaluate_rules(
             rules,
             data_container,
             submission=submission,
+            snapshot_cache_key=snapshot_cache_key,
+            snapshots=logic_snapshots,
         ):
             mutation_operations.append(operation)
 
@@ -139,10 +159,11 @@ def evaluate_form_logic(
     # only keep the changes in the data, so that old values do not overwrite otherwise
     # debounced client-side data changes
     data_diff = FormioData()
+    visible_keys = config_wrapper.visible_components(data_container.data)
+    conditional_trigger_keys = config_wrapper.get_conditional_trigger_keys()
     for component in config_wrapper:
         key = component["key"]
-        is_visible = config_wrapper.is_visible_in_frontend(key, data_container.data)
-        if is_visible:
+        if key in visible_keys:
             continue
 
         # Reset the value of any field that may have become hidden again after evaluating the logic
@@ -157,6 +178,9 @@ def evaluate_form_logic(
         # clear the value
         data_container.update({key: empty_value})
         data_diff[key] = empty_value
+        # the cleared value may hide other components
+        if is_affected(key, conditional_trigger_keys):
+            visible_keys = config_wrapper.visible_components(data_container.data)
 
     # 7.2 Interpolate the component configuration with the variables.
     inject_variables(config_wrapper, data_container.data)
@@ -1,27 +1,28 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
-from typing import Any, Mapping, TypedDict
-
-from django.core.cache import cache
-from django.core.serializers.json import DjangoJSONEncoder
+from functools import cached_property
+from typing import Any, Callable, Mapping, TypedDict
 
 from glom import assign
-from json_logic import jsonLogic
 from typing_extensions import Self
 
 from openforms.dmn.service import evaluate_dmn
 from openforms.formio.datastructures import FormioData
 from openforms.formio.service import FormioConfigurationWrapper
 from openforms.forms.constants import LogicActionTypes
-from openforms.forms.models import FormLogic
+from openforms.forms.models import FormLogic, FormVariable
 from openforms.typing import DataMapping, JSONObject
 
 from ..models import Submission, SubmissionStep
 from ..models.submission_step import DirtyData
+from . import caching
+from .dependencies import get_expression_inputs
+from .expressions import get_compiled_expression
 from .log_utils import log_errors
-from .service_fetching import perform_service_fetch
+from .service_fetching import prepare_service_fetch
+
+DMN_CACHE_NAMESPACE = "dmn"
 
 
 class ActionDetails(TypedDict):
@@ -75,6 +76,37 @@ class ActionOperation:
         """
         pass
 
+    def get_inputs(self) -> frozenset[str] | None:
+        """
+        Return the variable keys (or paths) read by :meth:`eval`.
+
+        ``None`` is returned if the inputs cannot be determined up front.
+        """
+        return frozenset()
+
+    def get_outputs(self) -> frozenset[str]:
+        """
+        Return the variable keys that can be modified by :meth:`eval`.
+        """
+        return frozenset()
+
+    def get_external_call(
+        self,
+        context: DataMapping,
+        submission: Submission,
+    ) -> Callable[[], DataMapping | None] | None:
+        """
+        Prepare the evaluation of actions that call external systems.
+
+        The returned callable produces the same result as :meth:`eval` and can be
+        executed in another thread, concurrently with other external calls. The action
+        state and submission are read up front, but the callable may still read
+        configuration from the database (e.g. the DMN plugin configuration) - the
+        database connections of the worker threads are closed after each call.
+        ``None`` is returned for actions that don't call external systems.
+        """
+        return None
+
 
 @dataclass
 class PropertyAction(ActionOperation):
@@ -176,7 +208,16 @@ class VariableAction(ActionOperation):
         submission: Submission,
     ) -> DataMapping:
         with log_errors(self.value, self.rule):
-            return {self.variable: jsonLogic(self.value, context)}
+            expression = get_compiled_expression(
+                self.rule, f"variable:{self.variable}", self.value
+            )
+            return {self.variable: expression(context)}
+
+    def get_inputs(self) -> frozenset[str] | None:
+        return get_expression_inputs(self.value)
+
+    def get_outputs(self) -> frozenset[str]:
+        return frozenset([self.variable])
 
 
 @dataclass
@@ -187,15 +228,52 @@ class ServiceFetchAction(ActionOperation):
     def from_action(cls, action: ActionDict) -> Self:
         return cls(variable=action["variable"])
 
+    @cached_property
+    def form_variable(self) -> FormVariable:
+        return self.rule.form.formvariable_set.select_related(
+            "service_fetch_configuration__service"
+        ).get(key=self.variable)
+
     def eval(
         self,
         context: DataMapping,
         submission: Submission,
-    ) -> DataMapping:
-        var = self.rule.form.formvariable_set.get(key=self.variable)
+    ) -> DataMapping | None:
+        call = self.get_external_call(context, submission)
+        return call()
+
+    def get_inputs(self) -> frozenset[str] | None:
+        try:
+            fetch_config = self.form_variable.service_fetch_configuration
+        except FormVariable.DoesNotExist:
+            return None
+        if fetch_config is None:
+            return frozenset()
+        variables = fetch_config.get_input_variables()
+        return frozenset(variables) if variables is not None else None
+
+    def get_outputs(self) -> frozenset[str]:
+        return frozenset([self.variable])
+
+    def get_external_call(
+        self,
+        context: DataMapping,
+        submission: Submission,
+    ) -> Callable[[], DataMapping | None]:
+        fetch = None
         with log_errors({}, self.rule):  # TODO proper error handling
-            result = perform_service_fetch(var, context, str(submission.uuid))
-            return {var.key: result.value}
+            fetch = prepare_service_fetch(
+                self.form_variable, context, str(submission.uuid)
+            )
+
+        def _call() -> DataMapping | None:
+            if fetch is None:
+                return None
+            with log_errors({}, self.rule):  # TODO proper error handling
+                result = fetch()
+                return {self.variable: result.value}
+
+        return _call
 
 
 class DMNVariableMapping(TypedDict):
@@ -233,6 +311,20 @@ class EvaluateDMNAction(ActionOperation):
         context: DataMapping,
         submission: Submission,
     ) -> DataMapping | None:
+        call = self.get_external_call(context, submission)
+        return call()
+
+    def get_inputs(self) -> frozenset[str] | None:
+        return frozenset(item["form_variable"] for item in self.input_mapping)
+
+    def get_outputs(self) -> frozenset[str]:
+        return frozenset(item["form_variable"] for item in self.output_mapping)
+
+    def get_external_call(
+        self,
+        context: DataMapping,
+        submission: Submission,
+    ) -> Callable[[], DataMapping | None]:
         # Mapping from form variables to DMN inputs
         data = FormioData(context)
         dmn_inputs = {
@@ -248,27 +340,29 @@ class EvaluateDMNAction(ActionOperation):
                 plugin_id=self.plugin_id,
             )
 
-        # Perform DMN call or retrieve result from cache
-        inputs = json.dumps(dmn_inputs, cls=DjangoJSONEncoder, sort_keys=True)
-        cache_key = hash(
-            str(submission.uuid)
-            + self.decision_definition_id
-            + self.decision_definition_version
-            + self.plugin_id
-            + inputs
-        )
-        dmn_outputs = cache.get_or_set(
-            cache_key,
-            default=_evaluate_dmn,
-            timeout=self.cache_timeout,
-        )
+        def _call() -> DataMapping | None:
+            # Perform DMN call or retrieve result from cache
+            dmn_outputs = caching.get_or_set(
+                DMN_CACHE_NAMESPACE,
+                (
+                    str(submission.uuid),
+                    self.decision_definition_id,
+                    self.decision_definition_version,
+                    self.plugin_id,
+                    dmn_inputs,
+                ),
+                default=_evaluate_dmn,
+                timeout=self.cache_timeout,
+            )
 
-        # Map DMN output to form variables
-        return {
-            item["form_variable"]: dmn_outputs[item["dmn_variable"]]
-            for item in self.output_mapping
-            if item["dmn_variable"] in dmn_outputs
-        }
+            # Map DMN output to form variables
+            return {
+                item["form_variable"]: dmn_outputs[item["dmn_variable"]]
+                for item in self.output_mapping
+                if item["dmn_variable"] in dmn_outputs
+            }
+
+        return _call
 
 
 @dataclass
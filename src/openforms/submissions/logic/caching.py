@@ -0,0 +1,99 @@
+"""
+Shared caching of the results of external calls made during logic evaluation.
+
+The cache keys are derived from a digest of the (JSON-serialized) inputs, so every
+process (web workers, Celery workers, restarted processes...) computes the same key
+for the same inputs and can re-use the cached results.
+
+When the ``LOGIC_CACHE_STATS`` setting is enabled, hits and misses are counted per
+namespace in the cache itself, which makes it possible to measure the hit rate across
+all workers with :func:`get_cache_stats`.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, TypedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.serializers.json import DjangoJSONEncoder
+
+# bump when the structure of the cached values changes
+CACHE_KEY_VERSION = 1
+
+STATS_TIMEOUT = 24 * 60 * 60  # seconds
+
+_MISSING = object()
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+
+
+def get_cache_key(namespace: str, *parts: Any) -> str:
+    """
+    Build a deterministic, versioned cache key from the provided parts.
+
+    :arg namespace: Identifies what is being cached, e.g. ``"service-fetch"``.
+    :arg parts: JSON-serializable inputs uniquely identifying the cached value.
+    """
+    content = json.dumps(parts, cls=DjangoJSONEncoder, sort_keys=True)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return f"logic:{namespace}:v{CACHE_KEY_VERSION}:{digest}"
+
+
+def _get_stats_key(namespace: str, name: str) -> str:
+    return f"logic:{namespace}:v{CACHE_KEY_VERSION}:stats:{name}"
+
+
+def _increment(key: str) -> None:
+    if not settings.LOGIC_CACHE_STATS:
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        # the counter does not exist yet - another process may create it in between
+        if not cache.add(key, 1, timeout=STATS_TIMEOUT):
+            cache.incr(key)
+
+
+def get_or_set(
+    namespace: str,
+    parts: tuple[Any, ...],
+    default: Callable[[], Any],
+    timeout: int | None | object = DEFAULT_TIMEOUT,
+) -> Any:
+    """
+    Look up the value for ``parts`` in the cache, or compute and store it.
+
+    Works like :meth:`django.core.cache.cache.get_or_set`, with the key derived from
+    ``namespace`` and ``parts`` and with hits/misses being counted (if enabled).
+    """
+    cache_key = get_cache_key(namespace, *parts)
+    value = cache.get(cache_key, _MISSING)
+    if value is not _MISSING:
+        _increment(_get_stats_key(namespace, "hits"))
+        return value
+
+    _increment(_get_stats_key(namespace, "misses"))
+    value = default()
+    cache.set(cache_key, value, timeout=timeout)
+    return value
+
+
+def get_cache_stats(namespace: str) -> CacheStats:
+    """
+    Report the number of cache hits and misses recorded by all processes.
+    """
+    return {
+        "hits": cache.get(_get_stats_key(namespace, "hits"), 0),
+        "misses": cache.get(_get_stats_key(namespace, "misses"), 0),
+    }
+
+
+def reset_cache_stats(namespace: str) -> None:
+    cache.delete_many(
+        [_get_stats_key(namespace, "hits"), _get_stats_key(namespace, "misses")]
+    )
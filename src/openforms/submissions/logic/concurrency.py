@@ -0,0 +1,119 @@
+"""
+Concurrent execution of the calls to external systems made by logic actions.
+
+Fetching a value from a service and evaluating a DMN decision are I/O bound. When the
+external calls in a logic evaluation pass don't depend on each other's results, they
+are performed concurrently on a bounded thread pool and their results are merged back
+in rule order, so that the outcome is the same as evaluating them one by one.
+"""
+
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from zgw_consumers.concurrent import parallel
+
+from openforms.typing import DataMapping
+
+from .dependencies import is_affected
+
+
+@dataclass
+class _PendingCall:
+    call: Callable[[], DataMapping | None]
+    outputs: frozenset[str]
+    key: Any
+    future: Any = None
+
+
+class ExternalCalls:
+    """
+    Track the external calls of a logic evaluation pass whose results are not merged
+    yet.
+
+    Calls are only handed off to the thread pool once more than one of them is
+    pending - a single call is performed in the calling thread when its result is
+    needed.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pending: list[_PendingCall] = []
+        self._stack = ExitStack()
+        self._executor: parallel | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 1
+
+    def conflicts(
+        self, inputs: Iterable[str] | None, outputs: Iterable[str] = ()
+    ) -> bool:
+        """
+        Check if reading ``inputs`` or writing ``outputs`` requires the results of the
+        pending calls.
+
+        :arg inputs: The variables that are read, or ``None`` if these are unknown.
+        :arg outputs: The variables that are written.
+        """
+        if not self._pending:
+            return False
+        if inputs is None:
+            return True
+        pending_outputs = set().union(*(pending.outputs for pending in self._pending))
+        return any(is_affected(key, pending_outputs) for key in (*inputs, *outputs))
+
+    def add(
+        self,
+        call: Callable[[], DataMapping | None],
+        outputs: frozenset[str],
+        key: Any,
+    ) -> None:
+        """
+        Schedule an external call.
+
+        :arg call: The prepared call, see
+          :meth:`openforms.submissions.logic.actions.ActionOperation.get_external_call`.
+        :arg outputs: The variables that can be modified by the result of the call.
+        :arg key: Identifies the call in the results of :meth:`resolve`.
+        """
+        self._pending.append(_PendingCall(call=call, outputs=outputs, key=key))
+        if len(self._pending) > 1:
+            self._start()
+
+    def _start(self) -> None:
+        if self._executor is None:
+            self._executor = self._stack.enter_context(
+                parallel(max_workers=self.max_workers)
+            )
+        for pending in self._pending:
+            if pending.future is None:
+                pending.future = self._executor.submit(pending.call)
+
+    def resolve(self) -> list[tuple[Any, DataMapping | None]]:
+        """
+        Wait for the pending calls to complete.
+
+        :returns: The ``(key, result)`` pairs, in the order the calls were added.
+        """
+        pending_calls, self._pending = self._pending, []
+        return [
+            (
+                pending.key,
+                (
+                    pending.future.result()
+                    if pending.future is not None
+                    else pending.call()
+                ),
+            )
+            for pending in pending_calls
+        ]
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool, if it was started.
+        """
+        self._stack.close()
@@ -2,21 +2,47 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from openforms.formio.service import FormioData
-from openforms.typing import DataMapping
+from openforms.typing import DataMapping, JSONValue
 
 from ..models import SubmissionStep
 from ..models.submission_value_variable import SubmissionValueVariablesState
 
 
+def _copy_on_write_assign(data: dict[str, Any], key: str, value: Any) -> None:
+    """
+    Assign ``value`` to the (possibly dotted) ``key`` in the nested ``data``.
+
+    Unlike :meth:`FormioData.__setitem__`, the intermediate containers along the path
+    are (shallow) copied before being modified, so that nested values handed out
+    earlier are never mutated in place.
+    """
+    *parents, leaf = key.split(".")
+    container = data
+    for bit in parents:
+        match container.get(bit):
+            case dict() as child:
+                child = {**child}
+            case _:
+                child = {}
+        container[bit] = child
+        container = child
+    container[leaf] = value
+
+
 @dataclass
 class DataContainer:
     """
     A data container to manage the data/variables lifecycle during logic evaluation.
+
+    The nested data mapping is materialized once and then kept in sync with the
+    variables state through :meth:`update`, rather than being rebuilt from all the
+    variables every time it is accessed.
     """
 
     state: SubmissionValueVariablesState
 
     _initial_data: tuple[tuple[str, Any]] = field(init=False, default_factory=tuple)
+    _data: dict[str, JSONValue] | None = field(init=False, default=None)
 
     def __post_init__(self):
         # ensure the initial data is immutable
@@ -34,21 +60,42 @@ class DataContainer:
         The current view on the submission variable value state is augmented with
         the static variables.
 
+        The returned mapping is kept up to date by :meth:`update` and must be treated
+        as read-only by callers. Nested values are replaced rather than mutated on
+        update, so references obtained earlier remain stable.
+
         :return: A datamapping (key: variable key, value: variable value) ready for
           (template context) evaluation.
         """
-        dynamic_values = {
-            key: variable.to_python() for key, variable in self.state.variables.items()
-        }
-        static_values = self.state.static_data()
-        nested_data = FormioData({**dynamic_values, **static_values})
-        return nested_data.data
+        if self._data is None:
+            dynamic_values = {
+                key: variable.to_python()
+                for key, variable in self.state.variables.items()
+            }
+            static_values = self.state.static_data()
+            nested_data = FormioData({**dynamic_values, **static_values})
+            self._data = nested_data.data
+        return self._data
 
     def update(self, updates: DataMapping) -> None:
         """
         Update the dynamic data state.
+
+        Only the variables affected by ``updates`` are re-materialized in the data
+        mapping.
         """
-        self.state.set_values(updates)
+        updated_keys = self.state.set_values(updates)
+        if self._data is None:
+            return
+
+        static_data = self.state.static_data()
+        variables = self.state.variables
+        for key in updated_keys:
+            # static variables take precedence over the dynamic ones
+            if key in static_data:
+                continue
+            value = variables[key].to_python()
+            _copy_on_write_assign(self._data, key, value)
 
     def get_updated_step_data(self, step: SubmissionStep) -> FormioData:
         relevant_variables = self.state.get_variables_in_submission_step(
@@ -0,0 +1,338 @@
+"""
+Static dependency analysis of form logic rules.
+
+Each logic rule reads a number of variables (in its trigger and in the expressions of
+its actions) and may write to variables (through its actions). Knowing these inputs
+and outputs up front allows us to determine which rules can possibly produce a
+different outcome when only some of the input data changes, so that the outcome of
+the other rules can be re-used from an earlier evaluation rather than evaluating their
+JSON logic again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable
+from uuid import UUID
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from json_logic.meta import Operation
+from json_logic.typing import JSON
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import Form, FormLogic
+from openforms.typing import DataMapping
+from openforms.utils.json_logic.datastructures import iter_tree
+from openforms.utils.json_logic.introspection import introspect_json_logic
+
+# operations that reference variables without going through the ``var`` operator
+UNTRACKABLE_OPERATORS = ("missing", "missing_some")
+
+# actions that reach out to external systems - their results are not a pure function
+# of the variables that we can statically determine
+EXTERNAL_ACTION_TYPES = (
+    LogicActionTypes.fetch_from_service,
+    LogicActionTypes.evaluate_dmn,
+)
+
+DEPENDENCIES_CACHE_SIZE = 4096
+SNAPSHOT_CACHE_SIZE = 1024
+SNAPSHOT_CACHE_TIMEOUT = 60 * 15  # 15 minutes
+
+
+@dataclass(frozen=True)
+class RuleDependencies:
+    inputs: frozenset[str]
+    """
+    The variable keys (or paths) read by the rule trigger and actions.
+    """
+    outputs: frozenset[str]
+    """
+    The variable keys written by the rule actions.
+    """
+    digest: str
+    """
+    Checksum of the rule trigger and actions, to detect changes to the rule itself.
+    """
+    trigger_inputs: frozenset[str] | None
+    """
+    The variable keys (or paths) read by the rule trigger, or ``None`` if they cannot
+    be determined statically.
+    """
+    volatile: bool = False
+    """
+    Marker for rules whose inputs cannot be (fully) determined statically. These rules
+    must always be evaluated.
+    """
+
+
+@dataclass
+class RuleOutcome:
+    triggered: bool
+    mutations: list[DataMapping | None] = field(default_factory=list)
+    """
+    The result of evaluating each of the rule's action operations, in order.
+    """
+
+
+@dataclass
+class LogicSnapshot:
+    """
+    Record of a logic evaluation pass, used to replay rules that are not affected by
+    changes in the input data.
+    """
+
+    signature: tuple[tuple[int, str], ...]
+    data_digests: dict[str, str]
+    """
+    The digests of the (top-level) input data values, see :func:`get_data_digests`.
+    """
+    outcomes: dict[int, RuleOutcome]
+
+
+class _Untrackable(Exception):
+    pass
+
+
+def _collect_inputs(expression: JSON) -> set[str]:
+    inputs = set()
+    try:
+        tree = introspect_json_logic(expression).tree
+    except Exception as exc:
+        raise _Untrackable from exc
+
+    for node in iter_tree(tree):
+        if not isinstance(node, Operation):
+            continue
+        if node.operator in UNTRACKABLE_OPERATORS:
+            raise _Untrackable
+        if node.operator != "var":
+            continue
+        # a computed variable name, or the entire data as input
+        if not node.arguments or not isinstance(node.arguments[0], str):
+            raise _Untrackable
+        if not (key := node.arguments[0]):
+            raise _Untrackable
+        inputs.add(key)
+    return inputs
+
+
+def get_expression_inputs(expression: JSON) -> frozenset[str] | None:
+    """
+    Determine the variable keys (or paths) read by a JSON logic expression.
+
+    :returns: The referenced variables, or ``None`` if they cannot be determined
+      statically.
+    """
+    try:
+        return frozenset(_collect_inputs(expression))
+    except _Untrackable:
+        return None
+
+
+def _get_outputs(action: dict) -> set[str]:
+    match action["action"]["type"]:
+        case LogicActionTypes.variable | LogicActionTypes.fetch_from_service:
+            return {action["variable"]}
+        case LogicActionTypes.evaluate_dmn:
+            output_mapping = action["action"]["config"]["output_mapping"]
+            return {item["form_variable"] for item in output_mapping}
+        case _:
+            return set()
+
+
+def get_rule_dependencies(rule: FormLogic) -> RuleDependencies:
+    """
+    Determine the variables read and written by a logic rule.
+
+    The analysis result only depends on the rule trigger and actions, so it is
+    cached (per process) by their content.
+    """
+    content = json.dumps([rule.json_logic_trigger, rule.actions], sort_keys=True)
+    return _analyze_rule(content)
+
+
+@lru_cache(maxsize=DEPENDENCIES_CACHE_SIZE)
+def _analyze_rule(content: str) -> RuleDependencies:
+    digest = hashlib.md5(content.encode("utf-8"), usedforsecurity=False).hexdigest()
+    trigger, actions = json.loads(content)
+
+    inputs: set[str] = set()
+    outputs: set[str] = set()
+    for action in actions:
+        outputs |= _get_outputs(action)
+
+    try:
+        inputs |= _collect_inputs(trigger)
+        for action in actions:
+            action_type = action["action"]["type"]
+            if action_type in EXTERNAL_ACTION_TYPES:
+                raise _Untrackable
+            if action_type == LogicActionTypes.variable:
+                inputs |= _collect_inputs(action["action"]["value"])
+    except _Untrackable:
+        volatile = True
+    else:
+        volatile = False
+
+    return RuleDependencies(
+        inputs=frozenset(inputs),
+        outputs=frozenset(outputs),
+        digest=digest,
+        trigger_inputs=get_expression_inputs(trigger),
+        volatile=volatile,
+    )
+
+
+def get_dependencies(
+    form: Form, rules: Iterable[FormLogic]
+) -> dict[int, RuleDependencies]:
+    """
+    Return the dependencies of the given rules, keyed by rule primary key.
+
+    The results are cached on the form instance, alongside the cached logic rules.
+    """
+    dependencies = getattr(form, "_cached_logic_dependencies", None)
+    if dependencies is None:
+        dependencies = form._cached_logic_dependencies = {}
+    for rule in rules:
+        if rule.pk not in dependencies:
+            dependencies[rule.pk] = get_rule_dependencies(rule)
+    return dependencies
+
+
+def get_input_keys(form: Form, rules: Iterable[FormLogic]) -> set[str] | None:
+    """
+    Determine the variable keys (or paths) read by the given rules.
+
+    :returns: The referenced variables, or ``None`` if they cannot be determined
+      statically for every rule.
+    """
+    rules = list(rules)
+    dependencies = get_dependencies(form, rules)
+    keys = set()
+    for rule in rules:
+        rule_dependencies = dependencies[rule.pk]
+        if rule_dependencies.volatile:
+            return None
+        keys |= rule_dependencies.inputs
+    return keys
+
+
+def is_affected(key: str, changed: set[str]) -> bool:
+    """
+    Check if ``key`` is one of the ``changed`` keys, or a parent or child path of one.
+    """
+    if key in changed:
+        return True
+    # a change of a parent object affects the nested paths and vice versa
+    return any(
+        key.startswith(f"{changed_key}.") or changed_key.startswith(f"{key}.")
+        for changed_key in changed
+    )
+
+
+def get_affected_rules(
+    rules: Iterable[FormLogic],
+    dependencies: dict[int, RuleDependencies],
+    changed_keys: Iterable[str],
+) -> set[int]:
+    """
+    Determine which rules are (transitively) affected by a change of ``changed_keys``.
+
+    The rules are processed in evaluation order - a rule is affected if it reads any
+    of the changed keys, or any of the outputs of an earlier affected rule.
+
+    :returns: The primary keys of the affected rules.
+    """
+    changed = set(changed_keys)
+    affected = set()
+    for rule in rules:
+        rule_dependencies = dependencies[rule.pk]
+        if not rule_dependencies.volatile and not any(
+            is_affected(key, changed) for key in rule_dependencies.inputs
+        ):
+            continue
+        affected.add(rule.pk)
+        changed |= rule_dependencies.outputs
+    return affected
+
+
+def _get_digest(value: Any) -> str:
+    try:
+        content = json.dumps(value, cls=DjangoJSONEncoder, sort_keys=True)
+    except TypeError:
+        content = repr(value)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def get_data_digests(data: DataMapping) -> dict[str, str]:
+    """
+    Compute the digest of each top-level value of the (nested) data mapping.
+
+    The snapshots only need to detect which values changed, so the digests are stored
+    rather than the submission data itself.
+    """
+    return {key: _get_digest(value) for key, value in data.items()}
+
+
+def get_changed_keys(old: DataMapping, new: DataMapping) -> set[str]:
+    """
+    Compare two mappings (of data values or their digests) and return the top-level
+    keys that differ.
+    """
+    return {
+        key
+        for key in old.keys() | new.keys()
+        if key not in old or key not in new or old[key] != new[key]
+    }
+
+
+def get_signature(
+    rules: Iterable[FormLogic], dependencies: dict[int, RuleDependencies]
+) -> tuple[tuple[int, str], ...]:
+    """
+    Identify the rule set (its ordering and content) that was evaluated.
+    """
+    return tuple((rule.pk, dependencies[rule.pk].digest) for rule in rules)
+
+
+# The snapshots hold the values computed by the logic rules from the submission data,
+# so they are kept in the memory of the process rather than in the shared cache.
+# snapshot cache key -> (expiry time, snapshot), in least to most recently used order
+_snapshots: OrderedDict[str, tuple[float, LogicSnapshot]] = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+def get_snapshot_cache_key(submission_uuid: UUID, step_identifier: UUID) -> str:
+    return f"submission-logic-snapshot:{submission_uuid}:{step_identifier}"
+
+
+def load_snapshot(cache_key: str) -> LogicSnapshot | None:
+    with _snapshots_lock:
+        if (entry := _snapshots.get(cache_key)) is None:
+            return None
+        expires, snapshot = entry
+        if expires < time.monotonic():
+            del _snapshots[cache_key]
+            return None
+        _snapshots.move_to_end(cache_key)
+    # decouple from the stored snapshot, the replayed mutations may be modified
+    return deepcopy(snapshot)
+
+
+def store_snapshot(cache_key: str, snapshot: LogicSnapshot) -> None:
+    snapshot = deepcopy(snapshot)
+    with _snapshots_lock:
+        _snapshots[cache_key] = (time.monotonic() + SNAPSHOT_CACHE_TIMEOUT, snapshot)
+        _snapshots.move_to_end(cache_key)
+        while len(_snapshots) > SNAPSHOT_CACHE_SIZE:
+            _snapshots.popitem(last=False)
@@ -0,0 +1,68 @@
+"""
+Per-rule cache of compiled JsonLogic expressions.
+
+The logic rules of a form are evaluated over and over again with different data, so
+the expressions (triggers and variable action values) are compiled once per process
+and re-used afterwards. Only the most recently used expressions are kept, since
+modified or deleted rules are only discarded in the process handling the change.
+"""
+
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+
+from json_logic.typing import JSON
+
+from openforms.forms.models import FormLogic
+from openforms.utils.json_logic.compiler import CompiledExpression, compile_expression
+
+COMPILED_EXPRESSIONS_CACHE_SIZE = 4096
+
+# (rule pk, identifier within the rule) -> (source expression, compiled expression),
+# in least to most recently used order
+_compiled_expressions: OrderedDict[tuple[int, str], tuple[JSON, CompiledExpression]] = (
+    OrderedDict()
+)
+_compiled_expressions_lock = threading.Lock()
+
+
+def get_compiled_expression(
+    rule: FormLogic, identifier: str, expression: JSON
+) -> CompiledExpression:
+    """
+    Retrieve the compiled version of an expression belonging to ``rule``.
+
+    :arg rule: The logic rule the expression belongs to.
+    :arg identifier: Identifies the expression within the rule, e.g. ``"trigger"``.
+    :arg expression: The JsonLogic expression source. If it differs from the cached
+      source (e.g. because the rule was modified in another process), the expression
+      is compiled again.
+    """
+    if rule.pk is None:
+        return compile_expression(expression)
+
+    cache_key = (rule.pk, identifier)
+    with _compiled_expressions_lock:
+        cached = _compiled_expressions.get(cache_key)
+        if cached is not None and cached[0] == expression:
+            _compiled_expressions.move_to_end(cache_key)
+            return cached[1]
+
+    # decouple from the rule instance, which may be mutated
+    source = deepcopy(expression)
+    compiled = compile_expression(source)
+    with _compiled_expressions_lock:
+        _compiled_expressions[cache_key] = (source, compiled)
+        _compiled_expressions.move_to_end(cache_key)
+        while len(_compiled_expressions) > COMPILED_EXPRESSIONS_CACHE_SIZE:
+            _compiled_expressions.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_expressions(rule_pk: int) -> None:
+    """
+    Discard the compiled expressions of a rule.
+    """
+    with _compiled_expressions_lock:
+        for cache_key in [key for key in _compiled_expressions if key[0] == rule_pk]:
+            del _compiled_expressions[cache_key]
@@ -1,13 +1,28 @@
-from typing import Iterable, Iterator
+from copy import deepcopy
+from typing import Iterable, Iterator, MutableMapping
+
+from django.conf import settings
 
 import elasticapm
-from json_logic import jsonLogic
 
 from openforms.forms.models import FormLogic, FormStep
 
 from ..models import Submission, SubmissionStep
 from .actions import ActionOperation
+from .concurrency import ExternalCalls
 from .datastructures import DataContainer
+from .dependencies import (
+    LogicSnapshot,
+    RuleOutcome,
+    get_affected_rules,
+    get_changed_keys,
+    get_data_digests,
+    get_dependencies,
+    get_signature,
+    load_snapshot,
+    store_snapshot,
+)
+from .expressions import get_compiled_expression
 from .log_utils import log_errors
 
 
@@ -110,6 +125,8 @@ def iter_evaluate_rules(
     rules: Iterable[FormLogic],
     data_container: DataContainer,
     submission: Submission,
+    snapshot_cache_key: str = "",
+    snapshots: MutableMapping[str, LogicSnapshot] | None = None,
 ) -> Iterator[ActionOperation]:
     """
     Iterate over the rules and evaluate the trigger, yielding action operations.
@@ -119,33 +136,154 @@ def iter_evaluate_rules(
     action operator that updates a variable is processed immediately. The caller is
     responsible for processing (all other) actions accordingly.
 
+    When a ``snapshot_cache_key`` is provided, the outcome of the evaluation is
+    recorded in the memory of the process. On subsequent evaluations, only the rules (transitively)
+    affected by the data that changed since the recorded evaluation are evaluated -
+    the outcome of the other rules is replayed from the snapshot, which produces the
+    same result as evaluating all of them.
+
+    Calls to external systems (service fetch, DMN evaluation) that don't depend on
+    each other's results are performed concurrently, up to
+    ``settings.LOGIC_EXTERNAL_CALLS_MAX_WORKERS`` at a time. Their results are applied
+    and the action operations are yielded in rule order, so the outcome does not
+    depend on which call finishes first.
+
     :arg rules: An iterable of form logic rules to evaluate.
     :arg data_container: The :class:`DataContainer` instance wrapping the
       submission/step data and everything contained within. Note that the internal state
       can and should be mutated while processing the action operations (e.g. when updating
       variable values).
-    :arg on_rule_check: Optional callable taking a :class:`EvaluatedRule` instance as
-      sole argument. Useful to gather metadata about rule evaluation.
+    :arg submission: The submission the rules are evaluated for.
+    :arg snapshot_cache_key: Optional cache key to record and replay the rule
+      evaluation outcomes.
+    :arg snapshots: Optional storage for the snapshots (e.g. for the duration of a
+      request), used instead of the process-wide storage.
     :returns: An iterator yielding :class:`ActionOperation` instances.
     """
-    for rule in rules:
-        with elasticapm.capture_span(
-            "evaluate_rule",
-            span_type="app.submissions.logic",
-            labels={"ruleId": rule.pk},
-        ):
-            triggered = False
-            with log_errors(rule.json_logic_trigger, rule):
-                triggered = bool(
-                    jsonLogic(rule.json_logic_trigger, data_container.data)
-                )
-
-            if not triggered:
+    rules = list(rules)
+    affected_rules = {rule.pk for rule in rules}
+    previous_outcomes: dict[int, RuleOutcome] = {}
+
+    if snapshot_cache_key:
+        data_digests = get_data_digests(data_container.initial_data)
+        dependencies = get_dependencies(submission.form, rules)
+        signature = get_signature(rules, dependencies)
+        snapshot = (
+            snapshots.get(snapshot_cache_key)
+            if snapshots is not None
+            else load_snapshot(snapshot_cache_key)
+        )
+        if snapshot is not None and snapshot.signature == signature:
+            changed_keys = get_changed_keys(snapshot.data_digests, data_digests)
+            affected_rules = get_affected_rules(rules, dependencies, changed_keys)
+            previous_outcomes = snapshot.outcomes
+
+    # External calls that don't depend on each other's results are performed
+    # concurrently. While calls are pending, the operations are held back so that they
+    # are still yielded in rule order.
+    external_calls = ExternalCalls(
+        max_workers=settings.LOGIC_EXTERNAL_CALLS_MAX_WORKERS
+    )
+    held_back: list[ActionOperation] = []
+
+    def _resolve_external_calls() -> list[ActionOperation]:
+        for (outcome, index), mutations in external_calls.resolve():
+            outcome.mutations[index] = mutations
+            if mutations:
+                data_container.update(mutations)
+        operations = held_back[:]
+        held_back.clear()
+        return operations
+
+    outcomes: dict[int, RuleOutcome] = {}
+    try:
+        for rule in rules:
+            if rule.pk not in affected_rules:
+                rule_dependencies = dependencies[rule.pk]
+                if external_calls.conflicts(
+                    rule_dependencies.inputs, rule_dependencies.outputs
+                ):
+                    yield from _resolve_external_calls()
+
+                outcome = outcomes[rule.pk] = previous_outcomes[rule.pk]
+                if not outcome.triggered:
+                    continue
+                for operation, mutations in zip(
+                    rule.action_operations, outcome.mutations, strict=True
+                ):
+                    if mutations:
+                        data_container.update(mutations)
+                    if external_calls:
+                        held_back.append(operation)
+                    else:
+                        yield operation
                 continue
 
-            for operation in rule.action_operations:
-                if mutations := operation.eval(
-                    data_container.data, submission=submission
+            with elasticapm.capture_span(
+                "evaluate_rule",
+                span_type="app.submissions.logic",
+                labels={"ruleId": rule.pk},
+            ):
+                if external_calls and external_calls.conflicts(
+                    get_dependencies(submission.form, [rule])[rule.pk].trigger_inputs
                 ):
-                    data_container.update(mutations)
-                yield operation
+                    yield from _resolve_external_calls()
+
+                triggered = False
+                with log_errors(rule.json_logic_trigger, rule):
+                    trigger = get_compiled_expression(
+                        rule, "trigger", rule.json_logic_trigger
+                    )
+                    triggered = bool(trigger(data_container.data))
+
+                outcome = outcomes[rule.pk] = RuleOutcome(triggered=triggered)
+                if not triggered:
+                    continue
+
+                for operation in rule.action_operations:
+                    if external_calls and external_calls.conflicts(
+                        operation.get_inputs(), operation.get_outputs()
+                    ):
+                        yield from _resolve_external_calls()
+
+                    call = (
+                        operation.get_external_call(data_container.data, submission)
+                        if external_calls.enabled
+                        else None
+                    )
+                    if call is not None:
+                        external_calls.add(
+                            call,
+                            outputs=operation.get_outputs(),
+                            key=(outcome, len(outcome.mutations)),
+                        )
+                        outcome.mutations.append(None)
+                        held_back.append(operation)
+                        continue
+
+                    mutations = operation.eval(
+                        data_container.data, submission=submission
+                    )
+                    outcome.mutations.append(mutations)
+                    if mutations:
+                        data_container.update(mutations)
+                    if external_calls:
+                        held_back.append(operation)
+                    else:
+                        yield operation
+
+        yield from _resolve_external_calls()
+    finally:
+        external_calls.close()
+
+    if snapshot_cache_key:
+        snapshot = LogicSnapshot(
+            signature=signature,
+            data_digests=data_digests,
+            outcomes=outcomes,
+        )
+        if snapshots is not None:
+            # decouple from the variable values, like the process-wide storage does
+            snapshots[snapshot_cache_key] = deepcopy(snapshot)
+        else:
+            store_snapshot(snapshot_cache_key, snapshot)
@@ -1,17 +1,20 @@
-import json
 from dataclasses import dataclass
+from typing import Callable
 
-from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
-import jq
 from json_logic import jsonLogic
-from zgw_consumers.client import build_client
 
 from openforms.forms.models import FormVariable
 from openforms.typing import DataMapping, JSONObject, JSONValue
+from openforms.utils.api_clients import build_pooled_client
+from openforms.variables.mapping_expressions import compile_jq_expression
 from openforms.variables.models import DataMappingTypes, ServiceFetchConfiguration
 
+from . import caching
+
+CACHE_NAMESPACE = "service-fetch"
+
 
 @dataclass
 class FetchResult:
@@ -37,9 +40,23 @@ def perform_service_fetch(
     instance.
 
     The value returned by the request is cached using the submission UUID and the
-    arguments to the request (hashed to make a cache key).
+    arguments to the request (digested to make a cache key that is the same in every
+    process).
+    """
+    fetch = prepare_service_fetch(var, context, submission_uuid)
+    return fetch()
+
+
+def prepare_service_fetch(
+    var: FormVariable, context: DataMapping, submission_uuid: str = ""
+) -> Callable[[], FetchResult]:
     """
+    Prepare the service fetch for ``var``, see :func:`perform_service_fetch`.
 
+    The request arguments are determined (and validated) immediately. The returned
+    callable performs the actual request and does not access the database, so it can
+    be executed in another thread.
+    """
     if not var.service_fetch_configuration:
         raise ValueError(
             f"Can't perform service fetch on {var}. "
@@ -47,7 +64,7 @@ def perform_service_fetch(
         )
     fetch_config: ServiceFetchConfiguration = var.service_fetch_configuration
 
-    client = build_client(fetch_config.service)
+    client = build_pooled_client(fetch_config.service)
     request_args = fetch_config.request_arguments(context)
 
     def _do_fetch():
@@ -56,28 +73,36 @@ def perform_service_fetch(
             response.raise_for_status()
         return response.json()
 
-    if not submission_uuid:
-        raw_value = _do_fetch()
-    else:
-        cache_key = hash(submission_uuid + json.dumps(request_args, sort_keys=True))
-        timeout = (
-            _timeout
-            if (_timeout := fetch_config.cache_timeout) is not None
-            else DEFAULT_TIMEOUT
+    def _fetch() -> FetchResult:
+        if not submission_uuid:
+            raw_value = _do_fetch()
+        else:
+            timeout = (
+                _timeout
+                if (_timeout := fetch_config.cache_timeout) is not None
+                else DEFAULT_TIMEOUT
+            )
+            raw_value = caching.get_or_set(
+                CACHE_NAMESPACE,
+                (submission_uuid, request_args),
+                default=_do_fetch,
+                timeout=timeout,
+            )
+
+        match fetch_config.data_mapping_type, fetch_config.mapping_expression:
+            case DataMappingTypes.jq, expression:
+                # XXX raise warning if len(result) > 1 ?
+                program = compile_jq_expression(expression)
+                value = program.input(raw_value).first()
+            case DataMappingTypes.json_logic, expression:
+                value = jsonLogic(expression, raw_value)
+            case _:
+                value = raw_value
+
+        return FetchResult(
+            value=value,
+            request_parameters=request_args,
+            response_json=raw_value,
         )
-        raw_value = cache.get_or_set(cache_key, default=_do_fetch, timeout=timeout)
-
-    match fetch_config.data_mapping_type, fetch_config.mapping_expression:
-        case DataMappingTypes.jq, expression:
-            # XXX raise warning if len(result) > 1 ?
-            value = jq.compile(expression).input(raw_value).first()
-        case DataMappingTypes.json_logic, expression:
-            value = jsonLogic(expression, raw_value)
-        case _:
-            value = raw_value
-
-    return FetchResult(
-        value=value,
-        request_parameters=request_args,
-        response_json=raw_value,
-    )
+
+    return _fetch
@@ -6,7 +6,7 @@ from celery.result import AsyncResult
 from privates.fields import PrivateMediaFileField
 
 from openforms.config.templatetags.theme import THEME_OVERRIDE_CONTEXT_VAR
-from openforms.utils.pdf import render_to_pdf
+from openforms.utils.pdf import PDFRenderer, render_to_pdf
 
 from ..report import Report
 
@@ -64,22 +64,27 @@ class SubmissionReport(models.Model):
         :return: string with the HTML used for the PDF generation, so that contents
           can be tested.
         """
+        html_report, pdf_report = self.render_pdf()
+        self.content = ContentFile(
+            content=pdf_report,
+            name=f"{self.submission.form.slug}.pdf",
+        )
+        self.save()
+        return html_report
 
+    def render_pdf(self, renderer: PDFRenderer | None = None) -> tuple[str, bytes]:
+        """
+        Render the submission report HTML and PDF, without storing it.
+        """
         with override(self.submission.language_code):
-            form = self.submission.form
-            html_report, pdf_report = render_to_pdf(
+            return render_to_pdf(
                 "report/submission_report.html",
                 context={
                     "report": Report(self.submission),
                     THEME_OVERRIDE_CONTEXT_VAR: self.submission.form.theme,
                 },
+                renderer=renderer,
             )
-            self.content = ContentFile(
-                content=pdf_report,
-                name=f"{form.slug}.pdf",
-            )
-        self.save()
-        return html_report
 
     def get_celery_task(self) -> AsyncResult | None:
         if not self.task_id:
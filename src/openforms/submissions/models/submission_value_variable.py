@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from typing import TYPE_CHECKING, Any
@@ -31,6 +33,11 @@ class ValueEncoder(DjangoJSONEncoder):
         return to_json() if callable(to_json) else super().default(obj)
 
 
+def get_value_digest(value: Any) -> str:
+    content = json.dumps(value, cls=ValueEncoder, sort_keys=True)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
 @dataclass
 class SubmissionValueVariablesState:
     submission: "Submission"
@@ -38,11 +45,14 @@ class SubmissionValueVariablesState:
         init=False, default=None
     )
     _static_data: dict[str, Any] | None = field(init=False, default=None)
+    # form definition ID -> keys of the variables of the components in that step
+    _step_variable_keys: dict[int, list[str]] = field(init=False, default_factory=dict)
 
     @property
     def variables(self) -> dict[str, SubmissionValueVariable]:
         if not self._variables:
             self._variables = self.collect_variables()
+            self._step_variable_keys = {}
         return self._variables
 
     @property
@@ -86,21 +96,32 @@ class SubmissionValueVariablesState:
         submission_step: SubmissionStep,
         include_unsaved=True,
     ) -> dict[str, SubmissionValueVariable]:
-        configuration_wrapper = (
-            submission_step.form_step.form_definition.configuration_wrapper
-        )
-        keys_in_step = list(configuration_wrapper.component_map.keys())
-
         variables = self.variables
-        if not include_unsaved:
-            variables = self.saved_variables
-
+        keys_in_step = self._get_variable_keys_in_step(submission_step)
         return {
             variable_key: variable
-            for variable_key, variable in variables.items()
-            if variable.key in keys_in_step
+            for variable_key in keys_in_step
+            # variables can be removed from the state after the keys were indexed
+            if (variable := variables.get(variable_key)) is not None
+            and (include_unsaved or variable.pk)
         }
 
+    def _get_variable_keys_in_step(self, submission_step: SubmissionStep) -> list[str]:
+        """
+        Get the keys of the variables of the components in the step, in the order of
+        :attr:`variables`.
+
+        The keys are determined once per step, so that extracting the step data does
+        not require scanning the components of the step for every variable.
+        """
+        form_definition = submission_step.form_step.form_definition
+        keys = self._step_variable_keys.get(form_definition.id)
+        if keys is None:
+            component_map = form_definition.configuration_wrapper.component_map
+            keys = [key for key in self.variables if key in component_map]
+            self._step_variable_keys[form_definition.id] = keys
+        return keys
+
     def collect_variables(self) -> dict[str, SubmissionValueVariable]:
         # leverage the (already populated) submission state to get access to form
         # steps and form definitions
@@ -184,7 +205,7 @@ class SubmissionValueVariablesState:
 
         SubmissionValueVariable.objects.bulk_create(variables_to_prefill)
 
-    def set_values(self, data: DataMapping) -> None:
+    def set_values(self, data: DataMapping) -> list[str]:
         """
         Apply the values from ``data`` to the current state of the variables.
 
@@ -193,16 +214,20 @@ class SubmissionValueVariablesState:
         variables in the state.
 
         :arg data: mapping of variable key to value.
+        :returns: the keys of the variables that had their value set.
 
         .. todo:: apply variable.datatype/format to obtain python objects? This also
            needs to properly serialize back to JSON though!
         """
         formio_data = FormioData(data)
+        updated_keys = []
         for key, variable in self.variables.items():
             new_value = formio_data.get(key, default=empty)
             if new_value is empty:
                 continue
             variable.value = new_value
+            updated_keys.append(key)
+        return updated_keys
 
 
 class SubmissionValueVariableManager(models.Manager):
@@ -241,11 +266,20 @@ class SubmissionValueVariableManager(models.Manager):
 
             if not variable.pk:
                 variables_to_create.append(variable)
-            else:
+            elif variable.has_changed:
                 variables_to_update.append(variable)
 
         self.bulk_create(variables_to_create)
-        self.bulk_update(variables_to_update, fields=["value"])
+        # only write the changed values, with an INSERT ... ON CONFLICT DO UPDATE
+        # statement rather than an UPDATE with a CASE WHEN clause for every row
+        self.bulk_create(
+            variables_to_update,
+            update_conflicts=True,
+            unique_fields=["submission", "key"],
+            update_fields=["value", "modified_at"],
+        )
+        for variable in variables_to_create + variables_to_update:
+            variable.mark_persisted()
         self.filter(submission=submission, key__in=variables_keys_to_delete).delete()
 
         # Variables that are deleted are not automatically updated in the state
@@ -323,6 +357,45 @@ class SubmissionValueVariable(models.Model):
             )
         return _("Submission value variable {key}").format(key=self.key)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "value" in field_names:
+            instance.mark_persisted()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "value" in update_fields:
+            self.mark_persisted()
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or "value" in fields:
+            self.mark_persisted()
+
+    def mark_persisted(self) -> None:
+        """
+        Record the digest of the current value as the value stored in the database.
+        """
+        self._persisted_digest = get_value_digest(self.value)
+
+    @property
+    def has_changed(self) -> bool:
+        """
+        Check if the value differs from the value stored in the database.
+
+        The digest of the value is compared, so values modified in place are detected
+        too.
+        """
+        if not self.pk:
+            return True
+        persisted_digest = getattr(self, "_persisted_digest", None)
+        return (
+            persisted_digest is None or get_value_digest(self.value) != persisted_digest
+        )
+
     def to_python(self) -> Any:
         """
         Deserialize the value into the appropriate python type.
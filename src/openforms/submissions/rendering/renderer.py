@@ -70,12 +70,16 @@ class Renderer:
         Produce only the direct child nodes.
         """
         submission_data = self.submission.data
+        # the logic rules are evaluated for every step with (mostly) the same data -
+        # record the outcome so that it can be re-used for the next steps
+        logic_snapshots = {}
         for step in self.steps:
             new_configuration = evaluate_form_logic(
                 submission=self.submission,
                 step=step,
                 data=submission_data,
                 dirty=False,
+                logic_snapshots=logic_snapshots,
                 request=self.dummy_request,
             )
             # update the configuration for introspection - note that we are mutating
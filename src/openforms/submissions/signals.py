@@ -2,10 +2,11 @@ import logging
 
 from django.db import transaction
 from django.db.models import F
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 from django.utils import timezone
 
+from openforms.forms.models import FormLogic
 from openforms.forms.models.form_statistics import FormStatistics
 from openforms.submissions.models import (
     Submission,
@@ -14,6 +15,8 @@ from openforms.submissions.models import (
 )
 from openforms.utils.files import _delete_obj_files, get_file_field_names
 
+from .logic.expressions import clear_compiled_expressions
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,16 @@ def delete_submission_report_files(
     instance.content.delete(save=False)
 
 
+@receiver(post_save, sender=FormLogic, dispatch_uid="submission.clear_compiled_logic")
+@receiver(
+    post_delete,
+    sender=FormLogic,
+    dispatch_uid="submission.clear_deleted_compiled_logic",
+)
+def clear_compiled_logic(sender: type[FormLogic], instance: FormLogic, **kwargs):
+    clear_compiled_expressions(instance.pk)
+
+
 @receiver(submission_complete, dispatch_uid="submission.increment_form_counter")
 def increment_form_counter(sender, instance: Submission, **kwargs):
     submitted_form = instance.form
@@ -3,10 +3,14 @@ Utility to interact with the celery task status.
 """
 
 from dataclasses import dataclass
+from typing import Sequence
 
+from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 
 from celery import states
+from celery.backends.base import KeyValueStoreBackend
 from celery.result import AsyncResult
 from rest_framework.request import Request
 
@@ -16,6 +20,64 @@ from .constants import ProcessingResults, ProcessingStatuses
 from .models import Submission
 from .utils import add_submmission_to_session, get_report_download_url
 
+TASK_STATE_CACHE_PREFIX = "submission-task-state"
+
+
+def _get_state_cache_key(result: AsyncResult) -> str:
+    return f"{TASK_STATE_CACHE_PREFIX}:{result.id}"
+
+
+def _fetch_task_states(results: Sequence[AsyncResult]) -> list[str]:
+    backend = results[0].backend
+    # key-value stores (like Redis) can retrieve all the task metadata at once
+    if not isinstance(backend, KeyValueStoreBackend):
+        return [result.state for result in results]
+
+    keys = [backend.get_key_for_task(result.id) for result in results]
+    values = backend.mget(keys)
+    if hasattr(values, "get"):
+        values = [values.get(key) for key in keys]
+    return [
+        backend.decode_result(value)["status"] if value else states.PENDING
+        for value in values
+    ]
+
+
+def get_task_states(results: Sequence[AsyncResult]) -> list[str]:
+    """
+    Retrieve the states of the tasks with as few result backend calls as possible.
+
+    The states of all tasks are fetched in a single call if the result backend
+    supports it. Ready (final) states are cached for
+    ``settings.SUBMISSION_TASK_STATE_CACHE_TIMEOUT`` seconds, if enabled.
+
+    :returns: The task states, in the same order as ``results``.
+    """
+    if not results:
+        return []
+
+    timeout = settings.SUBMISSION_TASK_STATE_CACHE_TIMEOUT
+    cache_keys = [_get_state_cache_key(result) for result in results]
+    cached = cache.get_many(cache_keys) if timeout else {}
+
+    missing = [result for result, key in zip(results, cache_keys) if key not in cached]
+    if missing:
+        fetched = dict(
+            zip(map(_get_state_cache_key, missing), _fetch_task_states(missing))
+        )
+        if timeout:
+            cache.set_many(
+                {
+                    key: state
+                    for key, state in fetched.items()
+                    if state in states.READY_STATES
+                },
+                timeout=timeout,
+            )
+        cached.update(fetched)
+
+    return [cached[key] for key in cache_keys]
+
 
 @dataclass
 class SubmissionProcessingStatus:
@@ -24,11 +86,22 @@ class SubmissionProcessingStatus:
 
     def get_async_results(self) -> list[AsyncResult]:
         """Retrieve the results for the task scheduled ONLY when the submission was completed."""
-        if not hasattr(self, "_async_result"):
+        if not hasattr(self, "_async_results"):
             task_ids = self.submission.post_completion_task_ids
             self._async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._async_results
 
+    def get_task_states(self) -> list[str]:
+        """
+        Retrieve the states of the tasks scheduled when the submission was completed.
+
+        The states are retrieved once, so that the status and result are derived from
+        the same snapshot.
+        """
+        if not hasattr(self, "_task_states"):
+            self._task_states = get_task_states(self.get_async_results())
+        return self._task_states
+
     def get_all_async_results(self) -> list[AsyncResult]:
         """Retrieve the results for ALL tasks scheduled while processing a submission.
 
@@ -50,10 +123,10 @@ class SubmissionProcessingStatus:
 
     @property
     def status(self) -> str:
-        results = self.get_async_results()
-        any_failed = any((result.state == states.FAILURE for result in results))
-        all_ready = all((result.state in states.READY_STATES for result in results))
-        if results and (any_failed or all_ready):
+        task_states = self.get_task_states()
+        any_failed = any(state == states.FAILURE for state in task_states)
+        all_ready = all(state in states.READY_STATES for state in task_states)
+        if task_states and (any_failed or all_ready):
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
@@ -62,9 +135,9 @@ class SubmissionProcessingStatus:
         if self.status != ProcessingStatuses.done:
             return ""
 
-        results = self.get_async_results()
-        all_success = all((result.state == states.SUCCESS for result in results))
-        any_failed = any((result.state == states.FAILURE for result in results))
+        task_states = self.get_task_states()
+        all_success = all(state == states.SUCCESS for state in task_states)
+        any_failed = any(state == states.FAILURE for state in task_states)
 
         if all_success:
             return ProcessingResults.success
@@ -135,6 +208,7 @@ class SubmissionProcessingStatus:
         results = self.get_all_async_results()
         for result in results:
             result.forget()
+        cache.delete_many([_get_state_cache_key(result) for result in results])
 
     def ensure_failure_can_be_managed(self) -> None:
         """
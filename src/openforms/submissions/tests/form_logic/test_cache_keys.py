@@ -0,0 +1,63 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from ...logic.caching import get_cache_key, get_cache_stats, get_or_set
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class LogicCachingTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(cache.clear)
+
+    def test_cache_key_is_deterministic(self):
+        key = get_cache_key("dmn", "a-uuid", {"b": 1, "a": date(2024, 1, 1)})
+
+        # independent of the (randomized) builtin hash and of the key ordering
+        self.assertEqual(
+            key,
+            get_cache_key("dmn", "a-uuid", {"a": date(2024, 1, 1), "b": 1}),
+        )
+        self.assertRegex(key, r"^logic:dmn:v1:[0-9a-f]{64}$")
+
+    def test_cache_key_differs_per_namespace_and_inputs(self):
+        keys = {
+            get_cache_key("dmn", "a-uuid", {"a": 1}),
+            get_cache_key("service-fetch", "a-uuid", {"a": 1}),
+            get_cache_key("dmn", "a-uuid", {"a": 2}),
+            get_cache_key("dmn", "other-uuid", {"a": 1}),
+        }
+
+        self.assertEqual(len(keys), 4)
+
+    @override_settings(LOGIC_CACHE_STATS=True)
+    def test_get_or_set_counts_hits_and_misses(self):
+        default = MagicMock(return_value={"result": None})
+
+        for _ in range(3):
+            value = get_or_set("test", ("a-uuid",), default=default)
+
+        self.assertEqual(value, {"result": None})
+        default.assert_called_once()
+        self.assertEqual(get_cache_stats("test"), {"hits": 2, "misses": 1})
+
+    def test_cached_none_values_are_hits(self):
+        default = MagicMock(return_value=None)
+
+        get_or_set("test", ("a-uuid",), default=default)
+        get_or_set("test", ("a-uuid",), default=default)
+
+        default.assert_called_once()
+
+    @override_settings(LOGIC_CACHE_STATS=False)
+    def test_hits_and_misses_not_counted_by_default(self):
+        get_or_set("test", ("a-uuid",), default=MagicMock(return_value=None))
+        get_or_set("test", ("a-uuid",), default=MagicMock(return_value=None))
+
+        self.assertEqual(get_cache_stats("test"), {"hits": 0, "misses": 0})
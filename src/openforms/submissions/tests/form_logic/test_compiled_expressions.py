@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from openforms.forms.tests.factories import FormLogicFactory
+
+from ...logic.expressions import (
+    _compiled_expressions,
+    clear_compiled_expressions,
+    get_compiled_expression,
+)
+
+
+class CompiledExpressionCacheTests(TestCase):
+    def test_compiled_expression_cached_per_rule(self):
+        rule = FormLogicFactory.create(json_logic_trigger={"var": "foo"})
+
+        compiled1 = get_compiled_expression(rule, "trigger", rule.json_logic_trigger)
+        compiled2 = get_compiled_expression(rule, "trigger", rule.json_logic_trigger)
+
+        self.assertIs(compiled1, compiled2)
+        self.assertEqual(compiled1({"foo": "bar"}), "bar")
+
+    def test_cache_invalidated_on_save(self):
+        rule = FormLogicFactory.create(json_logic_trigger={"var": "foo"})
+        get_compiled_expression(rule, "trigger", rule.json_logic_trigger)
+
+        rule.json_logic_trigger = {"var": "bar"}
+        rule.save()
+
+        self.assertNotIn((rule.pk, "trigger"), _compiled_expressions)
+
+    def test_changed_expression_is_recompiled(self):
+        rule = FormLogicFactory.create(json_logic_trigger={"var": "foo"})
+        get_compiled_expression(rule, "trigger", rule.json_logic_trigger)
+
+        # e.g. modified in another process
+        rule.json_logic_trigger["var"] = "bar"
+        compiled = get_compiled_expression(rule, "trigger", rule.json_logic_trigger)
+
+        self.assertEqual(compiled({"foo": 1, "bar": 2}), 2)
+
+    @patch("openforms.submissions.logic.expressions.COMPILED_EXPRESSIONS_CACHE_SIZE", 2)
+    def test_least_recently_used_expressions_discarded(self):
+        rule1, rule2, rule3 = FormLogicFactory.create_batch(
+            3, json_logic_trigger={"var": "foo"}
+        )
+        self.addCleanup(_compiled_expressions.clear)
+        _compiled_expressions.clear()
+
+        get_compiled_expression(rule1, "trigger", rule1.json_logic_trigger)
+        get_compiled_expression(rule2, "trigger", rule2.json_logic_trigger)
+        get_compiled_expression(rule1, "trigger", rule1.json_logic_trigger)
+        get_compiled_expression(rule3, "trigger", rule3.json_logic_trigger)
+
+        self.assertEqual(
+            list(_compiled_expressions), [(rule1.pk, "trigger"), (rule3.pk, "trigger")]
+        )
+
+    @patch("openforms.submissions.logic.expressions.COMPILED_EXPRESSIONS_CACHE_SIZE", 2)
+    def test_concurrent_access(self):
+        rules = FormLogicFactory.create_batch(4, json_logic_trigger={"var": "foo"})
+        self.addCleanup(_compiled_expressions.clear)
+
+        def use_cache(index: int):
+            rule = rules[index % len(rules)]
+            for _ in range(200):
+                compiled = get_compiled_expression(
+                    rule, "trigger", rule.json_logic_trigger
+                )
+                assert compiled({"foo": index}) == index
+                clear_compiled_expressions(rules[(index + 1) % len(rules)].pk)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # re-raises any exception raised in the threads
+            list(executor.map(use_cache, range(16)))
+
+        self.assertLessEqual(len(_compiled_expressions), 2)
@@ -0,0 +1,212 @@
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.tests.factories import FormLogicFactory
+
+from ...logic.concurrency import ExternalCalls
+from ...logic.datastructures import DataContainer
+from ...logic.rules import get_rules_to_evaluate, iter_evaluate_rules
+from ..factories import SubmissionFactory
+
+
+def _dmn_action(input_variable: str, output_variable: str) -> dict:
+    return {
+        "action": {
+            "type": LogicActionTypes.evaluate_dmn,
+            "config": {
+                "plugin_id": "camunda7",
+                "decision_definition_id": f"decision-{output_variable}",
+                "decision_definition_version": "1",
+                "input_mapping": [
+                    {"form_variable": input_variable, "dmn_variable": "input"}
+                ],
+                "output_mapping": [
+                    {"form_variable": output_variable, "dmn_variable": "output"}
+                ],
+            },
+        },
+    }
+
+
+class ExternalCallsTests(SimpleTestCase):
+    def test_single_call_performed_in_calling_thread(self):
+        external_calls = ExternalCalls(max_workers=5)
+        self.addCleanup(external_calls.close)
+
+        external_calls.add(
+            lambda: {"thread": threading.get_ident()}, outputs=frozenset(), key="a"
+        )
+        results = external_calls.resolve()
+
+        self.assertEqual(results, [("a", {"thread": threading.get_ident()})])
+
+    def test_results_returned_in_order_added(self):
+        external_calls = ExternalCalls(max_workers=5)
+        self.addCleanup(external_calls.close)
+
+        def slow():
+            time.sleep(0.1)
+            return {"a": "slow"}
+
+        external_calls.add(slow, outputs=frozenset(["a"]), key="first")
+        external_calls.add(lambda: {"b": "fast"}, outputs=frozenset(["b"]), key="2nd")
+        results = external_calls.resolve()
+
+        self.assertEqual(results, [("first", {"a": "slow"}), ("2nd", {"b": "fast"})])
+        self.assertEqual(len(external_calls), 0)
+
+    def test_conflicts(self):
+        external_calls = ExternalCalls(max_workers=5)
+        self.addCleanup(external_calls.close)
+
+        # nothing pending
+        self.assertFalse(external_calls.conflicts(None))
+
+        external_calls.add(lambda: None, outputs=frozenset(["a.b"]), key="a")
+
+        self.assertTrue(external_calls.conflicts(None))
+        self.assertTrue(external_calls.conflicts({"a"}))
+        self.assertTrue(external_calls.conflicts({"a.b.c"}))
+        self.assertTrue(external_calls.conflicts(set(), outputs={"a.b"}))
+        self.assertFalse(external_calls.conflicts({"c"}, outputs={"d"}))
+
+
+@override_settings(LOGIC_EXTERNAL_CALLS_MAX_WORKERS=5)
+class ConcurrentLogicEvaluationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(cache.clear)
+
+    def _evaluate(self, submission):
+        data_container = DataContainer(
+            state=submission.load_submission_value_variables_state()
+        )
+        rules = get_rules_to_evaluate(submission)
+        operations = list(iter_evaluate_rules(rules, data_container, submission))
+        return operations, data_container.data
+
+    def test_independent_calls_performed_concurrently(self):
+        submission = SubmissionFactory.from_components(
+            [
+                {"type": "textfield", "key": "a"},
+                {"type": "textfield", "key": "b"},
+                {"type": "textfield", "key": "resultA"},
+                {"type": "textfield", "key": "resultB"},
+                {"type": "textfield", "key": "combined"},
+            ],
+            submitted_data={"a": "1", "b": "2"},
+        )
+        rule1 = FormLogicFactory.create(
+            form=submission.form,
+            json_logic_trigger=True,
+            actions=[_dmn_action("a", "resultA")],
+        )
+        rule2 = FormLogicFactory.create(
+            form=submission.form,
+            json_logic_trigger=True,
+            actions=[_dmn_action("b", "resultB")],
+        )
+        rule3 = FormLogicFactory.create(
+            form=submission.form,
+            json_logic_trigger={"!!": {"var": "resultA"}},
+            actions=[
+                {
+                    "variable": "combined",
+                    "action": {
+                        "type": LogicActionTypes.variable,
+                        "value": {"cat": [{"var": "resultA"}, {"var": "resultB"}]},
+                    },
+                }
+            ],
+        )
+        # both calls must be in flight at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def evaluate_dmn(definition_id, input_values, **kwargs):
+            barrier.wait()
+            return {"output": f"{definition_id}:{input_values['input']}"}
+
+        with patch(
+            "openforms.submissions.logic.actions.evaluate_dmn",
+            side_effect=evaluate_dmn,
+        ):
+            operations, data = self._evaluate(submission)
+
+        self.assertEqual(data["resultA"], "decision-resultA:1")
+        self.assertEqual(data["resultB"], "decision-resultB:2")
+        self.assertEqual(data["combined"], "decision-resultA:1decision-resultB:2")
+        self.assertEqual(
+            [operation.rule for operation in operations], [rule1, rule2, rule3]
+        )
+
+    def test_dependent_calls_performed_in_order(self):
+        submission = SubmissionFactory.from_components(
+            [
+                {"type": "textfield", "key": "a"},
+                {"type": "textfield", "key": "resultA"},
+                {"type": "textfield", "key": "resultB"},
+            ],
+            submitted_data={"a": "1"},
+        )
+        FormLogicFactory.create(
+            form=submission.form,
+            json_logic_trigger=True,
+            actions=[_dmn_action("a", "resultA")],
+        )
+        FormLogicFactory.create(
+            form=submission.form,
+            json_logic_trigger=True,
+            actions=[_dmn_action("resultA", "resultB")],
+        )
+        calling_threads = set()
+
+        def evaluate_dmn(definition_id, input_values, **kwargs):
+            calling_threads.add(threading.get_ident())
+            return {"output": f"{definition_id}:{input_values['input']}"}
+
+        with patch(
+            "openforms.submissions.logic.actions.evaluate_dmn",
+            side_effect=evaluate_dmn,
+        ):
+            _, data = self._evaluate(submission)
+
+        self.assertEqual(data["resultB"], "decision-resultB:decision-resultA:1")
+        self.assertEqual(calling_threads, {threading.get_ident()})
+
+    @override_settings(LOGIC_EXTERNAL_CALLS_MAX_WORKERS=1)
+    def test_concurrency_disabled(self):
+        submission = SubmissionFactory.from_components(
+            [
+                {"type": "textfield", "key": "a"},
+                {"type": "textfield", "key": "b"},
+                {"type": "textfield", "key": "resultA"},
+                {"type": "textfield", "key": "resultB"},
+            ],
+            submitted_data={"a": "1", "b": "2"},
+        )
+        FormLogicFactory.create(
+            form=submission.form,
+            json_logic_trigger=True,
+            actions=[_dmn_action("a", "resultA"), _dmn_action("b", "resultB")],
+        )
+        calling_threads = set()
+
+        def evaluate_dmn(definition_id, input_values, **kwargs):
+            calling_threads.add(threading.get_ident())
+            return {"output": input_values["input"]}
+
+        with patch(
+            "openforms.submissions.logic.actions.evaluate_dmn",
+            side_effect=evaluate_dmn,
+        ):
+            _, data = self._evaluate(submission)
+
+        self.assertEqual(data["resultA"], "1")
+        self.assertEqual(data["resultB"], "2")
+        self.assertEqual(calling_threads, {threading.get_ident()})
@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+    FormVariableFactory,
+)
+from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
+
+from ...form_logic import evaluate_form_logic
+from ...logic.datastructures import DataContainer
+from ...models import SubmissionValueVariable
+from ..factories import SubmissionFactory, SubmissionStepFactory
+
+
+class DataContainerTests(TestCase):
+    def test_incremental_update_matches_full_rebuild(self):
+        form = FormFactory.create()
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "foo"},
+                    {"type": "textfield", "key": "nested.bar"},
+                    {"type": "textfield", "key": "nested.baz"},
+                ]
+            },
+        )
+        submission = SubmissionFactory.create(form=form)
+        state = submission.load_submission_value_variables_state()
+        data_container = DataContainer(state=state)
+
+        data_container.update({"foo": "updated", "nested": {"bar": "also updated"}})
+
+        rebuilt = DataContainer(state=state)
+        self.assertEqual(data_container.data, rebuilt.data)
+        self.assertEqual(data_container.data["foo"], "updated")
+        self.assertEqual(
+            data_container.data["nested"], {"bar": "also updated", "baz": ""}
+        )
+
+    def test_handed_out_values_are_not_mutated(self):
+        form = FormFactory.create()
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "nested.bar"},
+                ]
+            },
+        )
+        submission = SubmissionFactory.create(form=form)
+        state = submission.load_submission_value_variables_state()
+        data_container = DataContainer(state=state)
+        nested_before = data_container.data["nested"]
+
+        data_container.update({"nested.bar": "updated"})
+
+        self.assertEqual(nested_before, {"bar": ""})
+        self.assertEqual(data_container.initial_data["nested"], {"bar": ""})
+        self.assertEqual(data_container.data["nested"], {"bar": "updated"})
+
+
+class DataContainerBenchmarkTests(TestCase):
+    """
+    Count the variable (de)serializations performed during a logic pass.
+
+    Counting operations rather than timing them keeps the benchmark deterministic.
+    """
+
+    def test_logic_pass_cost_is_linear_in_rules_and_changed_keys(self):
+        num_variables = 100
+        num_rules = 50
+        form = FormFactory.create()
+        step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "number", "key": f"field{index}"}
+                    for index in range(num_variables)
+                ]
+            },
+        )
+        FormVariableFactory.create(
+            form=form,
+            key="total",
+            source=FormVariableSources.user_defined,
+            data_type=FormVariableDataTypes.float,
+            initial_value=0,
+        )
+        for index in range(num_rules):
+            FormLogicFactory.create(
+                form=form,
+                json_logic_trigger={"!=": [{"var": f"field{index}"}, None]},
+                actions=[
+                    {
+                        "variable": "total",
+                        "action": {
+                            "type": "variable",
+                            "value": {
+                                "+": [{"var": "total"}, {"var": f"field{index}"}]
+                            },
+                        },
+                    }
+                ],
+            )
+        submission = SubmissionFactory.create(form=form)
+        submission_step = SubmissionStepFactory.build(
+            submission=submission, form_step=step, data={}
+        )
+        data = {f"field{index}": 1 for index in range(num_variables)}
+
+        with patch.object(
+            SubmissionValueVariable,
+            "to_python",
+            autospec=True,
+            side_effect=lambda variable: variable.value,
+        ) as mock_to_python:
+            evaluate_form_logic(submission, submission_step, data)
+
+        state = submission.load_submission_value_variables_state()
+        self.assertEqual(state.get_variable("total").value, num_rules)
+        # one full materialization plus one conversion per changed key, instead of
+        # a full rebuild for every rule trigger and every action evaluation
+        total_variables = len(state.variables)
+        self.assertLessEqual(mock_to_python.call_count, total_variables + num_rules)
@@ -203,6 +203,90 @@ class CheckLogicEndpointTests(SubmissionsMixin, APITestCase):
 
         self.assertTrue(data["submission"]["steps"][2]["isApplicable"])
 
+    def test_delta_responses(self):
+        form = FormFactory.create()
+        form_step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name"},
+                    {"type": "number", "key": "total"},
+                    {
+                        "type": "fieldset",
+                        "key": "fieldset",
+                        "components": [
+                            {"type": "textfield", "key": "nick_name", "hidden": False}
+                        ],
+                    },
+                ]
+            },
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "name"}, "Jo"]},
+            actions=[
+                {
+                    "component": "nick_name",
+                    "action": {
+                        "type": "property",
+                        "property": {"type": "bool", "value": "hidden"},
+                        "state": True,
+                    },
+                },
+                {
+                    "variable": "total",
+                    "action": {"type": "variable", "value": 10},
+                },
+            ],
+        )
+        submission = SubmissionFactory.create(form=form)
+        endpoint = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={"submission_uuid": submission.uuid, "step_uuid": form_step.uuid},
+        )
+        self._add_submission_to_session(submission)
+
+        with self.subTest("first call"):
+            response = self.client.post(
+                f"{endpoint}?delta=", data={"data": {"name": "Jan", "total": 1}}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn("formStep", response.json()["step"])
+            etag = response["ETag"]
+
+        with self.subTest("changes since the previous call"):
+            response = self.client.post(
+                f"{endpoint}?delta={etag}", data={"data": {"name": "Jo", "total": 1}}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            step = response.json()["step"]
+            self.assertNotIn("formStep", step)
+            self.assertEqual(list(step["configuration"]), ["nick_name"])
+            self.assertTrue(step["configuration"]["nick_name"]["hidden"])
+            self.assertEqual(step["data"], {"total": 10})
+            self.assertNotEqual(response["ETag"], etag)
+            etag = response["ETag"]
+
+        with self.subTest("same override after the user changed the value"):
+            response = self.client.post(
+                f"{endpoint}?delta={etag}", data={"data": {"name": "Jo", "total": 3}}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            step = response.json()["step"]
+            self.assertEqual(step["configuration"], {})
+            self.assertEqual(step["data"], {"total": 10})
+            self.assertEqual(response["ETag"], etag)
+
+        with self.subTest("unknown previous state"):
+            response = self.client.post(
+                f"{endpoint}?delta=unknown", data={"data": {"name": "Jo"}}
+            )
+
+            self.assertIn("formStep", response.json()["step"])
+
     @tag("gh-3647")
     def test_sending_invalid_time_values(self):
         submission = SubmissionFactory.from_components(
@@ -0,0 +1,207 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import FormStep
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+    FormVariableFactory,
+)
+from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
+
+from ...form_logic import evaluate_form_logic
+from ...logic.dependencies import (
+    _snapshots,
+    get_affected_rules,
+    get_changed_keys,
+    get_data_digests,
+    get_rule_dependencies,
+    get_snapshot_cache_key,
+)
+from ...logic.expressions import get_compiled_expression
+from ...models import Submission
+from ..factories import SubmissionFactory, SubmissionStepFactory
+
+
+class RuleDependenciesTests(TestCase):
+    def test_inputs_and_outputs(self):
+        rule = FormLogicFactory.build(
+            json_logic_trigger={"==": [{"var": "foo"}, "bar"]},
+            actions=[
+                {
+                    "variable": "total",
+                    "action": {
+                        "type": LogicActionTypes.variable,
+                        "value": {"+": [{"var": "a"}, {"var": ["b.c", 0]}]},
+                    },
+                },
+                {
+                    "component": "foo",
+                    "action": {
+                        "type": LogicActionTypes.property,
+                        "property": {"value": "hidden"},
+                        "state": True,
+                    },
+                },
+            ],
+        )
+
+        dependencies = get_rule_dependencies(rule)
+
+        self.assertEqual(dependencies.inputs, {"foo", "a", "b.c"})
+        self.assertEqual(dependencies.outputs, {"total"})
+        self.assertFalse(dependencies.volatile)
+
+    def test_untrackable_inputs_are_volatile(self):
+        expressions = (
+            {"var": {"cat": ["foo", "bar"]}},
+            {"var": ""},
+            {"missing": ["foo"]},
+        )
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                rule = FormLogicFactory.build(json_logic_trigger=expression, actions=[])
+
+                dependencies = get_rule_dependencies(rule)
+
+                self.assertTrue(dependencies.volatile)
+
+    def test_external_actions_are_volatile_with_known_outputs(self):
+        rule = FormLogicFactory.build(
+            json_logic_trigger=True,
+            actions=[
+                {
+                    "variable": "fetched",
+                    "action": {"type": LogicActionTypes.fetch_from_service},
+                }
+            ],
+        )
+
+        dependencies = get_rule_dependencies(rule)
+
+        self.assertTrue(dependencies.volatile)
+        self.assertEqual(dependencies.outputs, {"fetched"})
+
+    def test_affected_rules_are_resolved_transitively(self):
+        rules = [
+            FormLogicFactory.build(
+                pk=1,
+                json_logic_trigger={"var": "foo"},
+                actions=[
+                    {
+                        "variable": "bar",
+                        "action": {"type": "variable", "value": {"var": "foo"}},
+                    }
+                ],
+            ),
+            FormLogicFactory.build(
+                pk=2, json_logic_trigger={"var": "bar.nested"}, actions=[]
+            ),
+            FormLogicFactory.build(pk=3, json_logic_trigger={"var": "baz"}, actions=[]),
+        ]
+        dependencies = {rule.pk: get_rule_dependencies(rule) for rule in rules}
+
+        affected = get_affected_rules(rules, dependencies, changed_keys={"foo"})
+
+        self.assertEqual(affected, {1, 2})
+
+    def test_changed_keys_from_data_digests(self):
+        old = get_data_digests({"a": 1, "b": {"nested": "foo"}, "c": date(2024, 1, 1)})
+        new = get_data_digests({"a": 1, "b": {"nested": "bar"}, "d": None})
+
+        self.assertNotIn("foo", str(old))
+        self.assertEqual(get_changed_keys(old, new), {"b", "c", "d"})
+
+
+class IncrementalEvaluationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        _snapshots.clear()
+        self.addCleanup(_snapshots.clear)
+
+    def test_only_affected_rules_evaluated_with_same_result(self):
+        form = FormFactory.create()
+        step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "number", "key": "a"},
+                    {"type": "number", "key": "b"},
+                    {"type": "textfield", "key": "c"},
+                ]
+            },
+        )
+        FormVariableFactory.create(
+            form=form,
+            key="double",
+            source=FormVariableSources.user_defined,
+            data_type=FormVariableDataTypes.float,
+            initial_value=0,
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={">": [{"var": "a"}, 0]},
+            actions=[
+                {
+                    "variable": "double",
+                    "action": {
+                        "type": "variable",
+                        "value": {"*": [{"var": "a"}, 2]},
+                    },
+                }
+            ],
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={">": [{"var": "b"}, 0]},
+            actions=[
+                {
+                    "component": "c",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        submission = SubmissionFactory.create(form=form)
+
+        def _check(data):
+            # fresh instances, like separate requests would have
+            fresh_submission = Submission.objects.get(pk=submission.pk)
+            submission_step = SubmissionStepFactory.build(
+                submission=fresh_submission,
+                form_step=FormStep.objects.get(pk=step.pk),
+                data={},
+            )
+            configuration = evaluate_form_logic(
+                fresh_submission, submission_step, data, dirty=True
+            )
+            state = fresh_submission.load_submission_value_variables_state()
+            return configuration, state.get_variable("double").value
+
+        with patch(
+            "openforms.submissions.logic.rules.get_compiled_expression",
+            wraps=get_compiled_expression,
+        ) as mock_get_trigger:
+            _check({"a": 1, "b": 1, "c": ""})
+            self.assertEqual(mock_get_trigger.call_count, 2)
+
+            mock_get_trigger.reset_mock()
+            configuration, double = _check({"a": 2, "b": 1, "c": ""})
+
+        # only the trigger of the first rule was evaluated, the second was replayed
+        self.assertEqual(mock_get_trigger.call_count, 1)
+        self.assertEqual(double, 4)
+        self.assertTrue(configuration["components"][2]["hidden"])
+        # the computed values are not stored in the shared cache
+        self.assertIsNone(cache.get(get_snapshot_cache_key(submission.uuid, step.uuid)))
+        self.assertIn(get_snapshot_cache_key(submission.uuid, step.uuid), _snapshots)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 
 from openforms.forms.tests.factories import (
@@ -7,6 +9,7 @@ from openforms.forms.tests.factories import (
 )
 from openforms.variables.constants import FormVariableSources
 
+from ...logic.expressions import get_compiled_expression
 from ...rendering import Renderer, RenderModes
 from ...rendering.nodes import FormNode, SubmissionStepNode
 from ..factories import (
@@ -140,3 +143,68 @@ class FormNodeTests(TestCase):
         # 3. Query the form logic rules for the submission form (and this is cached)
         with self.assertNumQueries(3):
             list(renderer)
+
+
+class RendererLogicEvaluationTests(TestCase):
+    def test_logic_rules_evaluated_once_for_all_steps(self):
+        form = FormFactory.create()
+        form_steps = [
+            FormStepFactory.create(
+                form=form,
+                form_definition__configuration={
+                    "components": [{"type": "textfield", "key": f"input{index}"}]
+                },
+            )
+            for index in range(1, 4)
+        ]
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "input1"}, "hide"]},
+            actions=[
+                {
+                    "component": "input2",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger=True,
+            actions=[
+                {
+                    "variable": "input3",
+                    "action": {
+                        "type": "variable",
+                        "value": {"cat": [{"var": "input1"}, "!"]},
+                    },
+                }
+            ],
+        )
+        submission = SubmissionFactory.create(form=form)
+        for form_step, data in zip(
+            form_steps, ({"input1": "hide"}, {"input2": "foo"}, {"input3": ""})
+        ):
+            SubmissionStepFactory.create(
+                submission=submission, form_step=form_step, data=data
+            )
+        renderer = Renderer(submission=submission, mode=RenderModes.pdf, as_html=False)
+
+        with patch(
+            "openforms.submissions.logic.rules.get_compiled_expression",
+            wraps=get_compiled_expression,
+        ) as mock_get_trigger:
+            list(renderer)
+
+        # the triggers are evaluated for the first step, and replayed for the others
+        self.assertEqual(mock_get_trigger.call_count, 2)
+        submission_steps = submission.load_execution_state().submission_steps
+        step2_configuration = submission_steps[
+            1
+        ].form_step.form_definition.configuration
+        self.assertTrue(step2_configuration["components"][0]["hidden"])
+        state = submission.load_submission_value_variables_state()
+        self.assertEqual(state.get_variable("input3").value, "hide!")
@@ -1,14 +1,18 @@
 from datetime import datetime
+from io import BytesIO
 
+from django.http import StreamingHttpResponse
 from django.test import TestCase, tag
 from django.utils import timezone
 
 from freezegun import freeze_time
+from lxml import etree
+from openpyxl import load_workbook
 
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 from openforms.variables.constants import FormVariableSources
 
-from ..exports import create_submission_export
+from ..exports import ExportFileTypes, create_submission_export, export_submissions
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -266,3 +270,70 @@ class ExportTests(TestCase):
         export = create_submission_export(Submission.objects.all())
 
         self.assertIn(("Taalcode", "en"), zip(export.headers, export[0]))
+
+
+@freeze_time("2022-05-09T13:00:00Z")
+class ExportResponseTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "input1"}],
+            submitted_data={"input1": "first"},
+            form__name="Export test",
+            completed=True,
+            completed_on=timezone.now(),
+        )
+        form_step = submission.form.formstep_set.get()
+        for value in ("second", "third"):
+            SubmissionStepFactory.create(
+                submission__form=submission.form,
+                submission__completed=True,
+                submission__completed_on=timezone.now(),
+                form_step=form_step,
+                data={"input1": value},
+            )
+
+    def setUp(self):
+        super().setUp()
+
+        self.queryset = Submission.objects.order_by("pk")
+        self.dataset = create_submission_export(self.queryset)
+
+    def test_csv_and_json_streamed(self):
+        for file_type in (ExportFileTypes.CSV, ExportFileTypes.JSON):
+            with self.subTest(file_type=file_type.extension):
+                response = export_submissions(self.queryset, file_type)
+
+                self.assertIsInstance(response, StreamingHttpResponse)
+                self.assertEqual(response["Content-Type"], file_type.content_type)
+                self.assertEqual(
+                    response.getvalue().decode(),
+                    self.dataset.export(file_type.extension),
+                )
+
+    def test_xlsx(self):
+        response = export_submissions(self.queryset, ExportFileTypes.XLSX)
+
+        workbook = load_workbook(BytesIO(response.getvalue()))
+        rows = list(workbook.active.values)
+        self.assertEqual(rows[0], ("Formuliernaam", "Inzendingdatum", "input1"))
+        self.assertEqual(
+            [row[2] for row in rows[1:]],
+            ["first", "second", "third"],
+        )
+
+    def test_xml(self):
+        response = export_submissions(self.queryset, ExportFileTypes.XML)
+
+        root = etree.fromstring(response.getvalue())
+        self.assertEqual(
+            root.xpath("//field[@name='input1']/value/text()"),
+            ["first", "second", "third"],
+        )
+
+    def test_empty_queryset(self):
+        response = export_submissions(Submission.objects.none(), ExportFileTypes.JSON)
+
+        self.assertEqual(response.getvalue(), b"[]")
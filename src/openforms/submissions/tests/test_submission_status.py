@@ -1,11 +1,15 @@
 from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
+from uuid import uuid4
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
 
 from celery import states
+from celery.backends.cache import CacheBackend
+from celery.result import AsyncResult
 from freezegun import freeze_time
 from privates.test import temp_private_root
 from rest_framework import status
@@ -13,6 +17,7 @@ from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from openforms.appointments.tests.factories import AppointmentInfoFactory
+from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
 from openforms.payments.constants import PaymentStatus
 from openforms.payments.contrib.ogone.tests.factories import OgoneMerchantFactory
@@ -24,6 +29,7 @@ from ..constants import (
     ProcessingResults,
     ProcessingStatuses,
 )
+from ..status import get_task_states
 from ..tasks import cleanup_on_completion_results
 from ..tokens import submission_status_token_generator
 from .factories import (
@@ -514,3 +520,63 @@ class CleanupTaskTests(TestCase):
         cleanup_on_completion_results()
 
         self.assertEqual(0, mock_forget.call_count)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class TaskStatesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.backend = CacheBackend(app=app, backend="memory")
+        self.addCleanup(cache.clear)
+
+    def _create_result(self, state: str = "") -> AsyncResult:
+        task_id = str(uuid4())
+        if state:
+            self.backend.store_result(task_id, None, state)
+        return AsyncResult(task_id, backend=self.backend, app=app)
+
+    def test_states_retrieved_in_one_call(self):
+        results = [
+            self._create_result(states.SUCCESS),
+            self._create_result(states.STARTED),
+            self._create_result(),
+        ]
+
+        with (
+            patch.object(self.backend, "mget", wraps=self.backend.mget) as mock_mget,
+            patch.object(self.backend, "get", wraps=self.backend.get) as mock_get,
+        ):
+            task_states = get_task_states(results)
+
+        self.assertEqual(task_states, [states.SUCCESS, states.STARTED, states.PENDING])
+        mock_mget.assert_called_once()
+        mock_get.assert_not_called()
+
+    @override_settings(SUBMISSION_TASK_STATE_CACHE_TIMEOUT=10)
+    def test_ready_states_cached(self):
+        results = [
+            self._create_result(states.SUCCESS),
+            self._create_result(states.STARTED),
+        ]
+        get_task_states(results)
+
+        with patch.object(self.backend, "mget", wraps=self.backend.mget) as mock_mget:
+            task_states = get_task_states(results)
+
+        self.assertEqual(task_states, [states.SUCCESS, states.STARTED])
+        # only the in-progress task is looked up again
+        mock_mget.assert_called_once_with(
+            [self.backend.get_key_for_task(results[1].id)]
+        )
+
+    def test_states_not_cached_by_default(self):
+        result = self._create_result(states.SUCCESS)
+        get_task_states([result])
+
+        with patch.object(self.backend, "mget", wraps=self.backend.mget) as mock_mget:
+            get_task_states([result])
+
+        mock_mget.assert_called_once()
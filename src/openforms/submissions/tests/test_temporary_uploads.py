@@ -29,6 +29,7 @@ from openforms.submissions.tests.mixins import SubmissionsMixin
 from openforms.submissions.utils import (
     add_upload_to_session,
     append_to_session_list,
+    get_session_list,
     remove_from_session_list,
     remove_upload_from_session,
 )
@@ -277,3 +278,42 @@ class TemporaryFileUploadTest(SubmissionsMixin, APITestCase):
 
         remove_upload_from_session(upload_1, session)
         self.assertEqual([str(upload_2.uuid)], session_uploads)
+
+    def test_session_list_concurrent_updates(self):
+        # the same session, loaded by parallel requests
+        session1 = self.client.session
+        session2 = self.client.session
+
+        append_to_session_list(session1, UPLOADS_SESSION_KEY, "upload-1")
+        session1.save()
+        append_to_session_list(session2, UPLOADS_SESSION_KEY, "upload-2")
+        # overwrites the session data saved by the other request
+        session2.save()
+
+        session = self.client.session
+        self.assertEqual(
+            set(get_session_list(session, UPLOADS_SESSION_KEY)),
+            {"upload-1", "upload-2"},
+        )
+
+        remove_from_session_list(session, UPLOADS_SESSION_KEY, "upload-1")
+
+        self.assertEqual(get_session_list(session, UPLOADS_SESSION_KEY), ["upload-2"])
+
+    def test_session_list_removal_with_stale_session_saved(self):
+        session = self.client.session
+        append_to_session_list(session, UPLOADS_SESSION_KEY, "upload-1")
+        session.save()
+        # the same session, loaded by parallel requests
+        session1 = self.client.session
+        session2 = self.client.session
+
+        remove_from_session_list(session1, UPLOADS_SESSION_KEY, "upload-1")
+        session1.save()
+        # overwrites the session data with the removed value
+        session2["unrelated"] = True
+        session2.save()
+
+        session = self.client.session
+        self.assertIn("upload-1", session[UPLOADS_SESSION_KEY])
+        self.assertEqual(get_session_list(session, UPLOADS_SESSION_KEY), [])
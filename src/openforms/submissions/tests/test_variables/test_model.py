@@ -66,6 +66,56 @@ class SubmissionValueVariableModelTests(TestCase):
 
         self.assertEqual(data, {"test1": "some data 1", "test2": "some data 1"})
 
+    def test_get_variables_in_submission_step(self):
+        form = FormFactory.create()
+        form_step1 = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"key": "var1", "type": "textfield"},
+                    {"key": "var2", "type": "textfield"},
+                ]
+            },
+        )
+        form_step2 = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [{"key": "var3", "type": "textfield"}]
+            },
+        )
+        submission = SubmissionFactory.create(form=form)
+        submission_step1 = SubmissionStepFactory.create(
+            submission=submission, form_step=form_step1, data={"var1": "foo"}
+        )
+        submission_step2 = SubmissionStepFactory.create(
+            submission=submission, form_step=form_step2, data={"var3": "bar"}
+        )
+        state = submission.load_submission_value_variables_state()
+
+        with self.subTest("including unsaved variables"):
+            variables = state.get_variables_in_submission_step(submission_step1)
+
+            self.assertEqual(list(variables), ["var1", "var2"])
+
+        with self.subTest("saved variables only"):
+            variables = state.get_variables_in_submission_step(
+                submission_step1, include_unsaved=False
+            )
+
+            self.assertEqual(list(variables), ["var1"])
+
+        with self.subTest("other step"):
+            variables = state.get_variables_in_submission_step(submission_step2)
+
+            self.assertEqual(list(variables), ["var3"])
+
+        with self.subTest("removed variables"):
+            state.remove_variables(["var1"])
+
+            variables = state.get_variables_in_submission_step(submission_step1)
+
+            self.assertEqual(list(variables), ["var2"])
+
     def test_to_python(self):
         """
         Test that the serialized value can be converted to native python objects.
@@ -278,3 +328,19 @@ class SubmissionValueVariableModelTests(TestCase):
         stored = SubmissionValueVariable.objects.get(key=variable1.key)
 
         self.assertEqual(stored.value, 1337)
+
+    def test_value_modified_in_place_has_changed(self):
+        variable = SubmissionValueVariableFactory.create(value={"nested": ["foo"]})
+        loaded = SubmissionValueVariable.objects.get(pk=variable.pk)
+
+        self.assertFalse(loaded.has_changed)
+
+        loaded.value["nested"].append("bar")
+        self.assertTrue(loaded.has_changed)
+
+        loaded.value = {"nested": ["foo"]}
+        self.assertFalse(loaded.has_changed)
+
+        loaded.value = {"nested": ["bar"]}
+        loaded.save()
+        self.assertFalse(loaded.has_changed)
@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework.test import APITestCase
 
 from openforms.forms.tests.factories import (
@@ -157,7 +160,7 @@ class SubmissionVariablesPerformanceTests(APITestCase):
         # 1. load_variables_state: retrieve form variables
         # 2. load_variables_state: retrieve submission value variables
         # 3. bulk_create var3 and var4 submission value variables
-        # 4. bulk_update var1 and var2 submission value variables
+        # 4. upsert var1 and var2 submission value variables
         with self.assertNumQueries(4):
             submission_step.data = {
                 "var1": "test1-modified",
@@ -166,6 +169,51 @@ class SubmissionVariablesPerformanceTests(APITestCase):
                 "var4": "test4",
             }
 
+    def test_update_step_data_writes_changed_values_only(self):
+        """
+        Benchmark the writes of saving a step with 500 fields.
+        """
+        num_fields = 500
+        form_step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"key": f"field{index}", "type": "textfield"}
+                    for index in range(num_fields)
+                ]
+            },
+        )
+        submission = SubmissionFactory.create(form=form_step.form)
+        data = {f"field{index}": f"value {index}" for index in range(num_fields)}
+        submission_step = SubmissionStepFactory.create(
+            submission=submission, form_step=form_step, data=data
+        )
+
+        def get_writes(data) -> list[str]:
+            # start from the persisted state, like a new request
+            del submission._variables_state
+            submission.load_execution_state()
+            with CaptureQueriesContext(connection) as context:
+                submission_step.data = data
+            return [
+                query["sql"]
+                for query in context.captured_queries
+                if not query["sql"].startswith("SELECT")
+            ]
+
+        with self.subTest("unchanged"):
+            self.assertEqual(get_writes(data), [])
+
+        with self.subTest("single value changed"):
+            writes = get_writes({**data, "field0": "modified"})
+
+            self.assertEqual(len(writes), 1)
+            (statement,) = writes
+            self.assertIn("ON CONFLICT", statement)
+            # a single row is written, instead of all the rows of the step
+            self.assertIn("'field0'", statement)
+            self.assertNotIn("'field1'", statement)
+            self.assertLess(len(statement), 1_000)
+
     def test_get_step_data(self):
         form = FormFactory.create()
         form_step = FormStepFactory.create(
@@ -1,13 +1,13 @@
+import hashlib
 import logging
-from contextlib import contextmanager
 from typing import Any
 
 from django.conf import settings
 from django.contrib.sessions.backends.base import SessionBase
-from django.core.cache import caches
 from django.http import HttpRequest
 from django.utils import translation
 
+from django_redis import get_redis_connection
 from furl import furl
 from rest_framework.permissions import SAFE_METHODS
 from rest_framework.request import Request
@@ -41,109 +41,115 @@ from .tokens import submission_report_token_generator
 
 logger = logging.getLogger(__name__)
 
-# with the interval of 0.1s, this gives us 2.0 / 0.1 = 20 concurrent requests,
-# which is far above the typical browser concurrency mode (~6-8 requests).
-SESSION_LOCK_TIMEOUT_SECONDS = 2.0
 
+# Update the Redis set holding the values of a session list atomically. The set is
+# initialized from the list in the session data if it does not exist yet - afterwards,
+# the set is the only source of truth.
+#
+# KEYS[1]: the key of the set
+# ARGV[1]: the expiry age of the session
+# ARGV[2]: the command to apply ("sadd", "srem" or "" to only read the set)
+# ARGV[3]: the value to add/remove
+# ARGV[4...]: the values of the list in the session data
+_UPDATE_SESSION_LIST_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    redis.call("sadd", KEYS[1], unpack(ARGV, 4))
+end
+if ARGV[2] ~= "" then
+    redis.call(ARGV[2], KEYS[1], ARGV[3])
+end
+redis.call("expire", KEYS[1], ARGV[1])
+return redis.call("smembers", KEYS[1])
+"""
+
+# member of every set, so that a set for an empty session list exists
+_SET_MARKER = ""
+
+
+def _get_set_key(session: SessionBase, session_key: str) -> str | None:
+    """
+    Get the key of the Redis set holding the values of the session list.
 
-@contextmanager
-def _session_lock(session: SessionBase, key: str):
+    Only existing sessions have an existing key. If this is a new session, it hasn't
+    been persisted to the backend yet, so there is also no possible race condition and
+    the values are only stored in the session itself.
     """
-    Helper to manage session data mutations for the specified key.
+    if session.session_key is None:
+        return None
+    session_hash = hashlib.sha256(session.session_key.encode("utf-8")).hexdigest()
+    return f"django:session-list:{session_hash}:{session_key}"
 
-    Concurrent session updates see stale data from when the request initially
-    got processed, so any added items from parallel requests is not taken into
-    account. This context manager refreshes the session data just-in-time and uses
-    a Redis distributed lock to synchronize access.
 
-    .. note:: this is pretty deep in Django internals, there doesn't appear to be a
-       public API for things like these :(
+def _update_session_list(
+    session: SessionBase, session_key: str, command: str = "", value: Any = ""
+) -> list[str] | None:
     """
-    # only existing session have an existing key. If this is a new session, it hasn't
-    # been persisted to the backend yet, so there is also no possible race condition.
-    is_new = session.session_key is None
-    if is_new:
-        yield
-        return
+    Apply the command to the Redis set of the session list and return its values, or
+    ``None`` if the session is new.
+    """
+    if (set_key := _get_set_key(session, session_key)) is None:
+        return None
+
+    redis = get_redis_connection("portalocker")
+    members = redis.eval(
+        _UPDATE_SESSION_LIST_SCRIPT,
+        1,
+        set_key,
+        # the lifetime of the session is extended on every request
+        session.get_expiry_age(),
+        command,
+        str(value),
+        _SET_MARKER,
+        *(str(item) for item in session.get(session_key, [])),
+    )
+    return sorted(
+        decoded for member in members if (decoded := member.decode()) != _SET_MARKER
+    )
 
-    # See TODO in settings about renaming this cache
-    redis_cache = caches["portalocker"]
-
-    # make the lock tied to the session itself, so that we don't affect other people's
-    # sessions.
-    cache_key = f"django:session-update:{session.session_key}"
-
-    # this is... tricky. To ensure we aren't still operating on stale data, we refresh
-    # the session data after acquiring a lock so that we're the only one that will be
-    # writing to it.
-    #
-    # For the locking interface, see redis-py :meth:`redis.client.Redis.lock`
-
-    logger.debug("Acquiring session lock for session %s", session.session_key)
-    with redis_cache.lock(
-        cache_key,
-        # max lifetime for the lock itself, must always be provided in case something
-        # crashes and we fail to call release
-        timeout=SESSION_LOCK_TIMEOUT_SECONDS,
-        # wait rather than failing immediately, we are trying to handle parallel
-        # requests here. Can't explicitly specify this, see
-        # https://github.com/jazzband/django-redis/issues/596. redis-py default is True.
-        # blocking=True,
-        # how long we can try to acquire the lock
-        blocking_timeout=SESSION_LOCK_TIMEOUT_SECONDS,
-    ):
-        logger.debug("Got session lock for session %s", session.session_key)
-        # nasty bit... the session itself can already be modified with *other*
-        # information that isn't relevant. So, we load the data from the storage again
-        # and only look at the provided key. If that one is different, we update our
-        # local data. We can not just reset to the result of session.load(), as that
-        # would discard modifications that should be persisted.
-        persisted_data = session.load()
-        if (data_slice := persisted_data.get(key)) != (current := session.get(key)):
-            logger.debug(
-                "Data from storage is different than what we currently have. "
-                "Session %s, key '%s' - in storage: %s, our view: %s",
-                session.session_key,
-                key,
-                data_slice,
-                current,
-            )
-            session[key] = data_slice
-            logger.debug(
-                "Updated key '%s' from storage for session %s", key, session.session_key
-            )
-
-        # execute the calling code and exit, clearing the lock.
-        yield
-
-        logger.debug(
-            "New session data for session %s is: %s",
-            session.session_key,
-            session._session,
-        )
 
-        # ensure we save in-between to persist the modifications, before the request
-        # may even be finished
-        session.save()
-        logger.debug("Saved session data for session %s", session.session_key)
+def get_session_list(session: SessionBase, session_key: str) -> list[str]:
+    """
+    Get the values added to the session list with :func:`append_to_session_list`.
+
+    For existing sessions, the values are read from the Redis set, which includes the
+    values added and excludes the values removed by concurrent requests, even if the
+    session data was loaded (or saved) before.
+    """
+    values = _update_session_list(session, session_key)
+    if values is None:
+        values = [str(value) for value in session.get(session_key, [])]
+    return values
 
 
 def append_to_session_list(session: SessionBase, session_key: str, value: Any) -> None:
-    with _session_lock(session, session_key):
-        active = session.get(session_key, [])
-        if value not in active:
-            active.append(value)
-            session[session_key] = active
+    """
+    Add the value to the session list.
+
+    Concurrent session updates see stale data from when the request initially got
+    processed, so any items added or removed by parallel requests would be lost or
+    restored when the session is saved. For existing sessions, the values are
+    therefore kept in a Redis set, which is updated atomically and does not require
+    the session to be locked, re-loaded or saved. The list in the session data is only
+    used to initialize the set.
+    """
+    # initialize the set before the session data is modified
+    _update_session_list(session, session_key, "sadd", value)
+
+    active = session.get(session_key, [])
+    if value not in active:
+        active.append(value)
+        session[session_key] = active
 
 
 def remove_from_session_list(
     session: SessionBase, session_key: str, value: Any
 ) -> None:
-    with _session_lock(session, session_key):
-        active = session.get(session_key, [])
-        if value in active:
-            active.remove(value)
-            session[session_key] = active
+    _update_session_list(session, session_key, "srem", value)
+
+    active = session.get(session_key, [])
+    if value in active:
+        active.remove(value)
+        session[session_key] = active
 
 
 def add_submmission_to_session(submission: Submission, session: SessionBase) -> None:
@@ -7,26 +7,111 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
 
+* Caching of the compiled string-based templates
+
 Possible future features:
 
-* Caching for string-based templates
 * ...
 """
 
+from functools import lru_cache
+
+from django.template.base import TextNode, Variable, VariableNode
+from django.utils.safestring import SafeString
+
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
 
-__all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
+__all__ = [
+    "render_from_string",
+    "parse",
+    "sandbox_backend",
+    "openforms_backend",
+    "get_cache_info",
+    "clear_cache",
+    "get_variable_lookups",
+]
+
+TEMPLATE_CACHE_SIZE = 2048
+"""
+Maximum number of compiled templates kept in the (per-process) LRU cache.
+"""
+
+TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse(source: str, backend):
+    return backend.from_string(source)
 
 
 def parse(source: str, backend=sandbox_backend):
     """
     Parse the template fragment using the specified backend.
 
+    Compiled templates are cached per backend and source, so parsing the same
+    fragment again is cheap.
+
     :returns: A template instance of the specified backend
     :raises: :class:`django.template.TemplateSyntaxError` if there are any
       syntax errors
     """
-    return backend.from_string(source)
+    return _parse(source, backend)
+
+
+def get_cache_info():
+    """
+    Report the hits, misses and size of the compiled templates cache.
+
+    :returns: a named tuple with ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+    """
+    return _parse.cache_info()
+
+
+def clear_cache() -> None:
+    """
+    Empty the compiled templates cache and reset its counters.
+    """
+    _parse.cache_clear()
+
+
+def _is_plain_text(source: str) -> bool:
+    return not any(marker in source for marker in TEMPLATE_MARKERS)
+
+
+def get_variable_lookups(source: str, backend=sandbox_backend) -> set[str] | None:
+    """
+    Determine the context variables referenced by a template fragment.
+
+    Only templates consisting of text and variable nodes (with optional filters) can
+    be analyzed - any template tag makes the references impossible to determine.
+
+    :returns: The (dotted) variable lookups, e.g. ``{"address.postcode"}``, or
+      ``None`` if they cannot be determined.
+    :raises: :class:`django.template.TemplateSyntaxError` if the template source is
+      invalid
+    """
+    if _is_plain_text(source):
+        return set()
+
+    lookups = set()
+    template = parse(source, backend=backend)
+    for node in template.template.nodelist:
+        if isinstance(node, TextNode):
+            continue
+        if not isinstance(node, VariableNode):
+            return None
+
+        filter_expression = node.filter_expression
+        variables = [filter_expression.var] + [
+            arg
+            for _, args in filter_expression.filters
+            for is_lookup, arg in args
+            if is_lookup
+        ]
+        for variable in variables:
+            if isinstance(variable, Variable) and variable.lookups:
+                lookups.add(".".join(variable.lookups))
+    return lookups
 
 
 def render_from_string(
@@ -46,6 +131,10 @@ def render_from_string(
     :raises: :class:`django.template.TemplateSyntaxError` if the template source is
       invalid
     """
+    # nothing to evaluate - skip the template engine entirely
+    if _is_plain_text(source):
+        return SafeString(source)
+
     if disable_autoescape:
         source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
     template = parse(source, backend=backend)
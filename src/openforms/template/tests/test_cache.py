@@ -0,0 +1,63 @@
+from django.template import TemplateSyntaxError
+from django.test import SimpleTestCase
+
+from .. import (
+    clear_cache,
+    get_cache_info,
+    openforms_backend,
+    parse,
+    render_from_string,
+    sandbox_backend,
+)
+
+
+class TemplateCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_cache()
+        self.addCleanup(clear_cache)
+
+    def test_repeated_parse_is_cached(self):
+        template1 = parse("{{ foo }}")
+        template2 = parse("{{ foo }}")
+
+        self.assertIs(template1, template2)
+        cache_info = get_cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 1)
+
+    def test_cache_is_keyed_by_backend(self):
+        template1 = parse("{{ foo }}", backend=sandbox_backend)
+        template2 = parse("{{ foo }}", backend=openforms_backend)
+
+        self.assertIsNot(template1, template2)
+        self.assertEqual(get_cache_info().misses, 2)
+
+    def test_cached_template_renders_with_new_context(self):
+        result1 = render_from_string("{{ foo }}", {"foo": "bar"})
+        result2 = render_from_string("{{ foo }}", {"foo": "baz"})
+
+        self.assertEqual(result1, "bar")
+        self.assertEqual(result2, "baz")
+        self.assertEqual(get_cache_info().hits, 1)
+
+    def test_syntax_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(TemplateSyntaxError):
+                parse("{% invalid %}")
+
+        self.assertEqual(get_cache_info().currsize, 0)
+
+    def test_plain_text_skips_template_engine(self):
+        result = render_from_string("<b>plain</b> text", {"foo": "bar"})
+
+        self.assertEqual(result, "<b>plain</b> text")
+        cache_info = get_cache_info()
+        self.assertEqual(cache_info.hits, 0)
+        self.assertEqual(cache_info.misses, 0)
+
+    def test_comments_are_not_plain_text(self):
+        result = render_from_string("foo{# a comment #}", {})
+
+        self.assertEqual(result, "foo")
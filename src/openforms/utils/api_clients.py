@@ -1,9 +1,19 @@
-from typing import Generic, Iterator, TypeVar
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Generic, Iterator, TypeVar
+
+from django.conf import settings
 
 from ape_pie import APIClient
+from requests.adapters import HTTPAdapter
 from typing_extensions import TypedDict  # py3.11 import from typing
+from zgw_consumers.client import build_client
+from zgw_consumers.models import Service
+from zgw_consumers.nlx import NLXClient
 
 T = TypeVar("T")
+ClientT = TypeVar("ClientT", bound=APIClient)
 
 
 class PaginatedResponseData(TypedDict, Generic[T]):
@@ -33,3 +43,139 @@ def pagination_helper(
             yield from _iter(data)
 
     return _iter(paginated_data)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter shared by the clients of a service.
+
+    Closing a client (e.g. when leaving its context manager) closes all of its
+    adapters. The connections of a pooled adapter must outlive the client, so they
+    are only closed when the adapter is evicted from the pool.
+    """
+
+    def close(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
+
+
+class PoolStats(TypedDict):
+    created: int
+    reused: int
+    evicted: int
+    services: dict[int, dict[str, Any]]
+
+
+@dataclass
+class _PoolEntry:
+    adapter: PooledHTTPAdapter
+    last_used: float = field(default_factory=time.monotonic)
+    reused: int = 0
+
+
+class ClientPool:
+    """
+    Per-process pool of keep-alive connections to the configured services.
+
+    Each :class:`zgw_consumers.models.Service` gets its own HTTP adapter, which is
+    mounted on every client built for that service. Adapters that have not been used
+    for ``idle_timeout`` seconds are evicted, closing their connections.
+    """
+
+    def __init__(self, maxsize: int | None = None, idle_timeout: int | None = None):
+        self._maxsize = maxsize
+        self._idle_timeout = idle_timeout
+        self._entries: dict[int, _PoolEntry] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+        self._evicted = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.HTTP_CLIENT_POOL_MAXSIZE
+
+    @property
+    def idle_timeout(self) -> int:
+        if self._idle_timeout is not None:
+            return self._idle_timeout
+        return settings.HTTP_CLIENT_POOL_IDLE_TIMEOUT
+
+    def get_adapter(self, service: Service) -> PooledHTTPAdapter:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(service.pk)
+            if entry is None:
+                adapter = PooledHTTPAdapter(pool_maxsize=self.maxsize)
+                entry = self._entries[service.pk] = _PoolEntry(adapter=adapter)
+                self._created += 1
+            else:
+                entry.reused += 1
+                self._reused += 1
+            entry.last_used = now
+            return entry.adapter
+
+    def _evict_idle(self, now: float) -> None:
+        idle = [
+            key
+            for key, entry in self._entries.items()
+            if now - entry.last_used > self.idle_timeout
+        ]
+        for key in idle:
+            self._entries.pop(key).adapter.shutdown()
+            self._evicted += 1
+
+    def evict_idle(self) -> None:
+        with self._lock:
+            self._evict_idle(time.monotonic())
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                entry.adapter.shutdown()
+            self._entries.clear()
+            self._created = self._reused = self._evicted = 0
+
+    def get_stats(self) -> PoolStats:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "created": self._created,
+                "reused": self._reused,
+                "evicted": self._evicted,
+                "services": {
+                    key: {
+                        "reused": entry.reused,
+                        "idle_seconds": now - entry.last_used,
+                        "hosts": len(entry.adapter.poolmanager.pools),
+                    }
+                    for key, entry in self._entries.items()
+                },
+            }
+
+
+client_pool = ClientPool()
+
+
+def build_pooled_client(
+    service: Service, client_factory: type[ClientT] = NLXClient, **kwargs
+) -> ClientT:
+    """
+    Build a client for a service, re-using the open connections to that service.
+
+    Drop-in replacement for :func:`zgw_consumers.client.build_client`.
+    """
+    client = build_client(service, client_factory=client_factory, **kwargs)
+    # unsaved services can't be reliably identified
+    if service.pk is None:
+        return client
+
+    adapter = client_pool.get_adapter(service)
+    client.mount("https://", adapter)
+    client.mount("http://", adapter)
+    return client
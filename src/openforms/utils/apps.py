@@ -5,6 +5,17 @@ from django_sendfile.utils import _get_sendfile
 
 from openforms.setup import mute_deprecation_warnings
 
+# the process-wide PDF renderer depends on these settings
+PDF_RENDERER_SETTINGS = {
+    "BASE_URL",
+    "MEDIA_ROOT",
+    "MEDIA_URL",
+    "STATIC_URL",
+    "STATIC_ROOT",
+    "STORAGES",
+    "PDF_RENDERER_MAX_DOCUMENTS",
+}
+
 
 class UtilsConfig(AppConfig):
     name = "openforms.utils"
@@ -23,6 +34,11 @@ class UtilsConfig(AppConfig):
 
 
 def clear_lru_cache_on_settings_changed(setting, **kwargs):
+    if setting in PDF_RENDERER_SETTINGS:
+        from .pdf import _get_renderer
+
+        _get_renderer.cache_clear()
+
     if setting != "SENDFILE_BACKEND":
         return
     _get_sendfile.cache_clear()
@@ -0,0 +1,131 @@
+"""
+Compile JsonLogic expressions into reusable Python callables.
+
+:func:`json_logic.jsonLogic` walks the raw expression on every evaluation - it
+destructures every node, looks up the operator and splits ``var`` paths each time.
+Compiling an expression does this work once, producing a closure that only performs
+the actual operations when called with the data.
+
+The compiled expressions mirror the semantics of :func:`json_logic.jsonLogic`
+exactly, including the eager evaluation of all operator arguments and the handling
+of empty operands.
+"""
+
+from typing import Any, Callable, Sequence
+
+from json_logic import (
+    empty_operand_values_for_operators,
+    get_var,
+    jsonLogic,
+    missing,
+    missing_some,
+    operations,
+    scoped_operations,
+)
+from json_logic.meta.expressions import destructure
+from json_logic.typing import JSON
+
+__all__ = ["CompiledExpression", "compile_expression"]
+
+CompiledExpression = Callable[[Any], JSON]
+
+_CompiledNode = Callable[[Any], Any]
+
+
+def compile_expression(expression: JSON) -> CompiledExpression:
+    """
+    Compile a JsonLogic expression into a callable taking the data as sole argument.
+
+    Calling the result is equivalent to calling ``jsonLogic(expression, data)``.
+    Expressions that cannot be compiled (e.g. because they are malformed) fall back
+    to the interpreter, so that any errors are raised at evaluation time like before.
+    """
+    try:
+        node = _compile(expression)
+    except Exception:
+        return lambda data=None: jsonLogic(expression, data)
+
+    # the interpreter substitutes falsy data with an empty mapping at every level
+    return lambda data=None: node(data or {})
+
+
+def _constant(value: Any) -> _CompiledNode:
+    return lambda data: value
+
+
+def _compile(expression: JSON) -> _CompiledNode:
+    if isinstance(expression, list):
+        items = [_compile(item) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # primitives evaluate to themselves
+    if expression is None or not isinstance(expression, dict):
+        return _constant(expression)
+
+    operator, values = destructure(expression)
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+
+    if operator in scoped_operations:
+        scoped_operation = scoped_operations[operator]
+        return lambda data: scoped_operation(data, *values)
+
+    arguments = [_compile(value) for value in values]
+
+    match operator:
+        case "var":
+            return _compile_var(values, arguments)
+        case "missing":
+            return lambda data: missing(data, *[arg(data) for arg in arguments])
+        case "missing_some":
+            return lambda data: missing_some(data, *[arg(data) for arg in arguments])
+
+    if operator not in operations:
+        raise ValueError("Unrecognized operation %s" % operator)
+
+    operation = operations[operator]
+    empty_values = empty_operand_values_for_operators.get(operator)
+    if not empty_values:
+        return lambda data: operation(*[arg(data) for arg in arguments])
+
+    def _evaluate(data):
+        evaluated = [arg(data) for arg in arguments]
+        if any([value in empty_values for value in evaluated]):
+            return None
+        return operation(*evaluated)
+
+    return _evaluate
+
+
+def _is_literal(value: JSON) -> bool:
+    return not isinstance(value, (dict, list))
+
+
+def _compile_var(
+    values: Sequence[JSON], arguments: Sequence[_CompiledNode]
+) -> _CompiledNode:
+    # computed variable names or defaults can only be resolved at evaluation time
+    if not values or not all(_is_literal(value) for value in values):
+        return lambda data: get_var(data, *[arg(data) for arg in arguments])
+
+    var_name, *rest = values
+    if var_name == "" or var_name is None or len(rest) > 1:
+        return lambda data: get_var(data, *values)
+
+    not_found = rest[0] if rest else None
+    path = str(var_name).split(".")
+
+    def _get_var(data):
+        try:
+            for key in path:
+                try:
+                    data = data[key]
+                except TypeError:
+                    data = data[int(key)]
+        except (KeyError, TypeError, ValueError, IndexError):
+            return not_found
+        if data is None and not_found is not None:
+            return not_found
+        return data
+
+    return _get_var
@@ -1,5 +1,6 @@
 import logging
 import mimetypes
+from functools import lru_cache
 from io import BytesIO
 from pathlib import PurePosixPath
 from urllib.parse import ParseResult, urljoin, urlparse
@@ -16,9 +17,13 @@ logger = logging.getLogger(__name__)
 class UrlFetcher:
     """
     URL fetcher that skips the network for /static/* files.
+
+    The content of the static files is kept in memory, as they don't change while the
+    application is running (unless ``DEBUG`` is enabled).
     """
 
     def __init__(self):
+        self._static_files: dict[str, bytes] = {}
         self.static_url = self._get_fully_qualified_url(settings.STATIC_URL)
         is_static_local_storage = issubclass(
             staticfiles_storage.__class__, FileSystemStorage
@@ -71,11 +76,22 @@ class UrlFetcher:
                 redirected_url=orig_url,
                 filename=path.parts[-1],
             )
-            with open(absolute_path, "rb") as f:
-                result["file_obj"] = BytesIO(f.read())
+            result["file_obj"] = BytesIO(
+                self._read(absolute_path, cache=storage is staticfiles_storage)
+            )
             return result
         return weasyprint.default_url_fetcher(orig_url)
 
+    def _read(self, absolute_path: str, cache: bool) -> bytes:
+        if not cache or settings.DEBUG:
+            with open(absolute_path, "rb") as f:
+                return f.read()
+
+        if (content := self._static_files.get(absolute_path)) is None:
+            with open(absolute_path, "rb") as f:
+                content = self._static_files[absolute_path] = f.read()
+        return content
+
     def get_match_candidate(
         self, url: ParseResult
     ) -> tuple[ParseResult, FileSystemStorage] | None:
@@ -94,17 +110,70 @@ class UrlFetcher:
         return None
 
 
-def render_to_pdf(template_name: str, context: dict) -> tuple[str, bytes]:
+class PDFRenderer:
     """
-    Render a (HTML) template to PDF with the given context.
+    Render HTML documents to PDF, re-using the WeasyPrint state across documents.
+
+    Setting up the font configuration (which scans all the fonts installed on the
+    system), loading the static assets and decoding the images is expensive compared
+    to the layout of a typical document. A renderer keeps these around, and is
+    recycled after ``max_documents`` documents to put a bound on the memory usage.
+    """
+
+    def __init__(self, max_documents: int):
+        from weasyprint.text.fonts import FontConfiguration  # heavy import
+
+        self.max_documents = max_documents
+        self.num_documents = 0
+        self.url_fetcher = UrlFetcher()
+        self.font_config = FontConfiguration()
+        self.image_cache: dict = {}
+
+    @property
+    def exhausted(self) -> bool:
+        return bool(self.max_documents) and self.num_documents >= self.max_documents
+
+    def render(self, html: str) -> bytes:
+        import weasyprint  # heavy import
+
+        html_object = weasyprint.HTML(
+            string=html,
+            url_fetcher=self.url_fetcher,
+            base_url=settings.BASE_URL,
+        )
+        pdf: bytes = html_object.write_pdf(
+            font_config=self.font_config,
+            cache=self.image_cache,
+        )
+        self.num_documents += 1
+        return pdf
+
+
+@lru_cache(maxsize=1)
+def _get_renderer() -> PDFRenderer:
+    return PDFRenderer(max_documents=settings.PDF_RENDERER_MAX_DOCUMENTS)
+
+
+def get_renderer() -> PDFRenderer:
+    """
+    Get the PDF renderer of the current process.
     """
-    import weasyprint  # heavy import
+    if _get_renderer().exhausted:
+        _get_renderer.cache_clear()
+    return _get_renderer()
 
+
+def render_to_pdf(
+    template_name: str, context: dict, renderer: PDFRenderer | None = None
+) -> tuple[str, bytes]:
+    """
+    Render a (HTML) template to PDF with the given context.
+
+    :arg renderer: The renderer to use, defaults to the (warm) renderer of the current
+      process.
+    """
+    if renderer is None:
+        renderer = get_renderer()
     rendered_html = render_to_string(template_name, context=context)
-    html_object = weasyprint.HTML(
-        string=rendered_html,
-        url_fetcher=UrlFetcher(),
-        base_url=settings.BASE_URL,
-    )
-    pdf: bytes = html_object.write_pdf()
+    pdf = renderer.render(rendered_html)
     return rendered_html, pdf
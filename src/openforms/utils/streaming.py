@@ -0,0 +1,89 @@
+"""
+Utilities to send (large) file content in request bodies without loading it in memory.
+"""
+
+import os
+from base64 import b64encode
+from typing import BinaryIO, Iterable, Iterator
+
+from django.core.files import File
+
+# content up to this size can be sent in memory, above it streaming is worth it
+STREAMING_THRESHOLD = 1024 * 1024  # 1 MiB
+# a multiple of 3, so that the base64-encoded chunks can be concatenated
+CHUNK_SIZE = 3 * 64 * 1024
+
+
+class StreamingBody:
+    """
+    File-like request body, reading the parts one after another.
+
+    The length must be known up front, so that the request is not sent with chunked
+    transfer encoding (which not all API's support).
+    """
+
+    def __init__(self, parts: Iterable[bytes], length: int):
+        self._parts = iter(parts)
+        self._buffer = bytearray()
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._parts)
+            except StopIteration:
+                break
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+def get_size(content: File | BinaryIO) -> int | None:
+    """
+    Determine the size of the content from the current position, if possible.
+    """
+    if hasattr(content, "size"):
+        return content.size
+    if not content.seekable():
+        return None
+    position = content.tell()
+    size = content.seek(0, os.SEEK_END) - position
+    content.seek(position)
+    return size
+
+
+def iter_chunks(content: BinaryIO, size: int) -> Iterator[bytes]:
+    """
+    Read ``size`` bytes from ``content``, in chunks of (at most) :data:`CHUNK_SIZE`.
+    """
+    while size > 0:
+        chunk = content.read(min(CHUNK_SIZE, size))
+        if not chunk:
+            raise ValueError("The content is smaller than its reported size.")
+        size -= len(chunk)
+        yield chunk
+
+
+def iter_base64(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Base64-encode the chunks, producing the same output as encoding them at once.
+    """
+    remainder = b""
+    for chunk in chunks:
+        data = remainder + chunk
+        # only encode complete groups of 3 bytes, so that no padding is added
+        cutoff = len(data) - len(data) % 3
+        data, remainder = data[:cutoff], data[cutoff:]
+        if data:
+            yield b64encode(data)
+    if remainder:
+        yield b64encode(remainder)
+
+
+def get_base64_length(size: int) -> int:
+    return 4 * ((size + 2) // 3)
@@ -1,9 +1,11 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 import requests_mock
 from ape_pie import APIClient
+from zgw_consumers.models import Service
 
-from ..api_clients import pagination_helper
+from ..api_clients import ClientPool, build_pooled_client, pagination_helper
 
 
 class PaginationTests(TestCase):
@@ -57,3 +59,63 @@ class PaginationTests(TestCase):
 
         self.assertEqual(len(m.request_history), 2)
         self.assertEqual(all_results, [0, 1, 2])
+
+
+class ClientPoolTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.pool = ClientPool(maxsize=2, idle_timeout=60)
+        self.addCleanup(self.pool.clear)
+
+    def test_adapter_reused_per_service(self):
+        service1, service2 = Service(pk=1), Service(pk=2)
+
+        adapter1 = self.pool.get_adapter(service1)
+        adapter2 = self.pool.get_adapter(service1)
+        adapter3 = self.pool.get_adapter(service2)
+
+        self.assertIs(adapter1, adapter2)
+        self.assertIsNot(adapter1, adapter3)
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["reused"], 1)
+        self.assertEqual(set(stats["services"]), {1, 2})
+
+    def test_closing_client_keeps_connections(self):
+        adapter = self.pool.get_adapter(Service(pk=1))
+        client = APIClient("https://example.com")
+        client.mount("https://", adapter)
+
+        with patch.object(adapter.poolmanager, "clear") as mock_clear:
+            with client:
+                pass
+
+        mock_clear.assert_not_called()
+
+    def test_idle_adapters_evicted(self):
+        adapter = self.pool.get_adapter(Service(pk=1))
+
+        with (
+            patch("openforms.utils.api_clients.time.monotonic", return_value=1e9),
+            patch.object(adapter.poolmanager, "clear") as mock_clear,
+        ):
+            new_adapter = self.pool.get_adapter(Service(pk=1))
+
+        self.assertIsNot(adapter, new_adapter)
+        mock_clear.assert_called_once()
+        self.assertEqual(self.pool.get_stats()["evicted"], 1)
+
+    @requests_mock.Mocker()
+    def test_build_pooled_client(self, m):
+        m.get("https://example.com/api/", json={"ok": True})
+        service = Service(pk=1, api_root="https://example.com/api/")
+
+        with patch("openforms.utils.api_clients.client_pool", self.pool):
+            client = build_pooled_client(service)
+
+        with client:
+            response = client.get("")
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertIs(client.adapters["https://"], self.pool._entries[1].adapter)
@@ -0,0 +1,107 @@
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+
+from json_logic import jsonLogic
+
+from openforms.tests.utils import can_connect
+
+from ..json_logic.compiler import compile_expression
+from .test_json_logic import _load_shared_tests
+
+LOGIC_FIXTURES = (
+    ({"var": "a.b"}, {"a": {"b": 1}}),
+    ({"var": ["missing", "default"]}, {}),
+    ({"var": ["present", "default"]}, {"present": None}),
+    ({"var": "items.1"}, {"items": ["first", "second"]}),
+    ({"var": ""}, {"a": 1}),
+    ({"var": {"cat": ["fo", "o"]}}, {"foo": "bar"}),
+    ({"==": [{"var": "number"}, "1"]}, {"number": 1}),
+    ({"+": [{"var": "missing"}, 1]}, {}),
+    ({"and": [{"var": "a"}, {"!": [{"var": "b"}]}]}, {"a": True, "b": False}),
+    ({"if": [{"var": "a"}, "yes", {"var": "b"}, "maybe", "no"]}, {"b": 1}),
+    ({"missing": ["a", "b"]}, {"a": 1}),
+    ({"missing_some": [1, ["a", "b"]]}, {"b": 1}),
+    (
+        {
+            "reduce": [
+                {"var": "items"},
+                {"+": [{"var": "accumulator"}, {"var": "current.price"}]},
+                0,
+            ]
+        },
+        {"items": [{"price": 1}, {"price": 2}]},
+    ),
+    ({"map": [{"var": "items"}, {"*": [{"var": ""}, 2]}]}, {"items": [1, 2]}),
+    ({"in": [{"var": "a"}, ["foo", "bar"]]}, {"a": "bar"}),
+    ({"date": {"var": "date"}}, {"date": "2023-01-03"}),
+    ({"-": [{"today": []}, {"rdelta": [1]}]}, None),
+    ([1, {"var": "a"}], {"a": 2}),
+    ("primitive", {}),
+    (
+        {
+            "and": [
+                {">": [{"var": "nested.value"}, 1]},
+                {"==": [{"var": "text"}, "foo"]},
+                {"<": [{"+": [{"var": "a"}, {"var": "b"}]}, 100]},
+            ]
+        },
+        {"nested": {"value": 3}, "text": "foo", "a": 1, "b": 2},
+    ),
+)
+
+
+def _evaluate(func):
+    try:
+        return ("result", func())
+    except Exception as exc:
+        return ("error", type(exc))
+
+
+class CompiledExpressionTests(SimpleTestCase):
+    def test_same_result_as_interpreter(self):
+        for expression, data in LOGIC_FIXTURES:
+            with self.subTest(expression=expression, data=data):
+                compiled = compile_expression(expression)
+
+                result = _evaluate(lambda: compiled(data))
+
+                self.assertEqual(result, _evaluate(lambda: jsonLogic(expression, data)))
+
+    def test_errors_raised_at_evaluation_time(self):
+        expressions = (
+            {"unknown-operator": [1]},
+            {"==": [1, 1], "!=": [1, 2]},
+            {"/": [1, 0]},
+            # the interpreter does not short-circuit
+            {"and": [False, {"/": [1, 0]}]},
+        )
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                compiled = compile_expression(expression)
+
+                result = _evaluate(lambda: compiled({}))
+
+                self.assertEqual(result[0], "error")
+                self.assertEqual(result, _evaluate(lambda: jsonLogic(expression, {})))
+
+    def test_compiled_expression_is_reusable(self):
+        compiled = compile_expression({"var": "a"})
+
+        self.assertEqual(compiled({"a": 1}), 1)
+        self.assertEqual(compiled({"a": 2}), 2)
+        self.assertIsNone(compiled())
+
+    @skipIf(
+        not can_connect("jsonlogic.com:443"),
+        "Shared tests download requires internet connection",
+    )
+    def test_shared_logic(self):
+        for expression, data, _ in _load_shared_tests():
+            with self.subTest(shared_rule=expression, data=data):
+                compiled = compile_expression(expression)
+
+                result = _evaluate(lambda: compiled(data))
+
+                self.assertEqual(result, _evaluate(lambda: jsonLogic(expression, data)))
@@ -0,0 +1,53 @@
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+
+from ..pdf import UrlFetcher, get_renderer
+
+
+class UrlFetcherTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.static_root = Path(tempdir.name)
+
+    def test_static_files_kept_in_memory(self):
+        stylesheet = self.static_root / "style.css"
+        stylesheet.write_text("body {color: red;}")
+
+        with override_settings(
+            STATIC_ROOT=str(self.static_root),
+            STATIC_URL="/static/",
+            BASE_URL="http://testserver",
+            DEBUG=False,
+        ):
+            url_fetcher = UrlFetcher()
+            result1 = url_fetcher("http://testserver/static/style.css")
+            stylesheet.write_text("body {color: blue;}")
+            result2 = url_fetcher("http://testserver/static/style.css")
+
+        self.assertEqual(result1["file_obj"].read(), b"body {color: red;}")
+        self.assertEqual(result2["file_obj"].read(), b"body {color: red;}")
+        self.assertEqual(result2["mime_type"], "text/css")
+
+
+class PDFRendererTests(SimpleTestCase):
+    @override_settings(PDF_RENDERER_MAX_DOCUMENTS=2)
+    def test_renderer_reused_until_exhausted(self):
+        renderer = get_renderer()
+
+        renderer.render("<p>First</p>")
+        self.assertIs(get_renderer(), renderer)
+
+        pdf = renderer.render("<p>Second</p>")
+        self.assertTrue(pdf.startswith(b"%PDF"))
+        self.assertIsNot(get_renderer(), renderer)
+
+    def test_renderer_discarded_on_settings_change(self):
+        renderer = get_renderer()
+
+        with override_settings(BASE_URL="http://other.example.com"):
+            self.assertIsNot(get_renderer(), renderer)
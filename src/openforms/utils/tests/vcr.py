@@ -60,6 +60,8 @@ from pathlib import Path
 
 from vcr.unittest import VCRMixin
 
+from openforms.utils.api_clients import client_pool
+
 RECORD_MODE = os.environ.get("VCR_RECORD_MODE", "none")
 
 
@@ -75,6 +77,13 @@ class OFVCRMixin(VCRMixin):
     A :class:`pathlib.Path` instance where the cassettes should be stored.
     """
 
+    def setUp(self):
+        # pooled connections are created by the cassette (stubs) and must not be
+        # re-used outside of it
+        client_pool.clear()
+        self.addCleanup(client_pool.clear)
+        super().setUp()
+
     def _get_cassette_library_dir(self):
         assert (
             self.VCR_TEST_FILES
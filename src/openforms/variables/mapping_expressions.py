@@ -0,0 +1,29 @@
+"""
+Compilation of the jq programs used to transform service fetch responses.
+
+The mapping expressions are part of the (rarely changing) service fetch
+configuration, while they are applied on every service fetch. Compiling a jq program
+is relatively expensive, so the compiled programs are cached per process.
+"""
+
+from functools import lru_cache
+
+import jq
+
+JQ_PROGRAM_CACHE_SIZE = 512
+"""
+Maximum number of compiled jq programs kept in the (per-process) LRU cache.
+"""
+
+
+@lru_cache(maxsize=JQ_PROGRAM_CACHE_SIZE)
+def compile_jq_expression(expression: str) -> "jq._Program":
+    """
+    Compile the jq filter ``expression``, re-using an earlier compilation result.
+
+    The compiled program can be applied to different inputs, e.g.
+    ``compile_jq_expression(".foo").input(data).first()``.
+
+    :raises: :class:`ValueError` if the expression cannot be compiled.
+    """
+    return jq.compile(expression)
@@ -1,12 +1,16 @@
+from contextlib import suppress
+
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.template import TemplateSyntaxError
 from django.utils.translation import gettext_lazy as _
 
 from openforms.formio.service import recursive_apply
-from openforms.template import render_from_string, sandbox_backend
+from openforms.template import get_variable_lookups, render_from_string, sandbox_backend
 from openforms.typing import DataMapping
 
 from .constants import DataMappingTypes, ServiceFetchMethods
+from .mapping_expressions import compile_jq_expression
 from .validators import (
     HeaderValidator,
     QueryParameterValidator,
@@ -107,6 +111,41 @@ class ServiceFetchConfiguration(models.Model):
         if errors:
             raise ValidationError(errors)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # compile the jq program up front rather than during the first service fetch.
+        # Invalid expressions are reported by the validators.
+        if self.data_mapping_type == DataMappingTypes.jq and isinstance(
+            self.mapping_expression, str
+        ):
+            with suppress(ValueError):
+                compile_jq_expression(self.mapping_expression)
+
+    def get_input_variables(self) -> set[str] | None:
+        """
+        Return the (dotted) variable keys used to build the request.
+
+        :returns: The variable keys referenced in the path, query string and headers
+          templates, or ``None`` if these cannot be determined.
+        """
+        query_param_values = [
+            value
+            for values in (self.query_params or {}).values()
+            for value in (values if isinstance(values, list) else (values,))
+        ]
+        sources = [self.path, *(self.headers or {}).values(), *query_param_values]
+
+        variables = set()
+        for source in sources:
+            try:
+                lookups = get_variable_lookups(source, backend=sandbox_backend)
+            except TemplateSyntaxError:
+                return None
+            if lookups is None:
+                return None
+            variables |= lookups
+        return variables
+
     def request_arguments(self, context: DataMapping) -> dict:
         """Return a dictionary with keyword arguments for a
         zgw_consumers.Service client request call.
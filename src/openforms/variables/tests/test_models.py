@@ -1,8 +1,14 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
+
+import jq
 
 from ..constants import DataMappingTypes, ServiceFetchMethods
+from ..mapping_expressions import compile_jq_expression
 from ..models import ServiceFetchConfiguration
+from .factories import ServiceFetchConfigurationFactory
 
 
 class ServiceFetchConfigurationTests(SimpleTestCase):
@@ -105,3 +111,57 @@ class ServiceFetchConfigurationTests(SimpleTestCase):
 
         with self.assertRaisesMessage(ValidationError, "X-invalid-field-content"):
             invalid_headers.full_clean(exclude={"service"})
+
+    def test_input_variables(self):
+        config = ServiceFetchConfiguration(
+            path="persons/{{ bsn }}",
+            headers={"X-Street": "{{ address.street|default:fallback }}"},
+            query_params={"zip": ["{{ postcode }}", "static"], "q": "{{ 'literal' }}"},
+        )
+
+        self.assertEqual(
+            config.get_input_variables(),
+            {"bsn", "address.street", "fallback", "postcode"},
+        )
+
+    def test_input_variables_with_template_tags(self):
+        config = ServiceFetchConfiguration(path="{% if bsn %}{{ bsn }}{% endif %}")
+
+        self.assertIsNone(config.get_input_variables())
+
+
+class JQProgramCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        compile_jq_expression.cache_clear()
+        self.addCleanup(compile_jq_expression.cache_clear)
+
+    def test_program_compiled_once(self):
+        config = ServiceFetchConfiguration(
+            data_mapping_type=DataMappingTypes.jq,
+            mapping_expression=".foo",
+        )
+
+        with patch(
+            "openforms.variables.mapping_expressions.jq.compile", wraps=jq.compile
+        ) as mock_compile:
+            config.clean()
+            program = compile_jq_expression(".foo")
+
+        mock_compile.assert_called_once_with(".foo")
+        self.assertEqual(program.input({"foo": "bar"}).first(), "bar")
+
+    def test_program_compiled_on_save(self):
+        ServiceFetchConfigurationFactory.create(
+            data_mapping_type=DataMappingTypes.jq,
+            mapping_expression=".foo",
+        )
+
+        self.assertEqual(compile_jq_expression.cache_info().currsize, 1)
+
+    def test_invalid_expression_not_cached(self):
+        with self.assertRaises(ValueError):
+            compile_jq_expression("asdf")
+
+        self.assertEqual(compile_jq_expression.cache_info().currsize, 0)
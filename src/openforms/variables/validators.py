@@ -6,13 +6,13 @@ from django.core.exceptions import SuspiciousOperation, ValidationError
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
-import jq
 from rest_framework.validators import ValidationError as DRFValidationError
 
 from openforms.forms.api.validators import JsonLogicValidator
 from openforms.typing import JSONValue
 
 from .constants import DataMappingTypes, ServiceFetchMethods
+from .mapping_expressions import compile_jq_expression
 
 if TYPE_CHECKING:
     from .models import ServiceFetchConfiguration
@@ -226,7 +226,7 @@ def validate_mapping_expression(configuration: "ServiceFetchConfiguration") -> N
             )
 
         try:
-            jq.compile(expression)
+            compile_jq_expression(expression)
         except ValueError as e:
             raise ValidationError(
                 {
@@ -1,10 +1,52 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+
+from django.conf import settings
+
 from ape_pie.client import APIClient as SessionBase, is_base_url
+from zeep.cache import SqliteCache
 from zeep.client import Client
 from zeep.transports import Transport
+from zeep.wsdl import Document
 
 from .models import SoapService
 from .session_factory import SessionFactory
 
+# number of parsed WSDL documents kept in memory per process
+WSDL_CACHE_SIZE = 32
+
+_wsdl_documents: OrderedDict[tuple[int, datetime, str], Document] = OrderedDict()
+_wsdl_documents_lock = threading.Lock()
+
+
+@lru_cache
+def _get_file_cache(path: str) -> SqliteCache:
+    return SqliteCache(path=path)
+
+
+def get_wsdl_document(service: SoapService, location: str, transport: Transport):
+    """
+    Load and parse the WSDL document, or take it from the cache of the process.
+
+    The cached document is discarded when the service configuration is modified.
+    Parsed documents can be shared by clients, as they only use the transport to
+    download the WSDL and the XSD's it refers to.
+    """
+    key = (service.pk, service.modified, location)
+    with _wsdl_documents_lock:
+        if (document := _wsdl_documents.get(key)) is not None:
+            _wsdl_documents.move_to_end(key)
+            return document
+
+    document = Document(location, transport)
+    with _wsdl_documents_lock:
+        _wsdl_documents[key] = document
+        if len(_wsdl_documents) > WSDL_CACHE_SIZE:
+            _wsdl_documents.popitem(last=False)
+    return document
+
 
 def build_client(
     service: SoapService,
@@ -19,17 +61,28 @@ def build_client(
     and configured on the session, which is then used as transport for the zeep client.
 
     Any additional kwargs are passed through to the :class:`zeep.Client` instantiation.
+
+    The parsed WSDL document of a (saved) service is re-used by the clients built in
+    the same process, see :func:`get_wsdl_document`.
     """
     session_factory = SessionFactory(service)
     session = SOAPSession.configure_from(session_factory)
+    transport_kwargs = {}
+    if settings.SOAP_WSDL_CACHE_PATH:
+        # persist the downloaded WSDL and XSD files, for restarted processes
+        transport_kwargs["cache"] = _get_file_cache(settings.SOAP_WSDL_CACHE_PATH)
     transport = transport_factory(
         session=session,
         timeout=service.timeout,
         # operation_timeout gets passed as a parameter on all requests, overriding any
         # monkeypatched requests.Session defaults
         operation_timeout=service.timeout,
+        **transport_kwargs,
     )
-    kwargs.setdefault("wsdl", service.url)
+    wsdl = kwargs.setdefault("wsdl", service.url)
+    # zeep settings affect the parsing, don't share those documents
+    if service.pk and isinstance(wsdl, str) and "settings" not in kwargs:
+        kwargs["wsdl"] = get_wsdl_document(service, wsdl, transport)
     client = client_factory(
         transport=transport,
         wsse=service.get_wsse(),
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.11 on 2026-10-18 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("soap", "0002_soapservice_timeout"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="soapservice",
+            name="modified",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                verbose_name="modified",
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -78,6 +78,8 @@ class SoapService(models.Model):
         related_name="soap_services_server",
     )
 
+    modified = models.DateTimeField(_("modified"), auto_now=True)
+
     class Meta:
         verbose_name = _("SOAP service")
         verbose_name_plural = _("SOAP services")
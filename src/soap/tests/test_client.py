@@ -3,6 +3,7 @@ Test the client factory from SOAPService configuration.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 from django.test import TestCase
 
@@ -11,12 +12,14 @@ from ape_pie import InvalidURLError
 from requests.exceptions import RequestException
 from simple_certmanager.test.factories import CertificateFactory
 from zeep.exceptions import XMLSyntaxError
+from zeep.wsdl import Document
 from zeep.wsse import Signature, UsernameToken
 
 from openforms.utils.tests.vcr import OFVCRMixin
 
 from ..client import SOAPSession, build_client
 from ..constants import EndpointSecurity
+from ..models import SoapService
 from ..session_factory import SessionFactory
 from .factories import SoapServiceFactory
 
@@ -257,3 +260,34 @@ class ClientTransportTimeoutTests(TestCase):
             except XMLSyntaxError:
                 # timeout time has passed and we're trying
                 self.fail("timeout not honoured by SOAP client")
+
+
+class WSDLCacheTests(TestCase):
+    def test_parsed_wsdl_shared_by_clients(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        with patch("soap.client.Document", wraps=Document) as mock_document:
+            client1 = build_client(service)
+            client2 = build_client(SoapService.objects.get(pk=service.pk))
+
+        mock_document.assert_called_once()
+        self.assertIs(client1.wsdl, client2.wsdl)
+        self.assertIsNot(client1.transport, client2.transport)
+
+    def test_wsdl_parsed_again_when_service_modified(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        client1 = build_client(service)
+
+        service.timeout = 5
+        service.save()
+        client2 = build_client(service)
+
+        self.assertIsNot(client1.wsdl, client2.wsdl)
+
+    def test_unsaved_service_not_cached(self):
+        service = SoapServiceFactory.build(url=WSDL_URI)
+
+        client1 = build_client(service)
+        client2 = build_client(service)
+
+        self.assertIsNot(client1.wsdl, client2.wsdl)
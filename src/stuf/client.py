@@ -14,7 +14,8 @@ subclass the base class and implement your domain specific logic in your own cla
 
 import logging
 import uuid
-from typing import Any, Literal, Protocol
+from itertools import chain
+from typing import Any, BinaryIO, Literal, Protocol
 
 from django.template import loader
 
@@ -22,6 +23,12 @@ from ape_pie import APIClient, InvalidURLError
 from ape_pie.client import is_base_url
 from requests.models import Response
 
+from openforms.utils.streaming import (
+    StreamingBody,
+    get_base64_length,
+    iter_base64,
+    iter_chunks,
+)
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
@@ -38,6 +45,43 @@ def noop_log(*args, **kwargs) -> None:
     pass
 
 
+class Base64Content:
+    """
+    File content to include base64-encoded in a templated request body.
+
+    The content itself is not rendered by the template engine - a placeholder is
+    rendered instead, which is replaced by the encoded content while the request body
+    is being sent. This way, large files are not loaded in memory.
+    """
+
+    def __init__(self, content: BinaryIO, size: int):
+        self.content = content
+        self.size = size
+        self.placeholder = f"base64-content-{uuid.uuid4()}"
+
+    def __str__(self):
+        return self.placeholder
+
+
+def build_streaming_body(body: str, contents: list[Base64Content]) -> StreamingBody:
+    """
+    Build the request body, replacing the placeholders with the encoded content.
+    """
+    parts = []
+    length = 0
+    for content in sorted(contents, key=lambda content: body.index(str(content))):
+        before, _, body = body.partition(str(content))
+        encoded_before = before.encode("utf-8")
+        parts += [
+            [encoded_before],
+            iter_base64(iter_chunks(content.content, content.size)),
+        ]
+        length += len(encoded_before) + get_base64_length(content.size)
+    encoded_after = body.encode("utf-8")
+    parts.append([encoded_after])
+    return StreamingBody(chain.from_iterable(parts), length=length + len(encoded_after))
+
+
 class BaseClient(APIClient):
     """
     A base client with :class:`requests.Session`'s interface.
@@ -155,7 +199,7 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | StreamingBody,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
@@ -163,7 +207,7 @@ class BaseClient(APIClient):
 
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
             headers={
@@ -210,6 +254,9 @@ class BaseClient(APIClient):
 
         The context is merged with the base context and the resolved template is
         rendered into a string, suitable to be passed down to :meth:`request`.
+
+        File content passed as :class:`Base64Content` context values is streamed into
+        the request body rather than rendered.
         """
         full_context = {**self.build_base_context(), **(context or {})}
         ref_nr = full_context["referentienummer"]
@@ -220,6 +267,10 @@ class BaseClient(APIClient):
             extra={"ref_nr": ref_nr, "sector_alias": self.sector_alias},
         )
         body = loader.render_to_string(template, full_context)
+        if contents := [
+            value for value in full_context.values() if isinstance(value, Base64Content)
+        ]:
+            body = build_streaming_body(body, contents)
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
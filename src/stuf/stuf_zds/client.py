@@ -18,8 +18,9 @@ from openforms.logging import logevent
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
+from openforms.utils.streaming import STREAMING_THRESHOLD, get_size
 
-from ..client import BaseClient
+from ..client import Base64Content, BaseClient
 from ..constants import EndpointType
 from ..models import StufService
 from ..service_client_factory import ServiceClientFactory, get_client_init_kwargs
@@ -296,7 +297,13 @@ class Client(BaseClient):
         doc_data: dict,
     ) -> None:
         document.content.seek(0)
-        base64_body = base64.b64encode(document.content.read()).decode()
+        size = get_size(document.content)
+        # large files are base64-encoded while the request is being sent
+        inhoud = (
+            Base64Content(document.content, size=size)
+            if size is not None and size > STREAMING_THRESHOLD
+            else base64.b64encode(document.content.read()).decode()
+        )
 
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
@@ -314,7 +321,7 @@ class Client(BaseClient):
             "document_identificatie": doc_id,
             "auteur": "open-forms",
             "taal": "nld",
-            "inhoud": base64_body,
+            "inhoud": inhoud,
             "status": "definitief",
             **doc_data,
         }
@@ -1,3 +1,5 @@
+from base64 import b64encode
+
 from django.test import tag
 
 import requests_mock
@@ -12,6 +14,7 @@ from openforms.submissions.tests.factories import (
     SubmissionFileAttachmentFactory,
     SubmissionReportFactory,
 )
+from openforms.utils.streaming import STREAMING_THRESHOLD, StreamingBody
 from soap.constants import SOAPVersion
 from stuf.tests.factories import StufServiceFactory
 
@@ -451,6 +454,38 @@ class StufZDSClientTests(StUFZDSTestBase):
             1,
         )
 
+    def test_create_zaak_attachment_large_file(self, m):
+        client = StufZDSClient(self.service, self.options)
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock("voegZaakdocumentToe.xml"),
+        )
+        content = b"a" * STREAMING_THRESHOLD + b"bc"
+        submission_attachment = SubmissionFileAttachmentFactory.create(
+            file_name="my-attachment.doc",
+            content_type="application/msword",
+            content__data=content,
+        )
+
+        client.create_zaak_attachment(
+            zaak_id="foo", doc_id="bar", submission_attachment=submission_attachment
+        )
+
+        request = m.last_request
+        # the content is streamed rather than rendered into the body
+        self.assertIsInstance(request.body, StreamingBody)
+        body = request.body.read()
+        self.assertEqual(len(body), int(request.headers["Content-Length"]))
+        xml_doc = etree.fromstring(body)
+        self.assertXPathEqualDict(
+            xml_doc,
+            {
+                "//zkn:object/zkn:identificatie": "bar",
+                "//zkn:object/zkn:inhoud": b64encode(content).decode(),
+                "//zkn:object/zkn:inhoud/@stuf:bestandsnaam": "my-attachment.doc",
+            },
+        )
+
     def test_client_wraps_network_error(self, m):
         client = StufZDSClient(self.service, self.options)
         m.post(self.service.soap_service.url, exc=RequestException)